@@ -1,6 +1,8 @@
 /**
  * NESMA Dashboard Shared Utilities v1.0
- * Theme Toggle, Export (PDF/Excel/CSV), Detail Modal, Chart Drill-down
+ * Theme Toggle, Export (PDF/Excel/CSV), Detail Modal, Chart Drill-down,
+ * Daily Range Totals, Pre-aggregated Cubes, Duration Sketches, Published Files,
+ * Data Modules, Record Shards, Columnar Records
  */
 
 // ============================================
@@ -688,6 +690,402 @@ var NesmaChartDrill = {
     }
 };
 
+// ============================================
+// DAILY RANGE TOTALS
+// ============================================
+var NesmaDaily = {
+    /**
+     * Offset of a date from the first day of a daily series
+     * @param {Object} series - {start, days, prefix, windows} as written by the sync
+     * @param {string|Date} date - 'YYYY-MM-DD' or Date
+     */
+    dayIndex: function(series, date) {
+        var day = typeof date === 'string' ? date.slice(0, 10) : date.toISOString().slice(0, 10);
+        return Math.round((Date.parse(day) - Date.parse(series.start)) / 86400000);
+    },
+
+    /**
+     * Total of a metric over the days from..to (inclusive) in O(1)
+     * @param {Object} series - daily series
+     * @param {string} metric - e.g. 'orders', 'amount', 'done', 'on_time'
+     * @param {string|Date} from - first day
+     * @param {string|Date} to - last day
+     */
+    sum: function(series, metric, from, to) {
+        var prefix = series && series.prefix && series.prefix[metric];
+        if (!prefix || !series.start) return 0;
+        var clamp = function(i) { return Math.min(Math.max(i, 0), prefix.length - 1); };
+        var lo = clamp(this.dayIndex(series, from));
+        var hi = clamp(this.dayIndex(series, to) + 1);
+        return hi > lo ? prefix[hi] - prefix[lo] : 0;
+    },
+
+    /**
+     * Total of a metric over the last N days, ending today
+     * @param {Object} series - daily series
+     * @param {string} metric - metric name
+     * @param {number} days - window length
+     */
+    lastDays: function(series, metric, days) {
+        var today = new Date();
+        var from = new Date(today.getTime() - (days - 1) * 86400000);
+        return this.sum(series, metric, from, today);
+    }
+};
+
+// ============================================
+// PRE-AGGREGATED CUBES
+// ============================================
+var NesmaCube = {
+    /**
+     * Sum the cells of a sparse cube that match the filters
+     * @param {Object} cube - {dimensions, labels, measures, cells} as written by the sync
+     * @param {Object} filters - {dimension: value or [values]}; empty values match everything
+     * @param {string} [groupBy] - dimension to break the totals down by
+     * @returns {Object} {count, <measure>: total}, or {label: totals} when grouped
+     */
+    sum: function(cube, filters, groupBy) {
+        if (!cube || !cube.cells) return {};
+        var width = cube.dimensions.length;
+        var wanted = [];
+        cube.dimensions.forEach(function(dim, d) {
+            var value = filters ? filters[dim] : null;
+            if (value == null || value === '' || (Array.isArray(value) && !value.length)) return;
+            var values = Array.isArray(value) ? value : [value];
+            var allowed = {};
+            cube.labels[d].forEach(function(label, i) {
+                if (values.indexOf(label) !== -1) allowed[i] = true;
+            });
+            wanted.push([d, allowed]);
+        });
+        var groupIndex = groupBy ? cube.dimensions.indexOf(groupBy) : -1;
+        var empty = function() {
+            var totals = {};
+            cube.measures.forEach(function(m) { totals[m] = 0; });
+            return totals;
+        };
+        var result = groupIndex === -1 ? empty() : {};
+
+        cube.cells.forEach(function(cell) {
+            for (var w = 0; w < wanted.length; w++) {
+                if (!wanted[w][1][cell[wanted[w][0]]]) return;
+            }
+            var totals = result;
+            if (groupIndex !== -1) {
+                var label = cube.labels[groupIndex][cell[groupIndex]];
+                totals = result[label] || (result[label] = empty());
+            }
+            cube.measures.forEach(function(m, i) { totals[m] += cell[width + i]; });
+        });
+        return result;
+    }
+};
+
+// ============================================
+// DURATION SKETCHES (percentiles over any span of months)
+// ============================================
+var NesmaSketches = {
+    /**
+     * Nearest-rank percentiles of the durations in months first..last
+     * @param {Object} sketches - duration_percentiles.sketches: {month: levels}, where
+     *     every value on level i stands for 2^i durations
+     * @param {string} first - first month, 'YYYY-MM' (inclusive)
+     * @param {string} last - last month, 'YYYY-MM' (inclusive)
+     * @param {number[]} [qs] - quantiles, default [0.5, 0.9, 0.99]
+     * @returns {Object} {count, values: [one per quantile, null when empty]}
+     */
+    span: function(sketches, first, last, qs) {
+        qs = qs || [0.5, 0.9, 0.99];
+        var items = [];
+        Object.keys(sketches || {}).forEach(function(month) {
+            if (month < first || month > last) return;
+            sketches[month].forEach(function(level, depth) {
+                level.forEach(function(value) { items.push([value, 1 << depth]); });
+            });
+        });
+        items.sort(function(a, b) { return a[0] - b[0] || a[1] - b[1]; });
+        var cumulative = [];
+        var total = 0;
+        items.forEach(function(item) { cumulative.push(total += item[1]); });
+        return {
+            count: total,
+            values: qs.map(function(q) {
+                if (!total) return null;
+                // Rounding first keeps products such as 0.7 * 10 from landing a rank too high
+                var rank = Math.min(Math.max(Math.ceil(+(q * total).toFixed(9)) - 1, 0), total - 1);
+                for (var i = 0; i < cumulative.length; i++) {
+                    if (cumulative[i] >= rank + 1) return items[i][0];
+                }
+                return items[items.length - 1][0];
+            })
+        };
+    }
+};
+
+// ============================================
+// PUBLISHED FILES
+// ============================================
+var NesmaFiles = {
+    manifestUrl: 'data/manifest.json',
+    _manifest: null,
+
+    /**
+     * Current content-hashed path of a published file, or the path itself
+     * when the site manifest does not list it
+     * @param {string} path - plain path from the site root, e.g. 'data/pr_data.json'
+     * @returns {Promise} resolves to the path to fetch
+     */
+    url: function(path) {
+        if (!this._manifest) {
+            // Only the manifest is revalidated; hashed files are cached as long as they live
+            this._manifest = fetch(this.manifestUrl, { cache: 'no-cache' }).then(function(response) {
+                return response.ok ? response.json() : {};
+            }).catch(function() {
+                return {};
+            });
+        }
+        return this._manifest.then(function(manifest) {
+            return (manifest.files && manifest.files[path]) || path;
+        });
+    },
+
+    /**
+     * fetch() a published file through the manifest, revalidating the plain
+     * path when the file is unlisted or its hashed copy is missing
+     * @param {string} path - plain path from the site root
+     * @returns {Promise<Response>}
+     */
+    fetch: function(path) {
+        return this.url(path).then(function(url) {
+            if (url === path) return fetch(path, { cache: 'no-cache' });
+            return fetch(url).then(function(response) {
+                return response.ok ? response : fetch(path, { cache: 'no-cache' });
+            });
+        });
+    },
+
+    /**
+     * Parsed JSON of a published file
+     * @param {string} path - plain path from the site root
+     */
+    json: function(path) {
+        return this.fetch(path).then(function(response) {
+            if (!response.ok) throw new Error('Failed to load ' + path + ' (' + response.status + ')');
+            return response.json();
+        });
+    }
+};
+
+// ============================================
+// DATA MODULES
+// ============================================
+var NesmaData = {
+    manifestUrl: 'data/modules/manifest.json',
+    shared: {},
+    _manifest: null,
+    _loading: {},
+
+    /**
+     * Register sub-objects used by several datasets (called by shared.js)
+     * @param {Object} parts - {id: value}
+     */
+    share: function(parts) {
+        for (var id in parts) this.shared[id] = parts[id];
+    },
+
+    /**
+     * Set a dataset global (called by each data module)
+     * @param {string} name - global name, e.g. 'SLA_DATA'
+     * @param {Object|Array} own - the dataset, or its unshared keys
+     * @param {Object} [refs] - {key: shared id} for the shared keys
+     * @param {Array} [order] - every key in its original order
+     */
+    define: function(name, own, refs, order) {
+        var data = own;
+        if (order) {
+            var shared = this.shared;
+            data = {};
+            order.forEach(function(key) {
+                data[key] = refs && refs.hasOwnProperty(key) ? shared[refs[key]] : own[key];
+            });
+        }
+        window[name] = data;
+        return data;
+    },
+
+    manifest: function() {
+        if (!this._manifest) {
+            this._manifest = NesmaFiles.fetch(this.manifestUrl).then(function(response) {
+                if (!response.ok) throw new Error('Data manifest unavailable (' + response.status + ')');
+                return response.json();
+            });
+        }
+        return this._manifest;
+    },
+
+    _script: function(src) {
+        return new Promise(function(resolve, reject) {
+            var script = document.createElement('script');
+            script.src = src;
+            script.onload = resolve;
+            script.onerror = function() { reject(new Error('Failed to load ' + src)); };
+            document.head.appendChild(script);
+        });
+    },
+
+    _module: function(manifest, name) {
+        var self = this;
+        if (!this._loading[name]) {
+            var entry = manifest.modules[name];
+            if (!entry) return Promise.reject(new Error('Unknown data module: ' + name));
+            var base = this.manifestUrl.slice(0, this.manifestUrl.lastIndexOf('/') + 1);
+            this._loading[name] = Promise.all((entry.requires || []).map(function(dep) {
+                return self._module(manifest, dep);
+            })).then(function() {
+                return self._script(base + entry.path);
+            }).then(function() {
+                return window[entry.global];
+            });
+        }
+        return this._loading[name];
+    },
+
+    /**
+     * Load only the named datasets (and what they share), once per page
+     * @param {string|Array} names - module names from the manifest, e.g. ['sla', 'orders']
+     * @returns {Promise} resolves to {name: dataset}
+     */
+    load: function(names) {
+        var self = this;
+        names = Array.isArray(names) ? names : [names];
+        return this.manifest().then(function(manifest) {
+            return Promise.all(names.map(function(name) { return self._module(manifest, name); }));
+        }).then(function(datasets) {
+            var result = {};
+            names.forEach(function(name, i) { result[name] = datasets[i]; });
+            return result;
+        });
+    }
+};
+
+// ============================================
+// RECORD SHARDS
+// ============================================
+var NesmaShards = {
+    _cache: {},
+
+    _fetch: function(head, base, shard) {
+        // Shard paths are content-hashed, so they are safe to cache
+        var url = base + shard.path;
+        if (!this._cache[url]) {
+            this._cache[url] = fetch(url).then(function(response) {
+                if (!response.ok) throw new Error('Failed to load ' + shard.path + ' (' + response.status + ')');
+                return response.json();
+            });
+        }
+        return this._cache[url];
+    },
+
+    /**
+     * Rows start..end (exclusive) of a record set, fetching only the shards that hold them
+     * @param {Object} head - data file with a record_shards manifest
+     * @param {string} base - URL of the data file's directory, e.g. 'data/'
+     * @param {string} name - record set, e.g. 'inventory'
+     */
+    range: function(head, base, name, start, end) {
+        var self = this;
+        var shards = head.record_shards[name].shards.filter(function(shard) {
+            return shard.rows[1] > start && shard.rows[0] < end;
+        });
+        return Promise.all(shards.map(function(shard) {
+            return self._fetch(head, base, shard);
+        })).then(function(parts) {
+            var rows = [];
+            parts.forEach(function(part, i) {
+                var offset = shards[i].rows[0];
+                rows = rows.concat(part.slice(Math.max(start - offset, 0), end - offset));
+            });
+            return rows;
+        });
+    },
+
+    /**
+     * Fill head.records with the named record sets (all of them by default)
+     * Data files that are not sharded already carry their records
+     * @returns {Promise} resolves to head.records
+     */
+    load: function(head, base, names) {
+        var self = this;
+        head.records = head.records || {};
+        if (!head.record_shards) return Promise.resolve(head.records);
+        names = names || Object.keys(head.record_shards);
+        return Promise.all(names.map(function(name) {
+            if (head.records[name] || !head.record_shards[name]) return null;
+            return self.range(head, base, name, 0, head.record_shards[name].rows).then(function(rows) {
+                head.records[name] = rows;
+            });
+        })).then(function() {
+            return head.records;
+        });
+    }
+};
+
+// ============================================
+// COLUMNAR RECORDS (record arrays in column form)
+// ============================================
+var NesmaColumns = {
+    isColumnar: function(value) {
+        return !!value && value.columnar === 1;
+    },
+
+    /** Values of one field, one per row, with string-table codes resolved */
+    column: function(table, field) {
+        var column = table.columns[field];
+        if (Array.isArray(column)) return column;
+        return column.codes.map(function(code) {
+            return column.strings[code];
+        });
+    },
+
+    /**
+     * Rebuild rows start..end (exclusive, all rows by default) as record objects
+     * Plain record arrays are returned as they are
+     */
+    rows: function(table, start, end) {
+        if (!this.isColumnar(table)) return table;
+        start = start || 0;
+        end = end == null ? table.rows : Math.min(end, table.rows);
+        var fields = table.fields;
+        var columns = fields.map(function(field) {
+            return table.columns[field];
+        });
+        var rows = [];
+        for (var i = start; i < end; i++) {
+            var row = {};
+            for (var f = 0; f < fields.length; f++) {
+                var column = columns[f];
+                row[fields[f]] = Array.isArray(column) ? column[i] : column.strings[column.codes[i]];
+            }
+            rows.push(row);
+        }
+        return rows;
+    },
+
+    /**
+     * Replace the columnar record arrays of a data file with rows
+     * @param {Object} data - parsed data file
+     * @param {string[]} names - keys to decode (every columnar key by default)
+     * @returns {Object} data
+     */
+    decode: function(data, names) {
+        var self = this;
+        (names || Object.keys(data)).forEach(function(name) {
+            if (self.isColumnar(data[name])) data[name] = self.rows(data[name]);
+        });
+        return data;
+    }
+};
+
 // ============================================
 // ESCAPE HTML UTILITY (global helper)
 // ============================================
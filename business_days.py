@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Business-day SLA durations
+Durations are counted in working days (Sunday to Thursday, less the public
+holidays in the calendar file) over whole date columns in one call; dates
+in years the holiday table does not cover are reported
+"""
+
+import json
+from functools import lru_cache
+
+import numpy as np
+
+from daily_bins import to_days
+from sla_config import CALENDAR_PATH, ON_TIME_DAYS
+
+# Saudi working week; used when the calendar file does not set one
+DEFAULT_WEEKMASK = "Sun Mon Tue Wed Thu"
+
+
+@lru_cache(maxsize=None)
+def _load_config(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        print(f"Warning: no readable SLA calendar at {path}, counting weekends only")
+        return {}
+
+
+def _holidays(path):
+    return [h["date"] if isinstance(h, dict) else h for h in _load_config(path).get("holidays", [])]
+
+
+@lru_cache(maxsize=None)
+def load_calendar(path=CALENDAR_PATH):
+    """numpy business-day calendar from the weekmask and holiday table in path"""
+    return np.busdaycalendar(
+        weekmask=_load_config(path).get("weekmask", DEFAULT_WEEKMASK),
+        holidays=np.array(_holidays(path), dtype="datetime64[D]"),
+    )
+
+
+def covered_years(path=CALENDAR_PATH):
+    """Years the holiday table in path lists holidays for"""
+    return {int(str(date)[:4]) for date in _holidays(path)}
+
+
+# Uncovered years already reported this run
+_reported_years = set()
+
+
+def check_coverage(days, path=CALENDAR_PATH):
+    """Warn once per year for dates the holiday table does not cover
+
+    Holidays in those years are counted as working days. Returns the
+    uncovered years found in days.
+    """
+    days = days[~np.isnat(days)]
+    years = set((days.astype("datetime64[Y]").astype(np.int64) + 1970).tolist())
+    uncovered = years - covered_years(path)
+    new = sorted(uncovered - _reported_years)
+    if new:
+        print(
+            f"Warning: {path} lists no holidays for {', '.join(map(str, new))}; "
+            "holidays in those years count as working days"
+        )
+        _reported_years.update(new)
+    return uncovered
+
+
+def business_days(starts, ends, calendar=None):
+    """Working days from each start date up to (not including) its end date
+
+    NaN where either date is missing or unreadable, or the end comes before
+    the start. With the default calendar, dates in years its holiday table
+    does not cover are reported.
+    """
+    start, end = to_days(starts), to_days(ends)
+    valid = ~(np.isnat(start) | np.isnat(end))
+    valid[valid] = end[valid] >= start[valid]
+    if calendar is None:
+        check_coverage(np.concatenate((start[valid], end[valid])))
+    counts = np.full(len(start), np.nan)
+    counts[valid] = np.busday_count(
+        start[valid], end[valid], busdaycal=calendar or load_calendar()
+    )
+    return counts
+
+
+def sla_days(starts, ends, recorded, calendar=None):
+    """Business-day durations, falling back to the recorded day count where
+    the dates cannot be used"""
+    counts = business_days(starts, ends, calendar)
+    return np.where(np.isnan(counts), np.asarray(recorded, dtype=np.float64), counts)
+
+
+def on_time_mask(durations, on_time_days=ON_TIME_DAYS):
+    """Rows whose SLA duration is within the on-time limit"""
+    return np.asarray(durations) <= on_time_days
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Daily bins and prefix sums for date-range KPIs
+Metrics are binned per calendar day and published as cumulative sums, so
+the total over any date range is prefix[last + 1] - prefix[first]
+"""
+
+import re
+from datetime import datetime
+
+import numpy as np
+
+# Trailing windows (in days, ending today) precomputed for the dashboards
+WINDOWS = (7, 30, 90)
+
+# Dates further than this from today are taken as typos and kept out of the
+# bins, so one mistyped year cannot stretch the series by thousands of days
+MAX_PAST_DAYS = 10 * 366
+MAX_FUTURE_DAYS = 366
+
+MONTH_KEY = re.compile(r"\d{4}-(0[1-9]|1[0-2])$")
+
+
+def to_days(values):
+    """datetime64[D] array from "YYYY-MM-DD..." values, NaT where unreadable"""
+    cache = {}
+
+    def day(value):
+        if value not in cache:
+            try:
+                cache[value] = np.datetime64(str(value)[:10], "D") if value else None
+            except ValueError:
+                cache[value] = None
+        return cache[value]
+
+    return np.array(
+        [day(v) or np.datetime64("NaT") for v in values], dtype="datetime64[D]"
+    )
+
+
+def month_window(today=None):
+    """First and last "YYYY-MM" month within MAX_PAST_DAYS..MAX_FUTURE_DAYS of today"""
+    today = np.datetime64(today or datetime.utcnow().date(), "D")
+    return (
+        str((today - MAX_PAST_DAYS).astype("datetime64[M]")),
+        str((today + MAX_FUTURE_DAYS).astype("datetime64[M]")),
+    )
+
+
+def month_key(value, window):
+    """value if it is a "YYYY-MM" month inside window, else None"""
+    if isinstance(value, str) and MONTH_KEY.match(value) and window[0] <= value <= window[1]:
+        return value
+    return None
+
+
+def stale_months(stored, current, window):
+    """Stored month keys to drop: months the source rows no longer fall in
+
+    Re-dated rows and corrected typo months leave their old month behind, so
+    only months present in current are kept, and only while inside window.
+    """
+    return [
+        month
+        for month in stored
+        if month not in current or month_key(month, window) is None
+    ]
+
+
+def range_total(prefix, start, first, last):
+    """Sum of a prefix-summed metric over the days first..last (inclusive)"""
+    size = len(prefix) - 1
+    lo = int(np.clip((first - start).astype(np.int64), 0, size))
+    hi = int(np.clip((last - start).astype(np.int64) + 1, 0, size))
+    return prefix[hi] - prefix[lo] if hi > lo else prefix[0] * 0
+
+
+def daily_series(dates, metrics, today=None):
+    """Bin metrics by day and return their prefix sums plus trailing-window totals
+
+    dates holds one date per row and metrics maps a name to a per-row array;
+    boolean and integer metrics stay integer counts. Rows without a readable
+    date are left out; rows dated outside MAX_PAST_DAYS..MAX_FUTURE_DAYS
+    around today are left out and counted as "out_of_range".
+    """
+    days = to_days(dates)
+    today = np.datetime64(today or datetime.utcnow().date(), "D")
+    readable = ~np.isnat(days)
+    dated = readable & (days >= today - MAX_PAST_DAYS) & (days <= today + MAX_FUTURE_DAYS)
+    out_of_range = int((readable & ~dated).sum())
+
+    if not dated.any():
+        return {
+            "start": None,
+            "days": 0,
+            "prefix": {name: [0] for name in metrics},
+            "windows": {f"last_{w}_days": {name: 0 for name in metrics} for w in WINDOWS},
+            "out_of_range": out_of_range,
+        }
+
+    start = days[dated].min()
+    index = (days[dated] - start).astype(np.int64)
+    size = int(index.max()) + 1
+
+    prefix = {}
+    for name, values in metrics.items():
+        values = np.asarray(values)[dated]
+        if values.dtype == bool or np.issubdtype(values.dtype, np.integer):
+            bins = np.bincount(index, weights=values, minlength=size).astype(np.int64)
+            prefix[name] = np.concatenate(([0], np.cumsum(bins)))
+        else:
+            bins = np.bincount(index, weights=values, minlength=size)
+            prefix[name] = np.round(np.concatenate(([0.0], np.cumsum(bins))), 2)
+
+    def window_total(p, w):
+        total = range_total(p, start, today - (w - 1), today).item()
+        return round(total, 2) if isinstance(total, float) else total
+
+    windows = {
+        f"last_{w}_days": {name: window_total(p, w) for name, p in prefix.items()}
+        for w in WINDOWS
+    }
+    return {
+        "start": str(start),
+        "days": size,
+        "prefix": {name: p.tolist() for name, p in prefix.items()},
+        "windows": windows,
+        "out_of_range": out_of_range,
+    }
@@ -1,4347 +0,0 @@
-// NESMA Supply Chain Management - Dashboard Data
-// Auto-synced from Smartsheet
-// Last updated: 2026-01-05 23:14:06 UTC
-
-// SLA Dashboard Data
-const SLA_DATA = {
-  "summary": {
-    "total_orders": 1182,
-    "done_orders": 1177,
-    "in_progress_orders": 0,
-    "not_done_orders": 5,
-    "on_time_rate": 83.09,
-    "total_amount": 13867425.6,
-    "avg_duration": 2.8,
-    "median_duration": 1.0,
-    "p90_duration": 5.0,
-    "open_orders": 5,
-    "last_update": "2026-01-05"
-  },
-  "status": {
-    "Done": 1177,
-    "In Progress": 0,
-    "Not Done": 5
-  },
-  "top_suppliers": {
-    "Construction Pioneer": 315,
-    "Awtad Alsharq": 279,
-    "AMANE CO": 163,
-    "Sana CO": 107,
-    "Al-Buraq CO": 98,
-    "Almamorah CO": 73,
-    "FIFO Transportation": 30,
-    "BIN MASHHURE": 30,
-    "Rowaya Al Badia": 22,
-    "Zad Al-Omran": 19
-  },
-  "suppliers": {
-    "Awtad Alsharq": 3303888.970000001,
-    "Construction Pioneer": 2970087.0,
-    "Almamorah CO": 1684706.45,
-    "Sana CO": 1626106.25,
-    "AMANE CO": 1603444.2400000002,
-    "Al-Buraq CO": 1523585.0,
-    "BIN MASHHURE": 566400.0,
-    "FIFO Transportation": 171600.0,
-    "Rowaya Al Badia": 103550.0,
-    "Alhai Alsaed": 102100.0
-  },
-  "top_projects": {
-    "Jafurah": 2934508.22,
-    "ZATCA": 1966802.7,
-    "NIC-EV2": 1336841.9500000002,
-    "ALMURJAN": 764238.0,
-    "NIT": 574608.0,
-    "PSSA": 515313.38,
-    "Aljazeera Royal Palace": 507892.17,
-    "KSP": 506376.25,
-    "Haram": 499201.49,
-    "NIC-NORTH": 422492.6,
-    "Al Sharafiyah": 416486.25,
-    "NEOM": 322400.0,
-    "Al Hamdania": 321395.0,
-    "Hafar Albatin": 230184.59,
-    "Diriyah": 214630.0,
-    "Taiba": 189520.0,
-    "Rabigh": 164525.0,
-    "Makkah": 149150.0,
-    "Albahr": 148740.0,
-    "Wadi Dahran": 126300.0
-  },
-  "projects_orders": {
-    "NIT": 133,
-    "Jafurah": 109,
-    "ALMURJAN": 83,
-    "Al Sharafiyah": 79,
-    "NIC-EV2": 77,
-    "KSP": 74,
-    "Al Hamdania": 48,
-    "ZATCA": 48,
-    "Diriyah": 39,
-    "Haram": 34,
-    "NEOM": 31,
-    "NIC-NORTH": 21,
-    "Buhaiyrat": 20,
-    "JEC": 20,
-    "Rabigh": 20,
-    "PSSA": 19,
-    "Taiba": 19,
-    "Bayouniah": 18,
-    "NAF": 18,
-    "Aljazeera Royal Palace": 17
-  },
-  "projects_amounts": {
-    "Jafurah": 2934508.22,
-    "ZATCA": 1966802.7,
-    "NIC-EV2": 1336841.9500000002,
-    "ALMURJAN": 764238.0,
-    "NIT": 574608.0,
-    "PSSA": 515313.38,
-    "Aljazeera Royal Palace": 507892.17,
-    "KSP": 506376.25,
-    "Haram": 499201.49,
-    "NIC-NORTH": 422492.6,
-    "Al Sharafiyah": 416486.25,
-    "NEOM": 322400.0,
-    "Al Hamdania": 321395.0,
-    "Hafar Albatin": 230184.59,
-    "Diriyah": 214630.0,
-    "Taiba": 189520.0,
-    "Rabigh": 164525.0,
-    "Makkah": 149150.0,
-    "Albahr": 148740.0,
-    "Wadi Dahran": 126300.0
-  },
-  "equipment_distribution": {
-    "Boom Truck 10 Ton": 60,
-    "Diyanna": 53,
-    "Diyanna & Labors": 51,
-    "Forklift 3 Ton": 44,
-    "Forklift 10 Ton": 39,
-    "Crane 50 Ton": 38,
-    "Boom Truck 5 Ton": 27,
-    "Forklift 7 Ton": 22,
-    "Forklift 5 Ton": 21,
-    "Boom Truck": 20,
-    "Trella": 19,
-    "Forklift 10 Ton monthly reats": 19,
-    "BOOM TRUCK 10 Ton": 17,
-    "Trellas": 15,
-    "Crane 25 Ton": 13
-  },
-  "equipment_count": {
-    "Boom Truck 10 Ton": 60,
-    "Diyanna": 53,
-    "Diyanna & Labors": 51,
-    "Forklift 3 Ton": 44,
-    "Forklift 10 Ton": 39,
-    "Crane 50 Ton": 38,
-    "Boom Truck 5 Ton": 27,
-    "Forklift 7 Ton": 22,
-    "Forklift 5 Ton": 21,
-    "Boom Truck": 20,
-    "Trella": 19,
-    "Forklift 10 Ton monthly reats": 19,
-    "BOOM TRUCK 10 Ton": 17,
-    "Trellas": 15,
-    "Crane 25 Ton": 13
-  },
-  "equipment_cost": {
-    "Crane 50 Ton": 656589.62,
-    "Forklift 10 Ton monthly reats": 545040.1799999999,
-    "Boom Truck 10 Ton": 521635.39999999997,
-    "Forklift 10 Ton": 509080.33,
-    "2 manlift monthly reats": 412432.0,
-    "DEANA LORRY": 297900.0,
-    "Boom Truck 10 Ton Monthly rental": 283258.34,
-    "Trellas": 264300.0,
-    "CRANE 50 Ton": 256150.0,
-    "Diyanna & Labors": 252430.0,
-    "Forklift 3 Ton": 250816.1,
-    "Diyanna": 193700.0,
-    "Forklift 7 Ton": 183345.0,
-    "CRANE 50 Tonwith trailer": 177350.0,
-    "Crane 50 Ton monthly rates": 169701.0
-  },
-  "monthly_trend": [
-    {
-      "month": "2023-01",
-      "orders": 16,
-      "amount": 140300.0
-    },
-    {
-      "month": "2023-02",
-      "orders": 17,
-      "amount": 75500.0
-    },
-    {
-      "month": "2023-03",
-      "orders": 8,
-      "amount": 15000.0
-    },
-    {
-      "month": "2023-04",
-      "orders": 6,
-      "amount": 113100.0
-    },
-    {
-      "month": "2023-05",
-      "orders": 14,
-      "amount": 92700.0
-    },
-    {
-      "month": "2023-06",
-      "orders": 15,
-      "amount": 167800.0
-    },
-    {
-      "month": "2023-07",
-      "orders": 16,
-      "amount": 238800.0
-    },
-    {
-      "month": "2023-08",
-      "orders": 19,
-      "amount": 446900.0
-    },
-    {
-      "month": "2023-09",
-      "orders": 34,
-      "amount": 273405.0
-    },
-    {
-      "month": "2023-10",
-      "orders": 39,
-      "amount": 460823.85
-    },
-    {
-      "month": "2023-11",
-      "orders": 49,
-      "amount": 1257723.17
-    },
-    {
-      "month": "2023-12",
-      "orders": 40,
-      "amount": 540652.5
-    },
-    {
-      "month": "2024-01",
-      "orders": 30,
-      "amount": 410820.0
-    },
-    {
-      "month": "2024-02",
-      "orders": 18,
-      "amount": 293543.75
-    },
-    {
-      "month": "2024-03",
-      "orders": 28,
-      "amount": 230575.0
-    },
-    {
-      "month": "2024-04",
-      "orders": 26,
-      "amount": 199883.75
-    },
-    {
-      "month": "2024-05",
-      "orders": 41,
-      "amount": 297300.0
-    },
-    {
-      "month": "2024-06",
-      "orders": 59,
-      "amount": 437300.0
-    },
-    {
-      "month": "2024-07",
-      "orders": 65,
-      "amount": 735720.1
-    },
-    {
-      "month": "2024-08",
-      "orders": 43,
-      "amount": 556400.0
-    },
-    {
-      "month": "2024-09",
-      "orders": 50,
-      "amount": 808929.0
-    },
-    {
-      "month": "2024-10",
-      "orders": 63,
-      "amount": 527645.0
-    },
-    {
-      "month": "2024-11",
-      "orders": 46,
-      "amount": 957235.46
-    },
-    {
-      "month": "2024-12",
-      "orders": 48,
-      "amount": 691499.59
-    },
-    {
-      "month": "2025-01",
-      "orders": 55,
-      "amount": 622810.0
-    },
-    {
-      "month": "2025-02",
-      "orders": 36,
-      "amount": 548445.8300000001
-    },
-    {
-      "month": "2025-03",
-      "orders": 22,
-      "amount": 295344.69
-    },
-    {
-      "month": "2025-04",
-      "orders": 40,
-      "amount": 555326.59
-    },
-    {
-      "month": "2025-05",
-      "orders": 49,
-      "amount": 434065.08
-    },
-    {
-      "month": "2025-06",
-      "orders": 54,
-      "amount": 380937.17
-    },
-    {
-      "month": "2025-07",
-      "orders": 76,
-      "amount": 732497.76
-    },
-    {
-      "month": "2025-08",
-      "orders": 34,
-      "amount": 202172.31
-    },
-    {
-      "month": "2025-09",
-      "orders": 20,
-      "amount": 103420.0
-    },
-    {
-      "month": "2025-10",
-      "orders": 3,
-      "amount": 13500.0
-    },
-    {
-      "month": "2025-11",
-      "orders": 3,
-      "amount": 9350.0
-    }
-  ]
-};
-
-// Transportation Dashboard Data
-const TRANSPORTATION_DATA = {
-  "summary": {
-    "total_orders": 1182,
-    "done_orders": 1177,
-    "in_progress_orders": 0,
-    "not_done_orders": 5,
-    "on_time_rate": 83.09,
-    "total_amount": 13867425.6,
-    "avg_duration": 2.8,
-    "median_duration": 1.0,
-    "p90_duration": 5.0,
-    "open_orders": 5,
-    "last_update": "2026-01-05"
-  },
-  "status": {
-    "Done": 1177,
-    "In Progress": 0,
-    "Not Done": 5
-  },
-  "top_suppliers": {
-    "Construction Pioneer": 315,
-    "Awtad Alsharq": 279,
-    "AMANE CO": 163,
-    "Sana CO": 107,
-    "Al-Buraq CO": 98,
-    "Almamorah CO": 73,
-    "FIFO Transportation": 30,
-    "BIN MASHHURE": 30,
-    "Rowaya Al Badia": 22,
-    "Zad Al-Omran": 19
-  },
-  "suppliers": {
-    "Awtad Alsharq": 3303888.970000001,
-    "Construction Pioneer": 2970087.0,
-    "Almamorah CO": 1684706.45,
-    "Sana CO": 1626106.25,
-    "AMANE CO": 1603444.2400000002,
-    "Al-Buraq CO": 1523585.0,
-    "BIN MASHHURE": 566400.0,
-    "FIFO Transportation": 171600.0,
-    "Rowaya Al Badia": 103550.0,
-    "Alhai Alsaed": 102100.0
-  },
-  "top_projects": {
-    "Jafurah": 2934508.22,
-    "ZATCA": 1966802.7,
-    "NIC-EV2": 1336841.9500000002,
-    "ALMURJAN": 764238.0,
-    "NIT": 574608.0,
-    "PSSA": 515313.38,
-    "Aljazeera Royal Palace": 507892.17,
-    "KSP": 506376.25,
-    "Haram": 499201.49,
-    "NIC-NORTH": 422492.6,
-    "Al Sharafiyah": 416486.25,
-    "NEOM": 322400.0,
-    "Al Hamdania": 321395.0,
-    "Hafar Albatin": 230184.59,
-    "Diriyah": 214630.0,
-    "Taiba": 189520.0,
-    "Rabigh": 164525.0,
-    "Makkah": 149150.0,
-    "Albahr": 148740.0,
-    "Wadi Dahran": 126300.0
-  },
-  "projects_orders": {
-    "NIT": 133,
-    "Jafurah": 109,
-    "ALMURJAN": 83,
-    "Al Sharafiyah": 79,
-    "NIC-EV2": 77,
-    "KSP": 74,
-    "Al Hamdania": 48,
-    "ZATCA": 48,
-    "Diriyah": 39,
-    "Haram": 34,
-    "NEOM": 31,
-    "NIC-NORTH": 21,
-    "Buhaiyrat": 20,
-    "JEC": 20,
-    "Rabigh": 20,
-    "PSSA": 19,
-    "Taiba": 19,
-    "Bayouniah": 18,
-    "NAF": 18,
-    "Aljazeera Royal Palace": 17
-  },
-  "projects_amounts": {
-    "Jafurah": 2934508.22,
-    "ZATCA": 1966802.7,
-    "NIC-EV2": 1336841.9500000002,
-    "ALMURJAN": 764238.0,
-    "NIT": 574608.0,
-    "PSSA": 515313.38,
-    "Aljazeera Royal Palace": 507892.17,
-    "KSP": 506376.25,
-    "Haram": 499201.49,
-    "NIC-NORTH": 422492.6,
-    "Al Sharafiyah": 416486.25,
-    "NEOM": 322400.0,
-    "Al Hamdania": 321395.0,
-    "Hafar Albatin": 230184.59,
-    "Diriyah": 214630.0,
-    "Taiba": 189520.0,
-    "Rabigh": 164525.0,
-    "Makkah": 149150.0,
-    "Albahr": 148740.0,
-    "Wadi Dahran": 126300.0
-  },
-  "equipment_distribution": {
-    "Boom Truck 10 Ton": 60,
-    "Diyanna": 53,
-    "Diyanna & Labors": 51,
-    "Forklift 3 Ton": 44,
-    "Forklift 10 Ton": 39,
-    "Crane 50 Ton": 38,
-    "Boom Truck 5 Ton": 27,
-    "Forklift 7 Ton": 22,
-    "Forklift 5 Ton": 21,
-    "Boom Truck": 20,
-    "Trella": 19,
-    "Forklift 10 Ton monthly reats": 19,
-    "BOOM TRUCK 10 Ton": 17,
-    "Trellas": 15,
-    "Crane 25 Ton": 13
-  },
-  "equipment_count": {
-    "Boom Truck 10 Ton": 60,
-    "Diyanna": 53,
-    "Diyanna & Labors": 51,
-    "Forklift 3 Ton": 44,
-    "Forklift 10 Ton": 39,
-    "Crane 50 Ton": 38,
-    "Boom Truck 5 Ton": 27,
-    "Forklift 7 Ton": 22,
-    "Forklift 5 Ton": 21,
-    "Boom Truck": 20,
-    "Trella": 19,
-    "Forklift 10 Ton monthly reats": 19,
-    "BOOM TRUCK 10 Ton": 17,
-    "Trellas": 15,
-    "Crane 25 Ton": 13
-  },
-  "equipment_cost": {
-    "Crane 50 Ton": 656589.62,
-    "Forklift 10 Ton monthly reats": 545040.1799999999,
-    "Boom Truck 10 Ton": 521635.39999999997,
-    "Forklift 10 Ton": 509080.33,
-    "2 manlift monthly reats": 412432.0,
-    "DEANA LORRY": 297900.0,
-    "Boom Truck 10 Ton Monthly rental": 283258.34,
-    "Trellas": 264300.0,
-    "CRANE 50 Ton": 256150.0,
-    "Diyanna & Labors": 252430.0,
-    "Forklift 3 Ton": 250816.1,
-    "Diyanna": 193700.0,
-    "Forklift 7 Ton": 183345.0,
-    "CRANE 50 Tonwith trailer": 177350.0,
-    "Crane 50 Ton monthly rates": 169701.0
-  },
-  "monthly_trend": [
-    {
-      "month": "2023-01",
-      "orders": 16,
-      "amount": 140300.0
-    },
-    {
-      "month": "2023-02",
-      "orders": 17,
-      "amount": 75500.0
-    },
-    {
-      "month": "2023-03",
-      "orders": 8,
-      "amount": 15000.0
-    },
-    {
-      "month": "2023-04",
-      "orders": 6,
-      "amount": 113100.0
-    },
-    {
-      "month": "2023-05",
-      "orders": 14,
-      "amount": 92700.0
-    },
-    {
-      "month": "2023-06",
-      "orders": 15,
-      "amount": 167800.0
-    },
-    {
-      "month": "2023-07",
-      "orders": 16,
-      "amount": 238800.0
-    },
-    {
-      "month": "2023-08",
-      "orders": 19,
-      "amount": 446900.0
-    },
-    {
-      "month": "2023-09",
-      "orders": 34,
-      "amount": 273405.0
-    },
-    {
-      "month": "2023-10",
-      "orders": 39,
-      "amount": 460823.85
-    },
-    {
-      "month": "2023-11",
-      "orders": 49,
-      "amount": 1257723.17
-    },
-    {
-      "month": "2023-12",
-      "orders": 40,
-      "amount": 540652.5
-    },
-    {
-      "month": "2024-01",
-      "orders": 30,
-      "amount": 410820.0
-    },
-    {
-      "month": "2024-02",
-      "orders": 18,
-      "amount": 293543.75
-    },
-    {
-      "month": "2024-03",
-      "orders": 28,
-      "amount": 230575.0
-    },
-    {
-      "month": "2024-04",
-      "orders": 26,
-      "amount": 199883.75
-    },
-    {
-      "month": "2024-05",
-      "orders": 41,
-      "amount": 297300.0
-    },
-    {
-      "month": "2024-06",
-      "orders": 59,
-      "amount": 437300.0
-    },
-    {
-      "month": "2024-07",
-      "orders": 65,
-      "amount": 735720.1
-    },
-    {
-      "month": "2024-08",
-      "orders": 43,
-      "amount": 556400.0
-    },
-    {
-      "month": "2024-09",
-      "orders": 50,
-      "amount": 808929.0
-    },
-    {
-      "month": "2024-10",
-      "orders": 63,
-      "amount": 527645.0
-    },
-    {
-      "month": "2024-11",
-      "orders": 46,
-      "amount": 957235.46
-    },
-    {
-      "month": "2024-12",
-      "orders": 48,
-      "amount": 691499.59
-    },
-    {
-      "month": "2025-01",
-      "orders": 55,
-      "amount": 622810.0
-    },
-    {
-      "month": "2025-02",
-      "orders": 36,
-      "amount": 548445.8300000001
-    },
-    {
-      "month": "2025-03",
-      "orders": 22,
-      "amount": 295344.69
-    },
-    {
-      "month": "2025-04",
-      "orders": 40,
-      "amount": 555326.59
-    },
-    {
-      "month": "2025-05",
-      "orders": 49,
-      "amount": 434065.08
-    },
-    {
-      "month": "2025-06",
-      "orders": 54,
-      "amount": 380937.17
-    },
-    {
-      "month": "2025-07",
-      "orders": 76,
-      "amount": 732497.76
-    },
-    {
-      "month": "2025-08",
-      "orders": 34,
-      "amount": 202172.31
-    },
-    {
-      "month": "2025-09",
-      "orders": 20,
-      "amount": 103420.0
-    },
-    {
-      "month": "2025-10",
-      "orders": 3,
-      "amount": 13500.0
-    },
-    {
-      "month": "2025-11",
-      "orders": 3,
-      "amount": 9350.0
-    }
-  ]
-};
-
-// Payments Dashboard Data
-const PAYMENTS_DATA = {
-  "summary": {
-    "total_invoices": 1177,
-    "paid_invoices": 1118,
-    "pending_invoices": 0,
-    "other_status": 59,
-    "total_amount": 13867425.6,
-    "avg_completion_days": 2.8,
-    "avg_payment_cycle": 0,
-    "avg_invoice_receive": 0,
-    "payment_rate": 95.0,
-    "last_update": "2026-01-05"
-  },
-  "payment_status": {
-    "Paid": 1118,
-    "Pending Approval": 0,
-    "Other": 59
-  },
-  "suppliers": {
-    "Construction Pioneer": 315,
-    "Awtad Alsharq": 279,
-    "AMANE CO": 163,
-    "Sana CO": 107,
-    "Al-Buraq CO": 98,
-    "Almamorah CO": 73,
-    "FIFO Transportation": 30,
-    "BIN MASHHURE": 29,
-    "Rowaya Al Badia": 22,
-    "Zad Al-Omran": 19,
-    "Alhai Alsaed": 17,
-    "Across The Desert": 10,
-    "Rowaya al badia": 6,
-    "SIC": 4,
-    "NIT": 2
-  },
-  "projects": {
-    "NIT": 133,
-    "Jafurah": 108,
-    "ALMURJAN": 83,
-    "Al Sharafiyah": 79,
-    "NIC-EV2": 77,
-    "KSP": 74,
-    "Al Hamdania": 48,
-    "ZATCA": 48,
-    "Diriyah": 39,
-    "Haram": 34,
-    "NEOM": 29,
-    "NIC-NORTH": 21,
-    "Buhaiyrat": 20,
-    "JEC": 20,
-    "Rabigh": 20,
-    "PSSA": 19,
-    "Taiba": 19,
-    "Bayouniah": 18,
-    "Aljazeera Royal Palace": 17,
-    "NAF": 16
-  },
-  "equipment_requested": {
-    "Boom Truck 10 Ton": 60,
-    "Diyanna": 53,
-    "Diyanna & Labors": 51,
-    "Forklift 3 Ton": 43,
-    "Forklift 10 Ton": 39,
-    "Crane 50 Ton": 38,
-    "Boom Truck 5 Ton": 27,
-    "Forklift 7 Ton": 22,
-    "Forklift 5 Ton": 21,
-    "Boom Truck": 20,
-    "Trella": 19,
-    "Forklift 10 Ton monthly reats": 19,
-    "BOOM TRUCK 10 Ton": 17,
-    "Trellas": 15,
-    "Crane 25 Ton": 13
-  },
-  "requesters": {
-    "M.Safdr": 61,
-    "Dia Saleh": 60,
-    "Mohammed Taha": 56,
-    "Baher": 44,
-    "Safder": 42,
-    "Tasawour": 40,
-    "Khurram Abbas": 30,
-    "Amir": 30,
-    "Ahmed Shaaban": 24,
-    "Ahmed": 23
-  },
-  "monthly_trend": [
-    {
-      "month": "2023-01",
-      "invoices": 15,
-      "amount": 140300.0
-    },
-    {
-      "month": "2023-02",
-      "invoices": 16,
-      "amount": 75500.0
-    },
-    {
-      "month": "2023-03",
-      "invoices": 7,
-      "amount": 15000.0
-    },
-    {
-      "month": "2023-04",
-      "invoices": 5,
-      "amount": 113100.0
-    },
-    {
-      "month": "2023-05",
-      "invoices": 13,
-      "amount": 92700.0
-    },
-    {
-      "month": "2023-06",
-      "invoices": 15,
-      "amount": 167800.0
-    },
-    {
-      "month": "2023-07",
-      "invoices": 16,
-      "amount": 238800.0
-    },
-    {
-      "month": "2023-08",
-      "invoices": 19,
-      "amount": 446900.0
-    },
-    {
-      "month": "2023-09",
-      "invoices": 34,
-      "amount": 273405.0
-    },
-    {
-      "month": "2023-10",
-      "invoices": 39,
-      "amount": 460823.85
-    },
-    {
-      "month": "2023-11",
-      "invoices": 49,
-      "amount": 1257723.17
-    },
-    {
-      "month": "2023-12",
-      "invoices": 40,
-      "amount": 540652.5
-    },
-    {
-      "month": "2024-01",
-      "invoices": 30,
-      "amount": 410820.0
-    },
-    {
-      "month": "2024-02",
-      "invoices": 18,
-      "amount": 293543.75
-    },
-    {
-      "month": "2024-03",
-      "invoices": 28,
-      "amount": 230575.0
-    },
-    {
-      "month": "2024-04",
-      "invoices": 26,
-      "amount": 199883.75
-    },
-    {
-      "month": "2024-05",
-      "invoices": 41,
-      "amount": 297300.0
-    },
-    {
-      "month": "2024-06",
-      "invoices": 59,
-      "amount": 437300.0
-    },
-    {
-      "month": "2024-07",
-      "invoices": 65,
-      "amount": 735720.1
-    },
-    {
-      "month": "2024-08",
-      "invoices": 43,
-      "amount": 556400.0
-    },
-    {
-      "month": "2024-09",
-      "invoices": 50,
-      "amount": 808929.0
-    },
-    {
-      "month": "2024-10",
-      "invoices": 63,
-      "amount": 527645.0
-    },
-    {
-      "month": "2024-11",
-      "invoices": 46,
-      "amount": 957235.46
-    },
-    {
-      "month": "2024-12",
-      "invoices": 48,
-      "amount": 691499.59
-    },
-    {
-      "month": "2025-01",
-      "invoices": 55,
-      "amount": 622810.0
-    },
-    {
-      "month": "2025-02",
-      "invoices": 36,
-      "amount": 548445.8300000001
-    },
-    {
-      "month": "2025-03",
-      "invoices": 22,
-      "amount": 295344.69
-    },
-    {
-      "month": "2025-04",
-      "invoices": 40,
-      "amount": 555326.59
-    },
-    {
-      "month": "2025-05",
-      "invoices": 49,
-      "amount": 434065.08
-    },
-    {
-      "month": "2025-06",
-      "invoices": 54,
-      "amount": 380937.17
-    },
-    {
-      "month": "2025-07",
-      "invoices": 76,
-      "amount": 732497.76
-    },
-    {
-      "month": "2025-08",
-      "invoices": 34,
-      "amount": 202172.31
-    },
-    {
-      "month": "2025-09",
-      "invoices": 20,
-      "amount": 103420.0
-    },
-    {
-      "month": "2025-10",
-      "invoices": 3,
-      "amount": 13500.0
-    },
-    {
-      "month": "2025-11",
-      "invoices": 3,
-      "amount": 9350.0
-    }
-  ]
-};
-
-// Raw Orders Data (last 200)
-const ORDERS_DATA = [
-  {
-    "id": 1.0,
-    "job_order_no": 11062025.0,
-    "job_order_date": "2025-06-11",
-    "project": "Abu Maan",
-    "requester": "Mohammed Dabor",
-    "equipment_type": "Diyanna & Labors",
-    "requested_date": "2025-06-11",
-    "performed": "Yes",
-    "completion_date": "2025-06-14",
-    "completion_days": 3.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 8920.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 2.0,
-    "job_order_no": 14062025.0,
-    "job_order_date": "2025-06-14",
-    "project": "Abu Maan",
-    "requester": "Mohammed Dabor",
-    "equipment_type": "Diyanna & Labors",
-    "requested_date": "2025-06-14",
-    "performed": "Yes",
-    "completion_date": "2025-06-15",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 3400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 3.0,
-    "job_order_no": 18062025.0,
-    "job_order_date": "2025-06-18",
-    "project": "Abu Maan",
-    "requester": "Mohammed Dabor",
-    "equipment_type": "Diyanna & Labors",
-    "requested_date": "2025-06-18",
-    "performed": "Yes",
-    "completion_date": "2025-06-20",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 12320.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 3.0,
-    "job_order_no": 10112024.0,
-    "job_order_date": "2024-11-10",
-    "project": "Albahr",
-    "requester": "Ahmed Ayed",
-    "equipment_type": "Crane 25 Ton & Trella",
-    "requested_date": "2024-11-10",
-    "performed": "Yes",
-    "completion_date": "2024-11-12",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 6200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 4.0,
-    "job_order_no": 25012025.0,
-    "job_order_date": "2025-01-25",
-    "project": "Albahr",
-    "requester": "Abdulsmad",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2025-01-25",
-    "performed": "Yes",
-    "completion_date": "2025-01-27",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 2700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 5.0,
-    "job_order_no": 18112024.0,
-    "job_order_date": "2024-11-18",
-    "project": "Albahr",
-    "requester": "Ahmed Ayed",
-    "equipment_type": "Forklift 10 Ton",
-    "requested_date": "2024-11-18",
-    "performed": "Yes",
-    "completion_date": "2024-11-20",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 38800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 6.0,
-    "job_order_no": 5052025.0,
-    "job_order_date": "2025-05-05",
-    "project": "Albahr",
-    "requester": "Abdulsamad",
-    "equipment_type": "Boom Truck & Reigger",
-    "requested_date": "2025-05-05",
-    "performed": "Yes",
-    "completion_date": "2025-05-06",
-    "completion_days": 1.0,
-    "supplier": "Almamorah CO",
-    "cost": 11400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 7.0,
-    "job_order_no": 29042025.0,
-    "job_order_date": "2025-04-29",
-    "project": "Albahr",
-    "requester": "Abdulsamad",
-    "equipment_type": "Boom Truck 5 Ton",
-    "requested_date": "2025-04-29",
-    "performed": "Yes",
-    "completion_date": "2025-04-30",
-    "completion_days": 1.0,
-    "supplier": "Almamorah CO",
-    "cost": 3800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 8.0,
-    "job_order_no": 29052025.0,
-    "job_order_date": "2025-05-29",
-    "project": "Albahr",
-    "requester": "Abdulsamad",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2025-05-29",
-    "performed": "Yes",
-    "completion_date": "2025-05-30",
-    "completion_days": 1.0,
-    "supplier": "Rowaya al badia",
-    "cost": 4000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Still not transfer"
-  },
-  {
-    "id": 9.0,
-    "job_order_no": 22062025.0,
-    "job_order_date": "2025-06-22",
-    "project": "Albahr",
-    "requester": "Ahmad Ayed",
-    "equipment_type": "Diyanna & Labours",
-    "requested_date": "2025-06-22",
-    "performed": "Yes",
-    "completion_date": "2025-06-22",
-    "completion_days": "0",
-    "supplier": "Awtad Alsharq",
-    "cost": 1860.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Under Approval Mr. AlShehri, Ali"
-  },
-  {
-    "id": 10.0,
-    "job_order_no": 20112024.0,
-    "job_order_date": "2024-11-20",
-    "project": "Albahr",
-    "requester": "Mostafa Abo Khalifa",
-    "equipment_type": "Trellas to shifting Clabes",
-    "requested_date": "2024-11-20",
-    "performed": "Yes",
-    "completion_date": "2024-11-23",
-    "completion_days": 3.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 60000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Under Approval Mr. Khan, Muhammad"
-  },
-  {
-    "id": 12.0,
-    "job_order_no": 29062025.0,
-    "job_order_date": "2025-06-29",
-    "project": "Albahr",
-    "requester": "Aurangzeb",
-    "equipment_type": "2 Cranes 25 Ton & Trella",
-    "requested_date": "2025-06-29",
-    "performed": "Yes",
-    "completion_date": "2025-06-30",
-    "completion_days": 1.0,
-    "supplier": "FIFO Transportation",
-    "cost": 6500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 13.0,
-    "job_order_no": 12032024.0,
-    "job_order_date": "2024-03-12",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-03-12",
-    "performed": "Yes",
-    "completion_date": "2024-03-12",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 1600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 14.0,
-    "job_order_no": 12032024.0,
-    "job_order_date": "2024-03-12",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 3 Ton",
-    "requested_date": "2024-03-12",
-    "performed": "Yes",
-    "completion_date": "2024-03-12",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 1300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 15.0,
-    "job_order_no": 17032024.0,
-    "job_order_date": "2024-03-17",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 5 Ton",
-    "requested_date": "2024-03-17",
-    "performed": "Yes",
-    "completion_date": "2024-03-18",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 2650.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 16.0,
-    "job_order_no": 10032024.0,
-    "job_order_date": "2024-03-10",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 3 Ton",
-    "requested_date": "2024-03-10",
-    "performed": "Yes",
-    "completion_date": "2024-03-10",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 1300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 17.0,
-    "job_order_no": 2032025.0,
-    "job_order_date": "2025-03-02",
-    "project": "Al Hamdania",
-    "requester": "Mohammed Abdulaziz",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2025-03-02",
-    "performed": "Yes",
-    "completion_date": "2025-03-03",
-    "completion_days": 1.0,
-    "supplier": "Almamorah CO",
-    "cost": 4200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 18.0,
-    "job_order_no": 2912024.0,
-    "job_order_date": "2024-01-29",
-    "project": "Al Hamdania",
-    "requester": "M.Shaaban",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-01-29",
-    "performed": "Yes",
-    "completion_date": "2024-01-30",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 1600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 19.0,
-    "job_order_no": 7022024.0,
-    "job_order_date": "2024-02-07",
-    "project": "Al Hamdania",
-    "requester": "M.Shaaban",
-    "equipment_type": "Forklift 3ton",
-    "requested_date": "2024-02-10",
-    "performed": "Yes",
-    "completion_date": "2024-02-10",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 1300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 20.0,
-    "job_order_no": 7072024.0,
-    "job_order_date": "2024-07-07",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-07-07",
-    "performed": "Yes",
-    "completion_date": "2024-07-08",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 4255.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 21.0,
-    "job_order_no": 5072024.0,
-    "job_order_date": "2024-07-05",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 7 Ton",
-    "requested_date": "2024-07-05",
-    "performed": "Yes",
-    "completion_date": "2024-07-06",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3220.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 22.0,
-    "job_order_no": 2062024.0,
-    "job_order_date": "2024-06-02",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-06-02",
-    "performed": "Yes",
-    "completion_date": "2024-06-03",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 1200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 23.0,
-    "job_order_no": 29062024.0,
-    "job_order_date": "2024-06-29",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Crane 50 Ton & Trelles",
-    "requested_date": "2024-06-29",
-    "performed": "Yes",
-    "completion_date": "2024-06-30",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 4300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 24.0,
-    "job_order_no": 7072024.0,
-    "job_order_date": "2024-07-08",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 7 Ton",
-    "requested_date": "2024-07-08",
-    "performed": "Yes",
-    "completion_date": "2024-07-08",
-    "completion_days": "0",
-    "supplier": "Awtad Alsharq",
-    "cost": 4600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 25.0,
-    "job_order_no": 3072024.0,
-    "job_order_date": "2024-07-03",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "8 Trelles",
-    "requested_date": "2024-07-03",
-    "performed": "Yes",
-    "completion_date": "2024-07-06",
-    "completion_days": 3.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 70500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 26.0,
-    "job_order_no": 30072024.0,
-    "job_order_date": "2024-07-30",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-07-30",
-    "performed": "Yes",
-    "completion_date": "2024-07-31",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 2500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 27.0,
-    "job_order_no": 3082024.0,
-    "job_order_date": "2024-08-03",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-08-03",
-    "performed": "Yes",
-    "completion_date": "2024-08-04",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 5000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 28.0,
-    "job_order_no": 25072024.0,
-    "job_order_date": "2024-07-25",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 7 Ton",
-    "requested_date": "2024-07-25",
-    "performed": "Yes",
-    "completion_date": "2024-07-27",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 3700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 29.0,
-    "job_order_no": 5102024.0,
-    "job_order_date": "2024-10-05",
-    "project": "Al Hamdania",
-    "requester": "Hamdy Elnaggar",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-10-05",
-    "performed": "Yes",
-    "completion_date": "2024-10-06",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 30.0,
-    "job_order_no": 24112024.0,
-    "job_order_date": "2024-11-24",
-    "project": "Al Hamdania",
-    "requester": "Hamdy Elnaggar",
-    "equipment_type": "Boom Truck 7 Ton",
-    "requested_date": "2024-11-24",
-    "performed": "Yes",
-    "completion_date": "2024-11-25",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 1400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 31.0,
-    "job_order_no": 29022024.0,
-    "job_order_date": "2024-02-29",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Forklift 7& 3 Tons",
-    "requested_date": "2024-02-29",
-    "performed": "Yes",
-    "completion_date": "2024-02-29",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 22900.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 32.0,
-    "job_order_no": 12042024.0,
-    "job_order_date": "2024-04-13",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Generator 100 KV rent for 3 days",
-    "requested_date": "2024-04-13",
-    "performed": "Yes",
-    "completion_date": "2024-04-14",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 5750.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 33.0,
-    "job_order_no": 4042024.0,
-    "job_order_date": "2024-04-04",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2024-04-04",
-    "performed": "Yes",
-    "completion_date": "2024-04-06",
-    "completion_days": 2.0,
-    "supplier": "Sana CO",
-    "cost": 1700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 34.0,
-    "job_order_no": 21042024.0,
-    "job_order_date": "2024-04-21",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Trelles & Forklift 7 Ton",
-    "requested_date": "2024-04-21",
-    "performed": "Yes",
-    "completion_date": "2024-04-23",
-    "completion_days": 2.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 12200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 35.0,
-    "job_order_no": 20042024.0,
-    "job_order_date": "2024-04-20",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Boom Truck & Pallet truck",
-    "requested_date": "2024-04-20",
-    "performed": "Yes",
-    "completion_date": "2024-04-21",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 3300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 36.0,
-    "job_order_no": 7052024.0,
-    "job_order_date": "2024-05-07",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Trellas & Forklift3 Ton&Crane 25 Ton",
-    "requested_date": "2024-05-07",
-    "performed": "Yes",
-    "completion_date": "2024-05-08",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 5100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 37.0,
-    "job_order_no": 21052024.0,
-    "job_order_date": "2024-05-21",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Trellas & Forklift 10 Ton",
-    "requested_date": "2024-05-21",
-    "performed": "Yes",
-    "completion_date": "2024-05-22",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 5300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 38.0,
-    "job_order_no": 22052024.0,
-    "job_order_date": "2024-05-22",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Forklift 3 Ton",
-    "requested_date": "2024-05-22",
-    "performed": "Yes",
-    "completion_date": "2024-05-23",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 2400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 39.0,
-    "job_order_no": 14052024.0,
-    "job_order_date": "2024-05-14",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Forklift 10 Ton",
-    "requested_date": "2024-05-14",
-    "performed": "Yes",
-    "completion_date": "2024-05-16",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 40.0,
-    "job_order_no": 6082024.0,
-    "job_order_date": "2024-08-06",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Trailer & 5 Ton Forklift",
-    "requested_date": "2024-08-11",
-    "performed": "Yes",
-    "completion_date": "2024-08-11",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": "SAR 52,000.00",
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 41.0,
-    "job_order_no": 20082024.0,
-    "job_order_date": "2024-08-20",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 5 Ton",
-    "requested_date": "2024-08-27",
-    "performed": "Yes",
-    "completion_date": "2024-08-27",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": "SAR 8,800.00",
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 42.0,
-    "job_order_no": 157072024.0,
-    "job_order_date": "2024-07-15",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift & Boom Truck",
-    "requested_date": "2024-07-15",
-    "performed": "Yes",
-    "completion_date": "2024-07-16",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 4400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 43.0,
-    "job_order_no": 24092024.0,
-    "job_order_date": "2024-09-24",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 5 Ton",
-    "requested_date": "2024-09-24",
-    "performed": "Yes",
-    "completion_date": "2024-09-25",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 44.0,
-    "job_order_no": 30092024.0,
-    "job_order_date": "2024-09-30",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Boom Truck 7 Ton",
-    "requested_date": "2024-09-30",
-    "performed": "Yes",
-    "completion_date": "2024-10-01",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 45.0,
-    "job_order_no": 9012025.0,
-    "job_order_date": "2025-01-09",
-    "project": "Al Hamdania",
-    "requester": "Hamdy Elnaggar",
-    "equipment_type": "2 Boom Truck 5 Ton",
-    "requested_date": "2025-01-09",
-    "performed": "Yes",
-    "completion_date": "2025-01-12",
-    "completion_days": 3.0,
-    "supplier": "Construction Pioneer",
-    "cost": 7400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 46.0,
-    "job_order_no": 14012025.0,
-    "job_order_date": "2025-01-14",
-    "project": "Al Hamdania",
-    "requester": "Hamdy Elnaggar",
-    "equipment_type": "Boom Truck 5 Ton",
-    "requested_date": "2025-01-14",
-    "performed": "Yes",
-    "completion_date": "2025-01-15",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 1100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 47.0,
-    "job_order_no": 21072024.0,
-    "job_order_date": "2024-07-21",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Boom Truck & Forklift",
-    "requested_date": "2024-07-21",
-    "performed": "Yes",
-    "completion_date": "2024-07-22",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 6680.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 48.0,
-    "job_order_no": 15072024.0,
-    "job_order_date": "2024-07-15",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift & Boom Truck",
-    "requested_date": "2024-07-15",
-    "performed": "Yes",
-    "completion_date": "2024-07-16",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 4400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 49.0,
-    "job_order_no": 20082024.0,
-    "job_order_date": "2024-08-20",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2024-08-20",
-    "performed": "Yes",
-    "completion_date": "2024-08-24",
-    "completion_days": 4.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 4600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 50.0,
-    "job_order_no": 22072024.0,
-    "job_order_date": "2024-07-22",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 7 Ton",
-    "requested_date": "2024-07-22",
-    "performed": "Yes",
-    "completion_date": "2024-07-23",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 3700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 51.0,
-    "job_order_no": 30102024.0,
-    "job_order_date": "2024-10-30",
-    "project": "Al Hamdania",
-    "requester": "Hamdy Elnaggar",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-10-30",
-    "performed": "Yes",
-    "completion_date": "2024-11-02",
-    "completion_days": 3.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 52.0,
-    "job_order_no": 17102024.0,
-    "job_order_date": "2024-10-17",
-    "project": "Al Hamdania",
-    "requester": "Hamdy Elnaggar",
-    "equipment_type": "Trella",
-    "requested_date": "2024-10-17",
-    "performed": "Yes",
-    "completion_date": "2024-10-20",
-    "completion_days": 3.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 1840.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 54.0,
-    "job_order_no": 21102024.0,
-    "job_order_date": "2024-05-21",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2024-05-21",
-    "performed": "Yes",
-    "completion_date": "2024-05-26",
-    "completion_days": 5.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 55.0,
-    "job_order_no": 31052024.0,
-    "job_order_date": "2024-05-31",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaaban",
-    "equipment_type": "Forklift 7 Ton & 10 Ton",
-    "requested_date": "2024-05-31",
-    "performed": "Yes",
-    "completion_date": "2024-06-01",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 6600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 56.0,
-    "job_order_no": 20082024.0,
-    "job_order_date": "2024-08-06",
-    "project": "Al Hamdania",
-    "requester": "Ahemd Shaaban",
-    "equipment_type": "Boom Truck",
-    "requested_date": "2024-08-06",
-    "performed": "Yes",
-    "completion_date": "2024-08-07",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 5800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 57.0,
-    "job_order_no": 18092024.0,
-    "job_order_date": "2024-09-18",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shabaan",
-    "equipment_type": "Boom Truck 7 Ton",
-    "requested_date": "2024-09-18",
-    "performed": "Yes",
-    "completion_date": "2024-09-19",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 7000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 58.0,
-    "job_order_no": 21072025.0,
-    "job_order_date": "2025-07-21",
-    "project": "Al Hamdania",
-    "requester": "Mohammed Abdullah",
-    "equipment_type": "2 Crane 50 Ton & Trella",
-    "requested_date": "2025-07-21",
-    "performed": "Yes",
-    "completion_date": "2025-07-28",
-    "completion_days": 7.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 5400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 59.0,
-    "job_order_no": 210112023.0,
-    "job_order_date": "2023-11-20",
-    "project": "Al Hamdania",
-    "requester": "M.Abdullah",
-    "equipment_type": "DEANA LORRY",
-    "requested_date": "2023-11-20",
-    "performed": "Yes",
-    "completion_date": "2023-11-23",
-    "completion_days": 3.0,
-    "supplier": "AMANE CO",
-    "cost": 1500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 60.0,
-    "job_order_no": 220102023.0,
-    "job_order_date": "2023-10-22",
-    "project": "Al Hamdania",
-    "requester": "Ahmed Shaban",
-    "equipment_type": "2 CRANE WITH ONE Terella",
-    "requested_date": "2023-10-22",
-    "performed": "Yes",
-    "completion_date": "2023-10-23",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 4800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 61.0,
-    "job_order_no": 170012301.0,
-    "job_order_date": "2023-01-17",
-    "project": "Jafurah",
-    "requester": "Mohmmed Aqib",
-    "equipment_type": "BOOM TRUCK+ TOW TRAILER",
-    "requested_date": "2023-01-17",
-    "performed": "Yes",
-    "completion_date": "2023-01-18",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 21900.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 62.0,
-    "job_order_no": 220012302.0,
-    "job_order_date": "2023-01-22",
-    "project": "Jafurah",
-    "requester": "Mr.Ali",
-    "equipment_type": "TRALER",
-    "requested_date": "2023-01-22",
-    "performed": "Yes",
-    "completion_date": "2023-01-22",
-    "completion_days": "0",
-    "supplier": "BIN MASHHURE",
-    "cost": 6000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 63.0,
-    "job_order_no": 280022301.0,
-    "job_order_date": "2023-02-28",
-    "project": "Jafurah",
-    "requester": "Khurram Abbas",
-    "equipment_type": "FORKLIFT 5 Ton",
-    "requested_date": "2023-02-28",
-    "performed": "No",
-    "invoice_applicable": "No"
-  },
-  {
-    "id": 64.0,
-    "job_order_no": 280022302.0,
-    "job_order_date": "2023-02-28",
-    "project": "Jafurah",
-    "requester": "Khurram Abbas",
-    "equipment_type": "BIG DAYANA",
-    "requested_date": "2023-02-28",
-    "performed": "Yes",
-    "completion_date": "2023-03-04",
-    "completion_days": 4.0,
-    "supplier": "Across the Desert",
-    "cost": 2900.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 65.0,
-    "job_order_no": 90072023.0,
-    "job_order_date": "2023-07-09",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "1 cran 30 Ton",
-    "requested_date": "2023-07-09",
-    "performed": "Yes",
-    "completion_date": "2023-07-11",
-    "completion_days": 2.0,
-    "supplier": "AMANE CO",
-    "cost": 6500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 66.0,
-    "job_order_no": 60902023.0,
-    "job_order_date": "2023-09-06",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "CRANE 50 Ton & FORKLIFT 7 Ton",
-    "requested_date": "2023-09-07",
-    "performed": "Yes",
-    "completion_date": "2023-09-07",
-    "completion_days": "0",
-    "supplier": "AMANE CO",
-    "cost": 11000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 67.0,
-    "job_order_no": 11902023.0,
-    "job_order_date": "2023-09-11",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "FORKLIFT 7 Ton",
-    "requested_date": "2023-09-12",
-    "performed": "Yes",
-    "completion_date": "2023-09-14",
-    "completion_days": 2.0,
-    "supplier": "AMANE CO",
-    "cost": 5200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 68.0,
-    "job_order_no": 140902024.0,
-    "job_order_date": "2023-09-14",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "FORKLIFT 3 Ton",
-    "requested_date": "2023-09-18",
-    "performed": "Yes",
-    "completion_date": "2023-09-18",
-    "completion_days": "0",
-    "supplier": "AMANE CO",
-    "cost": 2100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 69.0,
-    "job_order_no": 170902023.0,
-    "job_order_date": "2023-09-14",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "BOOM TRUCK 10 Ton",
-    "requested_date": "2023-09-18",
-    "performed": "Yes",
-    "completion_date": "2023-09-21",
-    "completion_days": 3.0,
-    "supplier": "AMANE CO",
-    "cost": 10000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 70.0,
-    "job_order_no": 210902024.0,
-    "job_order_date": "2023-09-21",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "BOOM TRUCK 10 Ton",
-    "requested_date": "2023-09-24",
-    "performed": "Yes",
-    "completion_date": "2023-09-30",
-    "completion_days": 6.0,
-    "supplier": "AMANE CO",
-    "cost": 15000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 71.0,
-    "job_order_no": 50102023.0,
-    "job_order_date": "2023-10-05",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "FORKLIFT 3 Ton",
-    "requested_date": "2023-10-05",
-    "performed": "Yes",
-    "completion_date": "2023-10-05",
-    "completion_days": "0",
-    "supplier": "AMANE CO",
-    "cost": 2100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 72.0,
-    "job_order_no": 150102023.0,
-    "job_order_date": "2023-10-15",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "One Diana  To transport materials from Dammam to Jafurah",
-    "requested_date": "2023-10-16",
-    "performed": "Yes",
-    "completion_date": "2023-10-16",
-    "completion_days": "0",
-    "supplier": "AMANE CO",
-    "cost": 2000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 73.0,
-    "job_order_no": 24092023.0,
-    "job_order_date": "2023-09-24",
-    "project": "Jafurah",
-    "requester": "Mohammed Faizan",
-    "equipment_type": "manlift 16M  For One Month",
-    "requested_date": "2023-09-24",
-    "performed": "Yes",
-    "completion_date": "2023-09-25",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 29600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 74.0,
-    "job_order_no": 230902023.0,
-    "job_order_date": "2023-10-23",
-    "project": "Jafurah",
-    "requester": "Mohammed Faizan",
-    "equipment_type": "CRANE 50 Ton",
-    "requested_date": "2023-10-23",
-    "performed": "Yes",
-    "completion_date": "2023-10-24",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 6800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 75.0,
-    "job_order_no": 3101020231.0,
-    "job_order_date": "2023-10-31",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Trailer with curtain",
-    "requested_date": "2023-10-31",
-    "performed": "Yes",
-    "completion_date": "2023-11-01",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 3000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 76.0,
-    "job_order_no": 20112023.0,
-    "job_order_date": "2023-11-02",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton &lowbed",
-    "requested_date": "2023-11-02",
-    "performed": "Yes",
-    "completion_date": "2023-11-02",
-    "completion_days": "0",
-    "supplier": "AMANE CO",
-    "cost": 6500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 77.0,
-    "job_order_no": 501020233.0,
-    "job_order_date": "2023-11-06",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2023-11-06",
-    "performed": "Yes",
-    "completion_date": "2023-11-07",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 6500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 78.0,
-    "job_order_no": 501020233.0,
-    "job_order_date": "2023-11-05",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2023-11-05",
-    "performed": "Yes",
-    "completion_date": "2023-11-06",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 6500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 79.0,
-    "job_order_no": 90102023.0,
-    "job_order_date": "2023-10-09",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Forklift 7 Ton FOR One  MONTH",
-    "requested_date": "2023-10-09",
-    "performed": "Yes",
-    "completion_date": "2023-10-14",
-    "completion_days": 5.0,
-    "supplier": "AMANE CO",
-    "cost": 23884.62,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 80.0,
-    "job_order_no": 90102023.0,
-    "job_order_date": "2023-10-09",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "BOOM TRUCK 10 Ton FOR One MONTH",
-    "requested_date": "2023-10-09",
-    "performed": "Yes",
-    "completion_date": "2023-10-11",
-    "completion_days": 2.0,
-    "supplier": "AMANE CO",
-    "cost": 30769.23,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 81.0,
-    "job_order_no": 120112023.0,
-    "job_order_date": "2023-11-12",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2023-11-12",
-    "performed": "Yes",
-    "completion_date": "2023-11-13",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 6500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 82.0,
-    "job_order_no": 20102023.0,
-    "job_order_date": "2023-11-02",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Lorry",
-    "requested_date": "2023-11-02",
-    "performed": "Yes",
-    "completion_date": "2023-11-10",
-    "completion_days": 8.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 3900.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 83.0,
-    "job_order_no": 1901120232.0,
-    "job_order_date": "2023-11-19",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2023-11-19",
-    "performed": "Yes",
-    "completion_date": "2023-11-20",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 15000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 84.0,
-    "job_order_no": 240102023.0,
-    "job_order_date": "2023-10-24",
-    "project": "Jafurah",
-    "requester": "Mohammed Faizan",
-    "equipment_type": "scissor manlift For One Month",
-    "requested_date": "2023-10-24",
-    "performed": "Yes",
-    "completion_date": "2023-10-25",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 31500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 85.0,
-    "job_order_no": 1401120232.0,
-    "job_order_date": "2023-11-14",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2023-11-14",
-    "performed": "Yes",
-    "completion_date": "2023-11-15",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 9600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 86.0,
-    "job_order_no": 130112023.0,
-    "job_order_date": "2023-11-13",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2023-11-13",
-    "performed": "Yes",
-    "completion_date": "2023-11-14",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 9000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 87.0,
-    "job_order_no": 2201120232.0,
-    "job_order_date": "2023-11-22",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2023-11-22",
-    "performed": "Yes",
-    "completion_date": "2023-11-23",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 25500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 88.0,
-    "job_order_no": 31102023.0,
-    "job_order_date": "2023-10-31",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Trailer with curtain",
-    "requested_date": "2023-10-31",
-    "performed": "Yes",
-    "completion_date": "2023-11-01",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 1500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 89.0,
-    "job_order_no": 9102023.0,
-    "job_order_date": "2023-10-09",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Transport Forklift",
-    "requested_date": "2023-10-09",
-    "performed": "Yes",
-    "completion_date": "2023-10-14",
-    "completion_days": 5.0,
-    "supplier": "AMANE CO",
-    "cost": 5000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 90.0,
-    "job_order_no": 150112023.0,
-    "job_order_date": "2023-11-15",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Forklift 3 Ton for 8 months (First invoice)",
-    "requested_date": "2023-11-15",
-    "performed": "Yes",
-    "completion_date": "2023-11-16",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 51175.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 91.0,
-    "job_order_no": 301220231.0,
-    "job_order_date": "2023-12-03",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "One Boom Truck 10 Ton with 5 triles",
-    "requested_date": "2023-12-03",
-    "performed": "Yes",
-    "completion_date": "2023-12-05",
-    "completion_days": 2.0,
-    "supplier": "Sana CO",
-    "cost": 17200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 92.0,
-    "job_order_no": 110122023.0,
-    "job_order_date": "2023-12-11",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2023-12-11",
-    "performed": "Yes",
-    "completion_date": "2023-12-12",
-    "completion_days": 1.0,
-    "supplier": "AMANE CO",
-    "cost": 9000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 93.0,
-    "job_order_no": 250112023.0,
-    "job_order_date": "2023-11-25",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "19 M Scissor lift",
-    "requested_date": "2023-11-25",
-    "performed": "Yes",
-    "completion_date": "2023-11-25",
-    "completion_days": "0",
-    "supplier": "AMANE CO",
-    "cost": 22576.92,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 94.0,
-    "job_order_no": 250122023.0,
-    "job_order_date": "2023-12-25",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 25 Ton",
-    "requested_date": "2023-12-25",
-    "performed": "Yes",
-    "completion_date": "2023-12-27",
-    "completion_days": 2.0,
-    "supplier": "Sana CO",
-    "cost": 12200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 95.0,
-    "job_order_no": 180122023.0,
-    "job_order_date": "2023-12-18",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "water tank for one week",
-    "requested_date": "2023-12-18",
-    "performed": "Yes",
-    "completion_date": "2023-12-19",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 9800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 96.0,
-    "job_order_no": 29011020231.0,
-    "job_order_date": "2023-11-29",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "BOOM TRUCK",
-    "requested_date": "2023-11-29",
-    "performed": "Yes",
-    "completion_date": "2023-12-01",
-    "completion_days": 2.0,
-    "supplier": "Sana CO",
-    "cost": 58506.25,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 97.0,
-    "job_order_no": 15011020231.0,
-    "job_order_date": "2023-11-15",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "FORKLIFT 7 Ton  AT 8 monthes (seconed invoice)",
-    "requested_date": "2023-11-15",
-    "performed": "Yes",
-    "completion_date": "2023-11-16",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 64150.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 98.0,
-    "job_order_no": 180122023.0,
-    "job_order_date": "2023-12-18",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "water tank for one week",
-    "requested_date": "2023-12-18",
-    "performed": "Yes",
-    "completion_date": "2023-12-19",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 4600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 99.0,
-    "job_order_no": 15011020231.0,
-    "job_order_date": "2023-11-15",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "FORKLIFT 7 Ton  AT 8 monthes",
-    "requested_date": "2023-11-15",
-    "performed": "Yes",
-    "completion_date": "2023-12-31",
-    "completion_days": 46.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 68850.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 100.0,
-    "job_order_no": 81020241.0,
-    "job_order_date": "2024-01-08",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "CRANE 50 Ton & FORKLIFT3 Ton",
-    "requested_date": "2024-01-08",
-    "performed": "Yes",
-    "completion_date": "2024-01-09",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 10600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 101.0,
-    "job_order_no": 15012024.0,
-    "job_order_date": "2024-01-15",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Lorry",
-    "requested_date": "2024-01-15",
-    "performed": "Yes",
-    "completion_date": "2024-01-21",
-    "completion_days": 6.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 3900.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 102.0,
-    "job_order_no": 2912024.0,
-    "job_order_date": "2024-01-29",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2024-01-29",
-    "performed": "Yes",
-    "completion_date": "2024-01-30",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 25000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 103.0,
-    "job_order_no": 122024.0,
-    "job_order_date": "2024-02-01",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Tone Crane Equipment",
-    "requested_date": "2024-02-01",
-    "performed": "Yes",
-    "completion_date": "2024-02-05",
-    "completion_days": 4.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 3000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 104.0,
-    "job_order_no": 1122024.0,
-    "job_order_date": "2024-02-11",
-    "project": "Jafurah",
-    "requester": "Khurram Abbas",
-    "equipment_type": "Rent small Dayana",
-    "requested_date": "2024-02-11",
-    "performed": "Yes",
-    "completion_date": "2024-02-12",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 1900.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 105.0,
-    "job_order_no": 290112023.0,
-    "job_order_date": "2023-11-29",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Boom Truck 10 Ton Monthly rental",
-    "requested_date": "2024-01-01",
-    "performed": "Yes",
-    "completion_date": "2024-01-31",
-    "completion_days": 30.0,
-    "supplier": "Sana CO",
-    "cost": 58750.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 106.0,
-    "job_order_no": 15112023.0,
-    "job_order_date": "2023-11-15",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "FORKLIFT 7 Ton  AT 8 monthes",
-    "requested_date": "2023-11-15",
-    "performed": "Yes",
-    "completion_date": "2024-01-31",
-    "completion_days": 77.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 67500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 107.0,
-    "job_order_no": 290112023.0,
-    "job_order_date": "2023-11-29",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Boom Truck 10 Ton Monthly rental",
-    "requested_date": "2023-11-29",
-    "performed": "Yes",
-    "completion_date": "2024-02-01",
-    "completion_days": 64.0,
-    "supplier": "Sana CO",
-    "cost": 51230.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 108.0,
-    "job_order_no": 1401020242.0,
-    "job_order_date": "2024-01-14",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "CRANE 50 Ton",
-    "requested_date": "2024-01-14",
-    "performed": "Yes",
-    "completion_date": "2024-01-15",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 12650.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 109.0,
-    "job_order_no": 170102024.0,
-    "job_order_date": "2024-01-17",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "CRANE 50 Ton",
-    "requested_date": "2024-01-17",
-    "performed": "Yes",
-    "completion_date": "2024-01-18",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 11500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 110.0,
-    "job_order_no": 2212024.0,
-    "job_order_date": "2024-01-22",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "50 Ton Crane",
-    "requested_date": "2024-01-22",
-    "performed": "Yes",
-    "completion_date": "2024-01-24",
-    "completion_days": 2.0,
-    "supplier": "Sana CO",
-    "cost": 19800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 111.0,
-    "job_order_no": 8012024.0,
-    "job_order_date": "2024-01-08",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "water tank",
-    "requested_date": "2024-01-08",
-    "performed": "Yes",
-    "completion_date": "2024-01-11",
-    "completion_days": 3.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 32400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 112.0,
-    "job_order_no": 21012024.0,
-    "job_order_date": "2024-01-21",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Forklift 10 Ton extended",
-    "requested_date": "2024-01-21",
-    "performed": "Yes",
-    "completion_date": "2024-01-23",
-    "completion_days": 2.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 22000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 113.0,
-    "job_order_no": 25012024.0,
-    "job_order_date": "2024-01-25",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "water tank",
-    "requested_date": "2024-01-25",
-    "performed": "Yes",
-    "completion_date": "2024-02-01",
-    "completion_days": 7.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 16200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 114.0,
-    "job_order_no": 18022024.0,
-    "job_order_date": "2024-02-18",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2024-02-18",
-    "performed": "Yes",
-    "completion_date": "2024-02-20",
-    "completion_days": 2.0,
-    "supplier": "Sana CO",
-    "cost": 62400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 115.0,
-    "job_order_no": 20032024.0,
-    "job_order_date": "2024-03-20",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2024-03-20",
-    "performed": "Yes",
-    "completion_date": "2024-03-21",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 21600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 116.0,
-    "job_order_no": 9032024.0,
-    "job_order_date": "2024-03-09",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2024-03-09",
-    "performed": "Yes",
-    "completion_date": "2024-03-10",
-    "completion_days": 1.0,
-    "supplier": "Sana CO",
-    "cost": 62400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 117.0,
-    "job_order_no": 5062024.0,
-    "job_order_date": "2024-06-05",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 100 Ton",
-    "requested_date": "2024-06-05",
-    "performed": "Yes",
-    "completion_date": "2024-06-08",
-    "completion_days": 3.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 12300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 118.0,
-    "job_order_no": 1042024.0,
-    "job_order_date": "2024-04-01",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Boom Truck 10 Ton Monthly rental",
-    "requested_date": "2024-04-01",
-    "performed": "Yes",
-    "completion_date": "2024-04-01",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 43240.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 119.0,
-    "job_order_no": 1052024.0,
-    "job_order_date": "2024-05-01",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Crane 50 Ton monthly reats",
-    "requested_date": "2024-05-01",
-    "performed": "Yes",
-    "completion_date": "2024-05-01",
-    "completion_days": "0",
-    "supplier": "Sana CO",
-    "cost": 60000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 120.0,
-    "job_order_no": 30052024.0,
-    "job_order_date": "2024-05-30",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Trella",
-    "requested_date": "2024-05-30",
-    "performed": "Yes",
-    "completion_date": "2024-06-01",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 6000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 121.0,
-    "job_order_no": 26062024.0,
-    "job_order_date": "2024-06-24",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-06-24",
-    "performed": "Yes",
-    "completion_date": "2024-06-24",
-    "completion_days": "0",
-    "supplier": "Awtad Alsharq",
-    "cost": 7500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 122.0,
-    "job_order_no": 22052024.0,
-    "job_order_date": "2024-05-22",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Forklift 7 Ton",
-    "requested_date": "2024-05-22",
-    "performed": "Yes",
-    "completion_date": "2024-05-23",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 51100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 123.0,
-    "job_order_no": 7052024.0,
-    "job_order_date": "2024-05-07",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Trella",
-    "requested_date": "2024-05-07",
-    "performed": "Yes",
-    "completion_date": "2024-05-13",
-    "completion_days": 6.0,
-    "supplier": "Construction Pioneer",
-    "cost": 6300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 124.0,
-    "job_order_no": 11062024.0,
-    "job_order_date": "2024-06-11",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "2 Trelles",
-    "requested_date": "2024-06-11",
-    "performed": "Yes",
-    "completion_date": "2024-06-12",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 7000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 125.0,
-    "job_order_no": 17072024.0,
-    "job_order_date": "2024-07-17",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-07-17",
-    "performed": "Yes",
-    "completion_date": "2024-07-17",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": 2200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 126.0,
-    "job_order_no": 11062024.0,
-    "job_order_date": "2024-06-11",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Trelles",
-    "requested_date": "2024-06-11",
-    "performed": "Yes",
-    "completion_date": "2024-06-12",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 7000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 127.0,
-    "job_order_no": 22072024.0,
-    "job_order_date": "2024-07-22",
-    "project": "Jafurah",
-    "requester": "M.Safdr",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-07-22",
-    "performed": "Yes",
-    "completion_date": "2024-07-23",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 128.0,
-    "job_order_no": 15092024.0,
-    "job_order_date": "2024-09-15",
-    "project": "Jafurah",
-    "requester": "Samer Essam",
-    "equipment_type": "Trelles & Forklift",
-    "requested_date": "2024-09-15",
-    "performed": "Yes",
-    "completion_date": "2024-09-15",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": 15200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 129.0,
-    "job_order_no": 12092024.0,
-    "job_order_date": "2024-09-12",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-09-12",
-    "performed": "Yes",
-    "completion_date": "2024-09-14",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 130.0,
-    "job_order_no": 28072024.0,
-    "job_order_date": "2024-07-28",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "2 manlift monthly reats",
-    "requested_date": "2024-07-28",
-    "performed": "Yes",
-    "completion_date": "2024-07-29",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 61431.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 131.0,
-    "job_order_no": 28082024.0,
-    "job_order_date": "2024-08-28",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "2 manlift monthly reats",
-    "requested_date": "2024-08-28",
-    "performed": "Yes",
-    "completion_date": "2024-08-29",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 68000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 132.0,
-    "job_order_no": 40902024.0,
-    "job_order_date": "2024-09-04",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "2 manlift monthly reats",
-    "requested_date": "2024-09-04",
-    "performed": "Yes",
-    "completion_date": "2024-09-06",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 68000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 133.0,
-    "job_order_no": 30702024.0,
-    "job_order_date": "2024-07-03",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "2 manlift monthly reats",
-    "requested_date": "2024-07-03",
-    "performed": "Yes",
-    "completion_date": "2024-07-04",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 75600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 134.0,
-    "job_order_no": 10902024.0,
-    "job_order_date": "2024-09-01",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "2 manlift monthly reats",
-    "requested_date": "2024-09-01",
-    "performed": "Yes",
-    "completion_date": "2024-09-04",
-    "completion_days": 3.0,
-    "supplier": "Construction Pioneer",
-    "cost": 71401.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 135.0,
-    "job_order_no": 40802024.0,
-    "job_order_date": "2024-08-04",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "2 manlift monthly reats",
-    "requested_date": "2024-08-04",
-    "performed": "Yes",
-    "completion_date": "2024-08-06",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 68000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 136.0,
-    "job_order_no": 28092024.0,
-    "job_order_date": "2024-09-28",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift",
-    "requested_date": "2024-09-28",
-    "performed": "Yes",
-    "completion_date": "2024-09-29",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 68000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 137.0,
-    "job_order_no": 10102024.0,
-    "job_order_date": "2024-09-04",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift",
-    "requested_date": "2024-09-04",
-    "performed": "Yes",
-    "completion_date": "2024-09-06",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 37800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 138.0,
-    "job_order_no": 25092024.0,
-    "job_order_date": "2024-09-25",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-09-25",
-    "performed": "Yes",
-    "completion_date": "2024-09-26",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 48300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 139.0,
-    "job_order_no": 24082024.0,
-    "job_order_date": "2024-08-24",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-08-24",
-    "performed": "Yes",
-    "completion_date": "2024-08-25",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 48300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 140.0,
-    "job_order_no": 24062024.0,
-    "job_order_date": "2024-06-24",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-06-24",
-    "performed": "Yes",
-    "completion_date": "2024-06-25",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 48300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 141.0,
-    "job_order_no": 24072024.0,
-    "job_order_date": "2024-07-24",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-07-24",
-    "performed": "Yes",
-    "completion_date": "2024-07-25",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 48300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 142.0,
-    "job_order_no": 28102024.0,
-    "job_order_date": "2024-10-28",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "3 Manlifts",
-    "requested_date": "2024-10-28",
-    "performed": "Yes",
-    "completion_date": "2024-10-29",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 113400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 143.0,
-    "job_order_no": 21082024.0,
-    "job_order_date": "2024-08-21",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trella",
-    "requested_date": "2024-08-21",
-    "performed": "Yes",
-    "completion_date": "2024-08-22",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 144.0,
-    "job_order_no": 5102024.0,
-    "job_order_date": "2024-10-05",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift 22 M monthly reats",
-    "requested_date": "2024-10-05",
-    "performed": "Yes",
-    "completion_date": "2024-10-09",
-    "completion_days": 4.0,
-    "supplier": "Construction Pioneer",
-    "cost": 37800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 145.0,
-    "job_order_no": 24102024.0,
-    "job_order_date": "2024-10-24",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trella",
-    "requested_date": "2024-10-24",
-    "performed": "Yes",
-    "completion_date": "2024-10-28",
-    "completion_days": 4.0,
-    "supplier": "Almamorah CO",
-    "cost": 3500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 146.0,
-    "job_order_no": 24122024.0,
-    "job_order_date": "2024-12-24",
-    "project": "Jafurah",
-    "requester": "Ali Alshehri",
-    "equipment_type": "Boom Truck to shifting generator to Jed warehouse",
-    "requested_date": "2024-12-24",
-    "performed": "Yes",
-    "completion_date": "2024-12-25",
-    "completion_days": 1.0,
-    "supplier": "Almamorah CO",
-    "cost": 8000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 147.0,
-    "job_order_no": 17122024.0,
-    "job_order_date": "2024-12-17",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-12-17",
-    "performed": "Yes",
-    "completion_date": "2024-12-19",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 2500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 148.0,
-    "job_order_no": 12122024.0,
-    "job_order_date": "2024-12-12",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-12-12",
-    "performed": "Yes",
-    "completion_date": "2024-12-14",
-    "completion_days": 2.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 2300.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 149.0,
-    "job_order_no": 25112024.0,
-    "job_order_date": "2024-11-25",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Crane 50 to & Trellas",
-    "requested_date": "2024-11-25",
-    "performed": "Yes",
-    "completion_date": "2024-11-26",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 29400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 150.0,
-    "job_order_no": 19022025.0,
-    "job_order_date": "2025-02-19",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trella",
-    "requested_date": "2025-02-19",
-    "performed": "Yes",
-    "completion_date": "2025-02-19",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": 5800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 151.0,
-    "job_order_no": 19022025.0,
-    "job_order_date": "2025-02-19",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trucks",
-    "requested_date": "2025-02-19",
-    "performed": "Yes",
-    "completion_date": "2025-02-22",
-    "completion_days": 3.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 8000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 152.0,
-    "job_order_no": 19112024.0,
-    "job_order_date": "2024-11-19",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlifts",
-    "requested_date": "2024-11-19",
-    "performed": "Yes",
-    "completion_date": "2024-11-19",
-    "completion_days": "0",
-    "supplier": "Almamorah CO",
-    "cost": 144540.2,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 153.0,
-    "job_order_no": 4122024.0,
-    "job_order_date": "2024-12-04",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift",
-    "requested_date": "2024-12-04",
-    "performed": "Yes",
-    "completion_date": "2024-12-07",
-    "completion_days": 3.0,
-    "supplier": "Almamorah CO",
-    "cost": 43604.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Under Approval Khan, Muhammad"
-  },
-  {
-    "id": 154.0,
-    "job_order_no": 4112024.0,
-    "job_order_date": "2024-11-04",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2024-11-04",
-    "performed": "Yes",
-    "completion_date": "2024-11-05",
-    "completion_days": 1.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 58650.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 155.0,
-    "job_order_no": 8012025.0,
-    "job_order_date": "2025-01-08",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift 22 M monthly reats",
-    "requested_date": "2025-01-08",
-    "performed": "Yes",
-    "completion_date": "2025-01-09",
-    "completion_days": 1.0,
-    "supplier": "Almamorah CO",
-    "cost": 29400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 156.0,
-    "job_order_no": 9012025.0,
-    "job_order_date": "2025-01-09",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift 22m",
-    "requested_date": "2025-01-09",
-    "performed": "Yes",
-    "completion_date": "2025-01-09",
-    "completion_days": "0",
-    "supplier": "Almamorah CO",
-    "cost": 29400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 157.0,
-    "job_order_no": 10022025.0,
-    "job_order_date": "2025-02-10",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Crane 50 Ton",
-    "requested_date": "2025-02-10",
-    "performed": "Yes",
-    "completion_date": "2025-02-12",
-    "completion_days": 2.0,
-    "supplier": "Almamorah CO",
-    "cost": 39600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 158.0,
-    "job_order_no": 17032025.0,
-    "job_order_date": "2025-03-17",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trella",
-    "requested_date": "2025-03-17",
-    "performed": "Yes",
-    "completion_date": "2025-03-23",
-    "completion_days": 6.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 4400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 159.0,
-    "job_order_no": 13042025.0,
-    "job_order_date": "2025-04-13",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Diyanna",
-    "requested_date": "2025-04-13",
-    "performed": "Yes",
-    "completion_date": "2025-04-14",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 3000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Waiting the supplier to modify the amount"
-  },
-  {
-    "id": 160.0,
-    "job_order_no": 26082024.0,
-    "job_order_date": "2024-08-26",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trella",
-    "requested_date": "2024-08-26",
-    "performed": "Yes",
-    "completion_date": "2024-08-29",
-    "completion_days": 3.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 161.0,
-    "job_order_no": 11032025.0,
-    "job_order_date": "2025-03-11",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Excavator",
-    "requested_date": "2025-03-11",
-    "performed": "Yes",
-    "completion_date": "2025-03-20",
-    "completion_days": 9.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 22600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 162.0,
-    "job_order_no": 17042025.0,
-    "job_order_date": "2025-04-17",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "manlift & Crane 50 Ton",
-    "requested_date": "2025-04-17",
-    "performed": "Yes",
-    "completion_date": "2025-04-19",
-    "completion_days": 2.0,
-    "supplier": "World Green",
-    "cost": 36500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 163.0,
-    "job_order_no": 24102024.0,
-    "job_order_date": "2024-10-24",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-10-24",
-    "performed": "Yes",
-    "completion_date": "2024-10-26",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 8400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 164.0,
-    "job_order_no": 17122024.0,
-    "job_order_date": "2024-12-17",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift 22M & 26M",
-    "requested_date": "2024-12-17",
-    "performed": "Yes",
-    "completion_date": "2024-12-21",
-    "completion_days": 4.0,
-    "supplier": "Construction Pioneer",
-    "cost": 127700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Under approval from Mr. Al-Sunaid, Salah"
-  },
-  {
-    "id": 165.0,
-    "job_order_no": 28042025.0,
-    "job_order_date": "2025-04-28",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Forklift 7 Ton",
-    "requested_date": "2025-04-28",
-    "performed": "Yes",
-    "completion_date": "2025-05-04",
-    "completion_days": 6.0,
-    "supplier": "Awtad Alsharq",
-    "cost": 36700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Reject from Mr. Abas, Mohammed"
-  },
-  {
-    "id": 166.0,
-    "job_order_no": 24122025.0,
-    "job_order_date": "2024-12-24",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Trella & forklirt 3 Ton",
-    "requested_date": "2024-12-24",
-    "performed": "Yes",
-    "completion_date": "2024-12-25",
-    "completion_days": 1.0,
-    "supplier": "Almamorah CO",
-    "cost": 6200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 167.0,
-    "job_order_no": 21122024.0,
-    "job_order_date": "2024-12-21",
-    "project": "Jafurah",
-    "requester": "Mohamed Safdar",
-    "equipment_type": "Diyanna",
-    "requested_date": "2024-12-21",
-    "performed": "Yes",
-    "completion_date": "2025-01-07",
-    "completion_days": 17.0,
-    "supplier": "Almamorah CO",
-    "cost": 2700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 168.0,
-    "job_order_no": 17062025.0,
-    "job_order_date": "2025-06-17",
-    "project": "Jafurah",
-    "requester": "Safder",
-    "equipment_type": "Manlift 22M & Crane 50 Ton",
-    "requested_date": "2025-06-17",
-    "performed": "Yes",
-    "completion_date": "2025-06-22",
-    "completion_days": 5.0,
-    "supplier": "FIFO Transportation",
-    "cost": 47000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Under Approval Mr. AlShehri, Ali"
-  },
-  {
-    "id": 169.0,
-    "job_order_no": 5062024.0,
-    "job_order_date": "2024-06-05",
-    "project": "ALMURJAN",
-    "requester": "Ahmed Alkhider",
-    "equipment_type": "Boom Truck 3 Ton",
-    "requested_date": "2024-06-05",
-    "performed": "Yes",
-    "completion_date": "2024-06-06",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 170.0,
-    "job_order_no": 30052024.0,
-    "job_order_date": "2024-05-30",
-    "project": "ALMURJAN",
-    "requester": "Ahmed Alkhider",
-    "equipment_type": "Crane &Trelles &Forklift",
-    "requested_date": "2024-05-30",
-    "performed": "Yes",
-    "completion_date": "2024-05-30",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": 29800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 171.0,
-    "job_order_no": 130122023.0,
-    "job_order_date": "2023-12-13",
-    "project": "ALMURJAN",
-    "requester": "Eng.Ahmed",
-    "equipment_type": "Boom Truck 10 Ton TRUCK",
-    "requested_date": "2023-12-13",
-    "performed": "Yes",
-    "completion_date": "2023-12-18",
-    "completion_days": 5.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 3400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 172.0,
-    "job_order_no": 2401220233.0,
-    "job_order_date": "2023-12-24",
-    "project": "ALMURJAN",
-    "requester": "Eng.Ahmed",
-    "equipment_type": "LOBAD",
-    "requested_date": "2023-12-24",
-    "performed": "Yes",
-    "completion_date": "2023-12-25",
-    "completion_days": 1.0,
-    "supplier": "Al-Buraq CO",
-    "cost": 1610.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 173.0,
-    "job_order_no": 2701220233.0,
-    "job_order_date": "2023-12-27",
-    "project": "ALMURJAN",
-    "requester": "Eng.Ahmed",
-    "equipment_type": "LOBAD (Return)",
-    "requested_date": "2023-12-27",
-    "performed": "Yes",
-    "completion_date": "2023-12-27",
-    "completion_days": "0",
-    "supplier": "Al-Buraq CO",
-    "cost": 1610.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 174.0,
-    "job_order_no": 26052024.0,
-    "job_order_date": "2024-05-26",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Boom Truck 10 Ton",
-    "requested_date": "2024-05-26",
-    "performed": "Yes",
-    "completion_date": "2024-05-26",
-    "completion_days": "0",
-    "supplier": "Awtad Alsharq",
-    "cost": 1400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 175.0,
-    "job_order_no": 3072024.0,
-    "job_order_date": "2024-07-03",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift 3 Ton",
-    "requested_date": "2024-07-03",
-    "performed": "Yes",
-    "completion_date": "2024-07-04",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3220.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 176.0,
-    "job_order_no": 30062024.0,
-    "job_order_date": "2024-06-30",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & Labors",
-    "requested_date": "2024-06-30",
-    "performed": "Yes",
-    "completion_date": "2024-07-01",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 5600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 177.0,
-    "job_order_no": 6062024.0,
-    "job_order_date": "2024-06-06",
-    "project": "ALMURJAN",
-    "requester": "Ahmad Alkhedir",
-    "equipment_type": "Diyanna 5 Ton",
-    "requested_date": "2024-06-06",
-    "performed": "Yes",
-    "completion_date": "2024-06-09",
-    "completion_days": 3.0,
-    "supplier": "Construction Pioneer",
-    "cost": 1700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 178.0,
-    "job_order_no": 22102024.0,
-    "job_order_date": "2024-10-22",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & Crane 50 Ton",
-    "requested_date": "2024-10-22",
-    "performed": "Yes",
-    "completion_date": "2024-10-26",
-    "completion_days": 4.0,
-    "supplier": "Construction Pioneer",
-    "cost": 12100.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 179.0,
-    "job_order_no": 27062024.0,
-    "job_order_date": "2024-06-27",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & loder",
-    "requested_date": "2024-06-27",
-    "performed": "Yes",
-    "completion_date": "2024-06-27",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": 12800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 180.0,
-    "job_order_no": 30062024.0,
-    "job_order_date": "2024-06-30",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & loder",
-    "requested_date": "2024-06-30",
-    "performed": "Yes",
-    "completion_date": "2024-07-01",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 13400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 181.0,
-    "job_order_no": 3082024.0,
-    "job_order_date": "2024-08-03",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & trellies",
-    "requested_date": "2024-08-03",
-    "performed": "Yes",
-    "completion_date": "2024-08-05",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 10600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 182.0,
-    "job_order_no": 3082024.0,
-    "job_order_date": "2024-08-03",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & trellies",
-    "requested_date": "2024-08-03",
-    "performed": "Yes",
-    "completion_date": "2024-08-03",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": 16200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 183.0,
-    "job_order_no": 27102024.0,
-    "job_order_date": "2024-10-27",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & Labors",
-    "requested_date": "2024-10-27",
-    "performed": "Yes",
-    "completion_date": "2024-10-29",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 184.0,
-    "job_order_no": 27102024.0,
-    "job_order_date": "2024-10-27",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "CRAIN 50 T",
-    "requested_date": "2024-10-27",
-    "performed": "Yes",
-    "completion_date": "2024-10-28",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2500.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 185.0,
-    "job_order_no": 80902024.0,
-    "job_order_date": "2024-09-08",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift 16 Ton",
-    "requested_date": "2024-09-08",
-    "performed": "Yes",
-    "completion_date": "2024-09-09",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 4700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 186.0,
-    "job_order_no": 290802024.0,
-    "job_order_date": "2024-08-29",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Trilles & loader & Forklift 3 Ton",
-    "requested_date": "2024-08-29",
-    "performed": "Yes",
-    "completion_date": "2024-08-31",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 15200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 187.0,
-    "job_order_no": 291002024.0,
-    "job_order_date": "2024-10-29",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "forrklift 10 Ton",
-    "requested_date": "2024-10-29",
-    "performed": "Yes",
-    "completion_date": "2024-10-30",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 5200.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 188.0,
-    "job_order_no": 291002024.0,
-    "job_order_date": "2024-10-29",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift 5 Ton & Labors",
-    "requested_date": "2024-10-29",
-    "performed": "Yes",
-    "completion_date": "2024-10-30",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3000.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 189.0,
-    "job_order_no": 20112024.0,
-    "job_order_date": "2024-11-03",
-    "project": "ALMURJAN",
-    "requester": "Ahmed Alashawa",
-    "equipment_type": "Forklift 10 Ton",
-    "requested_date": "2024-11-03",
-    "performed": "Yes",
-    "completion_date": "2024-11-04",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 190.0,
-    "job_order_no": 10902024.0,
-    "job_order_date": "2024-09-01",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Trelles & Forklift",
-    "requested_date": "2024-09-01",
-    "performed": "Yes",
-    "completion_date": "2024-09-02",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 5600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 191.0,
-    "job_order_no": 70902024.0,
-    "job_order_date": "2024-09-07",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift",
-    "requested_date": "2024-09-07",
-    "performed": "Yes",
-    "completion_date": "2024-09-08",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 4700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 192.0,
-    "job_order_no": 2092024.0,
-    "job_order_date": "2024-09-02",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Trelles & Forklift",
-    "requested_date": "2024-09-02",
-    "performed": "Yes",
-    "completion_date": "2024-09-03",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 5600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 193.0,
-    "job_order_no": 3092024.0,
-    "job_order_date": "2024-09-03",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Two Forklift+two trailers+4 workers",
-    "requested_date": "2024-09-04",
-    "performed": "Yes",
-    "completion_date": "2024-09-04",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": "SAR 5,600.00",
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 194.0,
-    "job_order_no": 4092024.0,
-    "job_order_date": "2024-09-04",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklif 16 Ton +two workers",
-    "requested_date": "2024-09-04",
-    "performed": "Yes",
-    "completion_date": "2024-09-04",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": "SAR 4,700.00",
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 195.0,
-    "job_order_no": 31082024.0,
-    "job_order_date": "2024-08-31",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Workers +two Forklifte +4 trailers",
-    "requested_date": "2024-09-01",
-    "performed": "Yes",
-    "completion_date": "2024-09-01",
-    "completion_days": "0",
-    "supplier": "Construction Pioneer",
-    "cost": "SAR 11,600.00",
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 196.0,
-    "job_order_no": 7092024.0,
-    "job_order_date": "2024-09-07",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "froklift&Boom Truck&trellas",
-    "requested_date": "2024-09-07",
-    "performed": "Yes",
-    "completion_date": "2024-09-10",
-    "completion_days": 3.0,
-    "supplier": "Construction Pioneer",
-    "cost": 19600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 197.0,
-    "job_order_no": 24092024.0,
-    "job_order_date": "2024-09-24",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & trellas & Boom Truck & Labors",
-    "requested_date": "2024-09-24",
-    "performed": "Yes",
-    "completion_date": "2024-09-28",
-    "completion_days": 4.0,
-    "supplier": "Construction Pioneer",
-    "cost": 19600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 198.0,
-    "job_order_no": 13102024.0,
-    "job_order_date": "2024-10-13",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift & Labors",
-    "requested_date": "2024-10-13",
-    "performed": "Yes",
-    "completion_date": "2024-10-14",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2800.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 199.0,
-    "job_order_no": 10102024.0,
-    "job_order_date": "2024-10-10",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Forklift 3 Ton & Labors",
-    "requested_date": "2024-10-10",
-    "performed": "Yes",
-    "completion_date": "2024-10-12",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2700.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 200.0,
-    "job_order_no": 13082024.0,
-    "job_order_date": "2024-08-13",
-    "project": "ALMURJAN",
-    "requester": "Ahmed Tosson",
-    "equipment_type": "Forklift 10 Ton",
-    "requested_date": "2024-08-13",
-    "performed": "Yes",
-    "completion_date": "2024-08-14",
-    "completion_days": 1.0,
-    "supplier": "Construction Pioneer",
-    "cost": 3600.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  },
-  {
-    "id": 201.0,
-    "job_order_no": 15102024.0,
-    "job_order_date": "2024-10-15",
-    "project": "ALMURJAN",
-    "requester": "Dia Saleh",
-    "equipment_type": "Labors",
-    "requested_date": "2024-10-15",
-    "performed": "Yes",
-    "completion_date": "2024-10-17",
-    "completion_days": 2.0,
-    "supplier": "Construction Pioneer",
-    "cost": 2400.0,
-    "invoice_applicable": "Yes",
-    "invoice_received": "Yes",
-    "payment_status": "Paid"
-  }
-];
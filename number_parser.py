@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Number parsing shared by the sync scripts
+Native numbers take a fast path, text such as "1,500 SAR" is cleaned and
+memoized, and whole columns are parsed once per distinct value
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# Currency codes and symbols, thousands separators, whitespace and any other
+# decoration around the digits, sign and decimal point
+_NON_NUMERIC = re.compile(r"[^\d.\-]")
+
+
+@lru_cache(maxsize=8192)
+def _parse_text(text):
+    cleaned = _NON_NUMERIC.sub("", text)
+    if not cleaned:
+        return None
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def parse_number(value, default=0.0):
+    """Parse a cell value such as 1500, "1,500" or "SAR 1,500.00" into a float
+
+    Returns default for empty cells and text without a readable number.
+    """
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    number = _parse_text(str(value))
+    return default if number is None else number
+
+
+def parse_array(values, parse=parse_number):
+    """Parse a whole column into a float array, calling parse once per distinct value"""
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int64)
+    parsed = np.fromiter((parse(v) for v in index), dtype=np.float64, count=len(index))
+    return parsed[codes]
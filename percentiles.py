@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Duration percentiles for the SLA dashboards
+Exact quantiles of a single run use O(n) selection; per-month KLL sketches
+are persisted between runs so any span of months is answered by merging
+a few small sketches instead of re-sorting the full history
+"""
+
+import os
+import math
+import json
+import gzip
+from datetime import datetime
+
+import numpy as np
+
+from daily_bins import month_key, month_window, stale_months
+from sla_config import ON_TIME_DAYS
+from sync_state import SYNC_CACHE_DIR
+
+SKETCH_DIR = os.path.join(SYNC_CACHE_DIR, "sketches")
+
+# Percentiles published for durations
+PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+
+# Trailing calendar-month spans, ending this month, answered from merged sketches
+TRAILING_SPANS = (3, 12)
+
+# KLL accuracy parameter; exact while a month holds fewer values than this
+DEFAULT_K = 200
+
+
+def rank_index(q, n):
+    """0-based nearest-rank index of quantile q among n sorted values"""
+    # Rounding first keeps products such as 0.7 * 10 from landing a rank too high
+    return min(max(math.ceil(round(q * n, 9)) - 1, 0), n - 1)
+
+
+def position_index(q, n):
+    """0-based index int(q * n) of quantile q among n sorted values
+
+    The summary median and p90 have always been read this way; it takes the
+    upper middle value for an even n, where nearest rank takes the lower.
+    """
+    return min(int(q * n), n - 1)
+
+
+def select_quantiles(values, qs, index=rank_index):
+    """Exact quantiles by O(n) selection instead of a full sort
+
+    index(q, n) picks each quantile's position, nearest rank by default.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if not n:
+        return [None] * len(qs)
+    ranks = [index(q, n) for q in qs]
+    selected = np.partition(values, sorted(set(ranks)))
+    return [float(selected[r]) for r in ranks]
+
+
+def grouped_duration_stats(codes, categories, values, on_time_days=ON_TIME_DAYS, on_time=None):
+    """p50, p90, max and on-time rate of the durations in every group
+
+    codes assigns each value to a category. The values are sorted once by
+    (group, duration) so every group's quantiles are read from its slice by
+    index arithmetic, without a Python loop per group. on_time overrides the
+    values <= on_time_days rule with a precomputed mask. Groups are returned
+    largest first, ties in category order.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return {}
+
+    counts = np.bincount(codes, minlength=len(categories))
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    sorted_values = values[np.lexsort((values, codes))]
+
+    def at_rank(q):
+        ranks = np.ceil(np.round(q * counts, 9)).astype(np.int64) - 1
+        index = starts + np.clip(ranks, 0, None)
+        return sorted_values[np.clip(index, 0, len(values) - 1)]
+
+    p50 = at_rank(0.5)
+    p90 = at_rank(0.9)
+    maximum = sorted_values[np.clip(ends - 1, 0, len(values) - 1)]
+    if on_time is None:
+        on_time = values <= on_time_days
+    on_time = np.bincount(codes, weights=on_time, minlength=len(categories))
+
+    groups = np.flatnonzero(counts)
+    groups = groups[np.argsort(-counts[groups], kind="stable")]
+    return {
+        categories[g]: {
+            "orders": int(counts[g]),
+            "p50": round(float(p50[g]), 2),
+            "p90": round(float(p90[g]), 2),
+            "max": round(float(maximum[g]), 2),
+            "on_time_rate": round(float(on_time[g]) / int(counts[g]) * 100, 1),
+        }
+        for g in groups.tolist()
+    }
+
+
+class KLLSketch:
+    """Mergeable KLL quantile sketch (Karnin, Lang & Liberty)
+
+    Compaction alternates the kept half per level instead of flipping a
+    coin, so the same input always yields the same sketch.
+    """
+
+    def __init__(self, k=DEFAULT_K, levels=None, offsets=None):
+        self.k = k
+        self.levels = levels or [[]]
+        self.offsets = offsets or [0] * len(self.levels)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _size(self):
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self):
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _grow(self):
+        self.levels.append([])
+        self.offsets.append(0)
+
+    def _compress(self):
+        while self._size() >= self._max_size():
+            for level, items in enumerate(self.levels):
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self._grow()
+                items.sort()
+                leftover = [items.pop()] if len(items) % 2 else []
+                offset = self.offsets[level]
+                self.offsets[level] ^= 1
+                self.levels[level + 1].extend(items[offset::2])
+                self.levels[level] = leftover
+                break
+
+    def extend(self, values):
+        self.levels[0].extend(float(v) for v in values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch into this one"""
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self._compress()
+        return self
+
+    def count(self):
+        return sum(len(items) << level for level, items in enumerate(self.levels))
+
+    def quantiles(self, qs):
+        """Nearest-rank quantiles; exact while nothing has been compacted"""
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.levels)
+            for value in items
+        )
+        if not weighted:
+            return [None] * len(qs)
+        values = np.array([value for value, _ in weighted])
+        cumulative = np.cumsum([weight for _, weight in weighted])
+        total = int(cumulative[-1])
+        return [
+            float(values[np.searchsorted(cumulative, rank_index(q, total) + 1)])
+            for q in qs
+        ]
+
+    def to_dict(self):
+        return {"k": self.k, "levels": self.levels, "offsets": self.offsets}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["k"], [list(items) for items in data["levels"]], list(data["offsets"])
+        )
+
+
+def _digest(values):
+    """Cheap content check used to decide whether a month's sketch is stale"""
+    return [len(values), float(values.sum()), float((values * values).sum())]
+
+
+class MonthlySketches:
+    """Per-month duration sketches for one consumer of one sheet, persisted between runs"""
+
+    def __init__(self, path):
+        self.path = path
+        self.months = {}
+
+    @classmethod
+    def load(cls, consumer, sheet_id, persist=True):
+        """Load the sketches; persist=False keeps them in memory only (replays)"""
+        if not persist:
+            return cls(None)
+        sketches = cls(os.path.join(SKETCH_DIR, f"{consumer}-{sheet_id}.json.gz"))
+        try:
+            with gzip.open(sketches.path, "rt", encoding="utf-8") as f:
+                sketches.months = json.load(f)
+        except (OSError, ValueError):
+            pass
+        return sketches
+
+    def save(self):
+        """Write the sketches atomically"""
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(self.months, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def refresh(self, months, values, today=None):
+        """Rebuild the sketches of months whose durations changed since the last run
+
+        months and values are parallel arrays; rows without a valid "YYYY-MM"
+        month inside daily_bins.month_window are ignored, and months the rows
+        no longer fall in are dropped. Returns the number of months rebuilt.
+        """
+        window = month_window(today)
+        months = np.array([month_key(m, window) for m in months], dtype=object)
+        values = np.asarray(values, dtype=np.float64)
+        has_month = np.fromiter(
+            (m is not None for m in months), dtype=bool, count=len(months)
+        )
+        months, values = months[has_month], values[has_month]
+
+        grouped = {}
+        for month, value in zip(months.tolist(), values.tolist()):
+            grouped.setdefault(month, []).append(value)
+        current = {month: np.array(v) for month, v in grouped.items()}
+
+        rebuilt = 0
+        for month, month_values in current.items():
+            digest = _digest(month_values)
+            stored = self.months.get(month)
+            if stored is None or stored["digest"] != digest:
+                sketch = KLLSketch().extend(month_values)
+                self.months[month] = {"digest": digest, "sketch": sketch.to_dict()}
+                rebuilt += 1
+        for month in stale_months(self.months, current, window):
+            del self.months[month]
+        return rebuilt
+
+    def merged(self, months):
+        """One sketch covering the given months"""
+        sketch = KLLSketch()
+        for month in months:
+            if month in self.months:
+                sketch.merge(KLLSketch.from_dict(self.months[month]["sketch"]))
+        return sketch
+
+    def span(self, first, last):
+        """Count and percentiles of the months first..last ("YYYY-MM", inclusive)"""
+        sketch = self.merged(month for month in sorted(self.months) if first <= month <= last)
+        return {"count": sketch.count(), **_named(sketch.quantiles([q for _, q in PERCENTILES]))}
+
+    def published(self):
+        """{month: levels} of every sketch, for NesmaSketches (assets/nesma-utils.js)
+
+        Level i holds values that each stand for 2**i durations.
+        """
+        return {
+            month: [
+                [round(value, 2) for value in items]
+                for items in self.months[month]["sketch"]["levels"]
+            ]
+            for month in sorted(self.months)
+        }
+
+
+def _named(quantiles):
+    return {
+        name: None if value is None else round(value, 2)
+        for (name, _), value in zip(PERCENTILES, quantiles)
+    }
+
+
+def duration_percentiles(values, months, sketches, today=None):
+    """Overall, per-month and trailing-span duration percentiles
+
+    Overall figures are exact; monthly and trailing figures come from the
+    persisted per-month sketches, refreshed for the months that changed.
+    Trailing spans are the calendar months up to today's. The sketches
+    themselves are published too, so dashboards can answer any span of
+    months.
+    """
+    qs = [q for _, q in PERCENTILES]
+    rebuilt = sketches.refresh(months, values, today)
+    ordered = sorted(sketches.months)
+    print(f"Duration sketches: rebuilt {rebuilt} of {len(ordered)} months")
+
+    monthly = []
+    for month in ordered:
+        sketch = sketches.merged([month])
+        monthly.append(
+            {"month": month, "count": sketch.count(), **_named(sketch.quantiles(qs))}
+        )
+
+    this_month = np.datetime64(today or datetime.utcnow().date(), "M")
+    trailing = {
+        f"last_{span}_months": sketches.span(str(this_month - (span - 1)), str(this_month))
+        for span in TRAILING_SPANS
+    }
+
+    return {
+        "overall": {"count": len(values), **_named(select_quantiles(values, qs))},
+        "monthly": monthly,
+        "trailing": trailing,
+        "sketches": sketches.published(),
+    }
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Publishing of dashboard data files
+Data is written as minified JSON with gzip and brotli sidecars at maximum
+compression, so static hosts can serve the precompressed bytes as they are;
+an indented copy for reading is written only when PUBLISH_PRETTY is set.
+Every file also gets a content-hashed copy listed in data/manifest.json,
+so only the manifest needs revalidating. Script datasets are split into
+one module per dataset behind a manifest, with sub-objects repeated
+across datasets moved to a shared module. Record arrays can be published
+in column form, with repeated strings stored once in a string table
+"""
+
+import os
+import re
+import gzip
+import json
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # .br sidecars are skipped without the brotli package
+
+from record_table import CategoricalColumn
+
+# Debug flag: also write <name>.pretty<ext> with indented JSON
+PRETTY = os.environ.get("PUBLISH_PRETTY", "").lower() not in ("", "0", "false", "no")
+
+# Publish the record arrays writers name in columns= in column form
+COLUMNAR = os.environ.get("PUBLISH_COLUMNAR", "").lower() not in ("", "0", "false", "no")
+
+# Most distinct values, as a share of rows, for a string column to get a string table
+LEVELS_RATIO = 0.5
+
+# Published paths are recorded relative to the site root in its manifest
+SITE_ROOT = os.environ.get("PUBLISH_ROOT", os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(SITE_ROOT, "data", "manifest.json")
+
+# Hex digits of the content hash in published file names
+HASH_LENGTH = 10
+
+
+def dumps(data, pretty=False):
+    """JSON text of data, minified unless pretty"""
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def pretty_path(path):
+    root, ext = os.path.splitext(path)
+    return f"{root}.pretty{ext}"
+
+
+def _write_bytes(path, payload):
+    """Write payload atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _write_compressed(path, payload):
+    """Write payload at path with its .gz and .br sidecars"""
+    _write_bytes(path, payload)
+    # mtime=0 keeps the gzip bytes identical when the data is unchanged
+    _write_bytes(f"{path}.gz", gzip.compress(payload, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_bytes(f"{path}.br", brotli.compress(payload, quality=11))
+    elif os.path.exists(f"{path}.br"):
+        # A sidecar left from an earlier run would be served stale
+        os.remove(f"{path}.br")
+
+
+def site_path(path):
+    """path relative to the site root, with forward slashes"""
+    return os.path.relpath(os.path.abspath(path), SITE_ROOT).replace(os.sep, "/")
+
+
+def versioned_path(path, payload):
+    """path with a hash of its content before the extension"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def _remove_old_versions(path, current):
+    """Delete earlier content-hashed copies of path and their sidecars"""
+    directory = os.path.dirname(path) or "."
+    root, ext = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(
+        rf"{re.escape(root)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(ext)}(\.gz|\.br)?$"
+    )
+    keep = os.path.basename(current)
+    for name in os.listdir(directory):
+        if pattern.match(name) and not name.startswith(keep):
+            os.remove(os.path.join(directory, name))
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """The {"files": {plain path: hashed path}} map, empty if missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    _write_bytes(
+        MANIFEST_PATH,
+        json.dumps(manifest, ensure_ascii=False, sort_keys=True, indent=1).encode("utf-8"),
+    )
+
+
+def _record_version(path, current):
+    manifest = load_manifest()
+    manifest.setdefault("files", {})[site_path(path)] = site_path(current)
+    _save_manifest(manifest)
+
+
+def rebuild_manifest(directory=None):
+    """Rewrite the site manifest from the published files on disk
+
+    Every plain file the manifest lists, or that has content-hashed copies
+    under directory (the manifest's own by default), is listed under the
+    copy of its current content, which is written if missing; copies of
+    earlier content are removed. Used after rebasing data commits, whose
+    manifests can differ. Returns the manifest.
+    """
+    directory = directory or os.path.dirname(MANIFEST_PATH)
+    hashed = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}$")
+    files = {}
+    for folder, _, names in os.walk(directory):
+        for name in names:
+            root, ext = os.path.splitext(name)
+            plain = os.path.join(folder, hashed.sub("", root) + ext)
+            if plain == os.path.join(folder, name) or not os.path.exists(plain):
+                continue
+            if os.path.abspath(plain) == os.path.abspath(MANIFEST_PATH):
+                continue
+            files[site_path(plain)] = plain
+    for key in load_manifest().get("files", {}):
+        plain = os.path.join(SITE_ROOT, key)
+        if os.path.exists(plain):
+            files[key] = plain
+    manifest = {"files": {}}
+    for key, plain in sorted(files.items()):
+        with open(plain, "rb") as f:
+            payload = f.read()
+        current = versioned_path(plain, payload)
+        if not os.path.exists(current):
+            _write_compressed(current, payload)
+        _remove_old_versions(plain, current)
+        manifest["files"][key] = site_path(current)
+    _save_manifest(manifest)
+    return manifest
+
+
+def write_text(path, text, pretty_text=None, listed=True):
+    """Publish text at path and at a content-hashed copy, each with .gz and .br sidecars
+
+    The hashed copy can be cached indefinitely; listed records it in the
+    site manifest, which dashboards revalidate to find the current copy.
+    Unlisted files are only reached by hashed name through another
+    manifest, so they get no plain copy. Earlier hashed copies are removed.
+    pretty_text() gives the debug copy and is only called when PRETTY is
+    set. Returns the hashed copy's path.
+    """
+    payload = text.encode("utf-8")
+    current = versioned_path(path, payload)
+    _write_compressed(current, payload)
+    _remove_old_versions(path, current)
+    if listed:
+        _write_compressed(path, payload)
+        _record_version(path, current)
+    if PRETTY and pretty_text is not None:
+        _write_bytes(pretty_path(path), pretty_text().encode("utf-8"))
+    return current
+
+
+def columnar(records, levels_ratio=LEVELS_RATIO):
+    """Column form of a list of record dicts, decoded by NesmaColumns (assets/nesma-utils.js)
+
+    {"columnar": 1, "rows": n, "fields": [...], "columns": {field: column}}
+    where a column is the list of its values or, for text fields with few
+    distinct values, {"strings": [distinct values], "codes": [index per row]}.
+    A field missing from a record comes back as null.
+    """
+    fields = list(dict.fromkeys(key for record in records for key in record))
+    columns = {}
+    for field in fields:
+        values = [record.get(field) for record in records]
+        if all(value is None or isinstance(value, str) for value in values):
+            column = CategoricalColumn.encode(values)
+            if len(column.categories) <= levels_ratio * len(values):
+                columns[field] = {"strings": column.categories, "codes": column.codes.tolist()}
+                continue
+        columns[field] = values
+    return {"columnar": 1, "rows": len(records), "fields": fields, "columns": columns}
+
+
+def with_columns(data, names):
+    """Copy of data with the record arrays under names in column form"""
+    return {
+        key: columnar(value) if key in names and isinstance(value, list) else value
+        for key, value in data.items()
+    }
+
+
+def write_json(path, data, listed=True, columns=()):
+    """Publish data as minified JSON with compressed sidecars and a hashed copy
+
+    columns names top-level record arrays published in column form when
+    COLUMNAR is set; the debug copy keeps them as rows.
+    """
+    published = with_columns(data, columns) if COLUMNAR and columns else data
+    return write_text(path, dumps(published), lambda: dumps(data, pretty=True), listed)
+
+
+def write_modules(directory, datasets, header=""):
+    """Publish script datasets as separate modules listed in a manifest.json
+
+    datasets maps a module name to (global name, data). Each module calls
+    NesmaData.define (assets/nesma-utils.js) to set its global; top-level
+    values repeated across datasets are defined once by a "shared" module
+    that the manifest lists under "requires". Returns the manifest.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    # Serialized non-empty top-level objects and arrays of each dict dataset
+    texts = {
+        name: {
+            key: dumps(value)
+            for key, value in data.items()
+            if isinstance(value, (dict, list)) and value
+        }
+        for name, (_, data) in datasets.items()
+        if isinstance(data, dict)
+    }
+    users = {}
+    for name, parts in texts.items():
+        for key, text in parts.items():
+            users.setdefault(text, {}).setdefault(name, key)
+    shared = {}
+    values = {}
+    for text, used_by in users.items():
+        if len(used_by) > 1:
+            name, key = next(iter(used_by.items()))
+            part = f"{key}-{hashlib.sha1(text.encode('utf-8')).hexdigest()[:8]}"
+            shared[text] = part
+            values[part] = datasets[name][1][key]
+
+    modules = {}
+    if values:
+        def render_shared(pretty=False):
+            return f"{header}NesmaData.share({dumps(values, pretty)});\n"
+
+        text = render_shared()
+        path = write_text(
+            os.path.join(directory, "shared.js"), text, lambda: render_shared(True), listed=False
+        )
+        modules["shared"] = {"path": os.path.basename(path), "bytes": len(text.encode("utf-8"))}
+
+    for name, (global_name, data) in datasets.items():
+        refs = {
+            key: shared[text] for key, text in texts.get(name, {}).items() if text in shared
+        }
+        if isinstance(data, dict):
+            own = {key: value for key, value in data.items() if key not in refs}
+            args = (own, refs, list(data))
+        else:
+            args = (data,)
+
+        def render(pretty=False, global_name=global_name, args=args):
+            parts = ", ".join(dumps(arg, pretty) for arg in args)
+            return f"{header}NesmaData.define({dumps(global_name)}, {parts});\n"
+
+        text = render()
+        path = write_text(
+            os.path.join(directory, f"{name}.js"), text, lambda render=render: render(True), listed=False
+        )
+        modules[name] = {
+            "path": os.path.basename(path),
+            "global": global_name,
+            "bytes": len(text.encode("utf-8")),
+        }
+        if refs:
+            modules[name]["requires"] = ["shared"]
+
+    manifest = {"modules": modules}
+    write_json(os.path.join(directory, "manifest.json"), manifest)
+    return manifest
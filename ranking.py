@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Leaderboard rankings for the dashboards
+Top-N lists of a single run are exact and heap-selected in O(n log N);
+per-month Space-Saving heavy-hitter summaries are persisted between runs so
+leaders over every month are kept up to date without storing every key ever seen
+"""
+
+import os
+import json
+import gzip
+import heapq
+import hashlib
+
+import numpy as np
+
+from daily_bins import month_key, month_window, stale_months
+from sync_state import SYNC_CACHE_DIR
+
+LEADERS_DIR = os.path.join(SYNC_CACHE_DIR, "leaders")
+
+# Counters kept per summary; exact while a month has fewer distinct keys than this
+DEFAULT_CAPACITY = 100
+
+
+def top_k(values, k=None):
+    """Indices of the k largest values, largest first, ties in index order
+
+    Without k every index is returned in that order.
+    """
+    values = np.asarray(values)
+    if k is None or k >= len(values):
+        return np.argsort(-values, kind="stable")
+    items = values.tolist()
+    return np.array(
+        heapq.nlargest(k, range(len(items)), key=lambda i: (items[i], -i)),
+        dtype=np.int64,
+    )
+
+
+def _number(value):
+    return int(value) if float(value).is_integer() else round(value, 2)
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter summary (Metwally, Agrawal & El Abbadi)
+
+    Holds at most capacity counters of [estimate, error]; every estimate
+    overshoots the key's true weight by at most its error, and any key
+    heavier than the smallest estimate is guaranteed to be kept.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, counters=None):
+        self.capacity = capacity
+        self.counters = counters if counters is not None else {}
+
+    def _floor(self):
+        """Smallest estimate once full: the most an untracked key can weigh"""
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(count for count, _ in self.counters.values())
+
+    def add(self, key, weight=1):
+        """Count weight (positive) for key, evicting the smallest counter when full"""
+        counter = self.counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+        elif len(self.counters) < self.capacity:
+            self.counters[key] = [weight, 0]
+        else:
+            victim = min(self.counters, key=lambda k: self.counters[k][0])
+            floor = self.counters.pop(victim)[0]
+            self.counters[key] = [floor + weight, floor]
+        return self
+
+    def extend(self, keys, weights=None):
+        """Add each key with its weight; weights None counts each key once"""
+        keys = list(keys)
+        for key, weight in zip(keys, [1] * len(keys) if weights is None else weights):
+            self.add(key, weight)
+        return self
+
+    def merge(self, other):
+        """Fold another summary into this one, keeping the heaviest counters
+
+        A key missing from a full summary is credited with that summary's
+        smallest estimate as both weight and error, so bounds still hold.
+        """
+        floors = self._floor(), other._floor()
+        merged = {}
+        for key in [*self.counters, *(k for k in other.counters if k not in self.counters)]:
+            count = 0
+            error = 0
+            for summary, floor in zip((self, other), floors):
+                c, e = summary.counters.get(key, (floor, floor))
+                count += c
+                error += e
+            merged[key] = [count, error]
+        keys = list(merged)
+        keep = top_k([merged[k][0] for k in keys], self.capacity)
+        self.counters = {keys[i]: merged[keys[i]] for i in sorted(keep.tolist())}
+        return self
+
+    def top(self, limit=None):
+        """[(key, estimate, error)] heaviest first, ties in insertion order"""
+        keys = list(self.counters)
+        order = top_k([self.counters[k][0] for k in keys], limit)
+        return [(keys[i], *self.counters[keys[i]]) for i in order]
+
+    def to_dict(self):
+        return {
+            "capacity": self.capacity,
+            "counters": [[key, count, error] for key, (count, error) in self.counters.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["capacity"],
+            {key: [count, error] for key, count, error in data["counters"]},
+        )
+
+
+def _digest(pairs):
+    """Content hash of a month's (key, weight) rows, to tell whether it changed"""
+    text = json.dumps(sorted(pairs), separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class MonthlyHeavyHitters:
+    """Per-month heavy-hitter summaries of named series, persisted between runs
+
+    Only months the source rows still fall in are kept, so re-dated rows and
+    corrected typo months are not counted twice.
+    """
+
+    def __init__(self, path, capacity=DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.series = {}
+
+    @classmethod
+    def load(cls, consumer, sheet_id, persist=True):
+        """Load the summaries; persist=False keeps them in memory only (replays)"""
+        if not persist:
+            return cls(None)
+        leaders = cls(os.path.join(LEADERS_DIR, f"{consumer}-{sheet_id}.json.gz"))
+        try:
+            with gzip.open(leaders.path, "rt", encoding="utf-8") as f:
+                leaders.series = json.load(f)
+        except (OSError, ValueError):
+            pass
+        return leaders
+
+    def save(self):
+        """Write the summaries atomically"""
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(self.series, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def refresh(self, name, months, keys, weights=None, today=None):
+        """Rebuild the summaries of a series' months whose rows changed since the last run
+
+        months, keys and weights are parallel; rows without a valid "YYYY-MM"
+        month inside daily_bins.month_window, without a key, or with a weight
+        that is not positive, are ignored. weights None counts rows. Months
+        the rows no longer fall in are dropped. Returns the number of months
+        rebuilt.
+        """
+        if weights is None:
+            weights = np.ones(len(keys), dtype=np.int64)
+        window = month_window(today)
+        grouped = {}
+        for month, key, weight in zip(months, keys, np.asarray(weights).tolist()):
+            month = month_key(month, window)
+            if month and key and weight > 0:
+                grouped.setdefault(month, []).append((str(key), weight))
+
+        stored = self.series.setdefault(name, {})
+        rebuilt = 0
+        for month, pairs in grouped.items():
+            digest = _digest(pairs)
+            if stored.get(month, {}).get("digest") != digest:
+                summary = SpaceSaving(self.capacity).extend(*zip(*pairs))
+                stored[month] = {"digest": digest, "summary": summary.to_dict()}
+                rebuilt += 1
+        for month in stale_months(stored, grouped, window):
+            del stored[month]
+        return rebuilt
+
+    def merged(self, name):
+        """One summary covering every month of a series"""
+        summary = SpaceSaving(self.capacity)
+        for month in sorted(self.series.get(name, {})):
+            summary.merge(SpaceSaving.from_dict(self.series[name][month]["summary"]))
+        return summary
+
+    def leaders(self, name, limit):
+        """Top keys of a series over its stored months as {"since", "leaders", "max_error"}"""
+        months = sorted(self.series.get(name, {}))
+        top = self.merged(name).top(limit)
+        return {
+            "since": months[0] if months else None,
+            "leaders": {key: _number(count) for key, count, _ in top},
+            "max_error": _number(max((error for _, _, error in top), default=0)),
+        }
+
+
+def history_leaders(leaders, months, series, today=None):
+    """Refresh and rank several series against the same row months
+
+    series maps a name to (keys, weights, limit), weights None counting
+    rows. Returns {name: leaders(name, limit)}.
+    """
+    result = {}
+    rebuilt = 0
+    for name, (keys, weights, limit) in series.items():
+        rebuilt += leaders.refresh(name, months, keys, weights, today)
+        result[name] = leaders.leaders(name, limit)
+    print(f"Leader summaries: rebuilt {rebuilt} series months")
+    return result
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of raw Smartsheet responses for offline reprocessing
+Snapshots are gzip JSON-lines files (one API page per line) keyed by
+sheet id and version, so a replay streams them back page by page
+"""
+
+import os
+import re
+import json
+import gzip
+
+from sync_state import SYNC_CACHE_DIR
+
+RAW_CACHE_DIR = os.path.join(SYNC_CACHE_DIR, "raw")
+
+
+def snapshot_path(sheet_id, version):
+    return os.path.join(RAW_CACHE_DIR, f"{sheet_id}-v{version}.jsonl.gz")
+
+
+def find_snapshot(sheet_id, version=None):
+    """Path of the cached snapshot for a version, or the newest one if version is None"""
+    if version is not None:
+        path = snapshot_path(sheet_id, version)
+        return path if os.path.exists(path) else None
+
+    pattern = re.compile(rf"^{sheet_id}-v(\d+)\.jsonl\.gz$")
+    try:
+        names = os.listdir(RAW_CACHE_DIR)
+    except OSError:
+        return None
+    versions = [int(m.group(1)) for m in map(pattern.match, names) if m]
+    return snapshot_path(sheet_id, max(versions)) if versions else None
+
+
+def record_pages(pages, sheet_id):
+    """Yield API pages unchanged while writing them to a compressed snapshot
+
+    The snapshot only appears under its final name once every page was read.
+    """
+    os.makedirs(RAW_CACHE_DIR, exist_ok=True)
+    tmp_path = os.path.join(RAW_CACHE_DIR, f"{sheet_id}.partial.jsonl.gz")
+    version = None
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for page in pages:
+                if version is None:
+                    version = page.get("version")
+                f.write(json.dumps(page, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+                yield page
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, snapshot_path(sheet_id, version))
+
+
+def iter_cached_pages(path):
+    """Stream the pages of a cached snapshot"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Record shards for large dashboard data files
+The record arrays of a data file are split into fixed-size shard files and
+replaced by a manifest in the remaining head file, so dashboards draw KPIs
+from the small head and fetch records only when a table needs them
+"""
+
+import os
+import json
+
+from publish import write_json
+
+# Rows per shard file
+SHARD_SIZE = 500
+
+
+def _key_range(records, key):
+    """Smallest and largest non-empty value of key; compared as text when mixed"""
+    values = [r.get(key) for r in records if r.get(key) not in (None, "")]
+    if not values:
+        return {"min": None, "max": None}
+    try:
+        return {"min": min(values), "max": max(values)}
+    except TypeError:
+        values = [str(v) for v in values]
+        return {"min": min(values), "max": max(values)}
+
+
+def shard_dir(path):
+    """Directory holding the shards of a data file, and its path relative to the file"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    relative = f"shards/{stem}"
+    return os.path.join(os.path.dirname(path), relative), relative
+
+
+def write_shards(path, name, records, key=None, shard_size=SHARD_SIZE):
+    """Write one record set of a data file in shards; returns its manifest
+
+    The manifest holds the total row count and, per shard, the path of its
+    content-hashed copy relative to the data file, its [start, end) row
+    range and the min/max of key.
+    """
+    directory, relative = shard_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    # Shards left from a larger earlier export would otherwise linger
+    for stale in os.listdir(directory):
+        if stale.startswith(f"{name}-"):
+            os.remove(os.path.join(directory, stale))
+
+    shards = []
+    for start in range(0, len(records), shard_size):
+        chunk = records[start:start + shard_size]
+        filename = f"{name}-{len(shards):03d}.json"
+        current = write_json(os.path.join(directory, filename), chunk, listed=False)
+        shard = {
+            "path": f"{relative}/{os.path.basename(current)}",
+            "rows": [start, start + len(chunk)],
+        }
+        if key:
+            shard.update(_key_range(chunk, key))
+        shards.append(shard)
+    return {"rows": len(records), "shard_size": shard_size, "key": key, "shards": shards}
+
+
+def write_sharded(path, data, keys, shard_size=SHARD_SIZE):
+    """Publish data with its record sets in shards and the rest as the head file
+
+    keys maps each record set in data["records"] to the field whose range
+    the manifest reports. The head replaces "records" with
+    "record_shards": {set: manifest}. Returns the head.
+    """
+    records = data.get("records", {})
+    head = {key: value for key, value in data.items() if key != "records"}
+    head["record_shards"] = {
+        name: write_shards(path, name, rows, keys.get(name), shard_size)
+        for name, rows in records.items()
+    }
+    write_json(path, head)
+    return head
+
+
+def load_records(path):
+    """Read a data file, reassembling its records from shards if it was sharded"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    manifests = data.pop("record_shards", None)
+    if manifests is None:
+        return data
+    records = {}
+    for name, manifest in manifests.items():
+        records[name] = []
+        for shard in manifest["shards"]:
+            shard_path = os.path.join(os.path.dirname(path), shard["path"])
+            with open(shard_path, "r", encoding="utf-8") as f:
+                records[name].extend(json.load(f))
+    data["records"] = records
+    return data
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Columnar in-memory record table for the KPI calculations
+Numeric fields are parsed once into float arrays and text fields are
+dictionary-encoded into integer codes, so KPIs aggregate whole columns
+instead of re-reading and re-parsing every record dict
+"""
+
+import numpy as np
+
+from number_parser import parse_array
+from ranking import top_k
+
+
+class NumericColumn:
+    """Parsed float values plus a mask of the rows that actually carry a value"""
+
+    __slots__ = ("values", "present")
+
+    def __init__(self, values, present):
+        self.values = values
+        self.present = present
+
+    @classmethod
+    def parse(cls, raw_values, parser):
+        """Parse raw cell values; a row is present when its raw value is truthy
+        and the parser did not reject it by returning NaN"""
+        raw_values = list(raw_values)
+        values = parse_array(raw_values, parser)
+        present = np.fromiter(
+            (bool(v) for v in raw_values), dtype=bool, count=len(raw_values)
+        )
+        return cls(values, present & ~np.isnan(values))
+
+    def valid(self, mask=None):
+        """Values of the present rows, optionally restricted to mask"""
+        keep = self.present if mask is None else self.present & mask
+        return self.values[keep]
+
+
+class CategoricalColumn:
+    """Dictionary-encoded column: one integer code per row into a list of distinct values"""
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def encode(cls, raw_values):
+        """Encode raw values (None for a missing cell) in order of first appearance"""
+        index = {}
+        codes = np.fromiter(
+            (index.setdefault(v, len(index)) for v in raw_values), dtype=np.int32
+        )
+        return cls(codes, list(index))
+
+    def where(self, predicate):
+        """Rows whose value satisfies predicate"""
+        hits = np.fromiter(
+            (bool(predicate(c)) for c in self.categories),
+            dtype=bool,
+            count=len(self.categories),
+        )
+        return hits[self.codes]
+
+    def truthy(self):
+        """Rows whose value is truthy (non-empty)"""
+        return self.where(bool)
+
+    def isin(self, values):
+        """Rows whose value equals one of values"""
+        return self.where(lambda c: c in values)
+
+
+class RecordTable:
+    """Named numeric, categorical and boolean columns over the same rows"""
+
+    def __init__(self, records):
+        self.size = len(records)
+        self.records = records
+        self.columns = {}
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def add_numeric(self, name, key, parser):
+        """Add a float column parsed from key(record)"""
+        self.columns[name] = NumericColumn.parse(map(key, self.records), parser)
+        return self
+
+    def add_categorical(self, name, key):
+        """Add a dictionary-encoded column from key(record)"""
+        self.columns[name] = CategoricalColumn.encode(map(key, self.records))
+        return self
+
+    def add_flag(self, name, predicate):
+        """Add a boolean column from predicate(record)"""
+        self.columns[name] = np.fromiter(
+            (bool(predicate(r)) for r in self.records), dtype=bool, count=self.size
+        )
+        return self
+
+
+class GroupBy:
+    """Rows grouped by one or more categorical columns
+
+    Every row is given a dense group id in order of first appearance, so each
+    aggregate is one bincount (or ufunc.at) pass and rankings break ties the
+    way Counter.most_common and a stable sort of an insertion-ordered dict do.
+    """
+
+    def __init__(self, columns, mask=None):
+        size = len(columns[0].codes)
+        self.columns = columns
+        self.rows = np.arange(size) if mask is None else np.flatnonzero(mask)
+
+        key = np.zeros(len(self.rows), dtype=np.int64)
+        for column in columns:
+            key = key * max(len(column.categories), 1) + column.codes[self.rows]
+        unique, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+
+        self.size = len(order)
+        self.group = rank[inverse.ravel()]
+        self.first = self.rows[first[order]]
+
+        # Each group's code in every key column
+        self.codes = []
+        rest = unique[order]
+        for column in reversed(columns):
+            width = max(len(column.categories), 1)
+            self.codes.insert(0, rest % width)
+            rest = rest // width
+
+    def labels(self):
+        """Group labels in order of first appearance; tuples when grouping by several columns"""
+        keys = [
+            [column.categories[c] for c in codes.tolist()]
+            for column, codes in zip(self.columns, self.codes)
+        ]
+        return keys[0] if len(keys) == 1 else list(zip(*keys))
+
+    def _values(self, values):
+        return np.asarray(values)[self.rows]
+
+    def count(self):
+        return np.bincount(self.group, minlength=self.size)
+
+    def sum(self, values):
+        """Per-group sums; boolean and integer values give integer sums"""
+        values = self._values(values)
+        sums = np.bincount(self.group, weights=values, minlength=self.size)
+        if values.dtype == bool or np.issubdtype(values.dtype, np.integer):
+            return np.round(sums).astype(np.int64)
+        return sums
+
+    def mean(self, values):
+        return self.sum(values) / self.count()
+
+    def min(self, values):
+        out = np.full(self.size, np.inf)
+        np.minimum.at(out, self.group, self._values(values))
+        return out
+
+    def max(self, values):
+        out = np.full(self.size, -np.inf)
+        np.maximum.at(out, self.group, self._values(values))
+        return out
+
+    def aggregate(self, **aggregations):
+        """Several aggregates at once: name="count" or name=(function, values)
+        with function one of sum, mean, min or max"""
+        return {
+            name: self.count() if spec == "count" else getattr(self, spec[0])(spec[1])
+            for name, spec in aggregations.items()
+        }
+
+    def tally(self, values):
+        """{label: value} in order of first appearance"""
+        return dict(zip(self.labels(), np.asarray(values).tolist()))
+
+    def ranked(self, values, limit=None):
+        """{label: value} largest first, ties in order of first appearance"""
+        values = np.asarray(values)
+        order = top_k(values, limit)
+        labels = self.labels()
+        return {labels[i]: values[i].item() for i in order}
+
+
+class GroupAggregate:
+    """Per-category row counts, weighted sums and first appearance, split by segment
+
+    Everything is gathered in one bincount pass over a (category, segment)
+    key, so metrics for several row subsets share a single scan.
+    """
+
+    def __init__(self, categories, counts, sums, first, size):
+        self.categories = categories
+        self.counts = counts
+        self.sums = sums
+        self.first = first
+        self.size = size
+
+    @classmethod
+    def compute(cls, column, segments=None, nsegments=1, weights=None):
+        """Aggregate a categorical column, segments giving each row's subset index"""
+        size = len(column.codes)
+        if segments is None:
+            segments = np.zeros(size, dtype=np.int64)
+        segment = CategoricalColumn(segments, list(range(nsegments)))
+        groups = GroupBy([column, segment])
+        shape = (len(column.categories), nsegments)
+        cells = tuple(groups.codes)
+
+        counts = np.zeros(shape, dtype=np.int64)
+        counts[cells] = groups.count()
+        sums = {}
+        for name, w in (weights or {}).items():
+            sums[name] = np.zeros(shape)
+            sums[name][cells] = groups.sum(w)
+        first = np.full(shape, size, dtype=np.int64)
+        first[cells] = groups.first
+        return cls(column.categories, counts, sums, first, size)
+
+    def view(self, segment=None, keep=None, relabel=None):
+        """Collapse to one segment (or all of them) as a GroupView
+
+        relabel merges categories that map to the same label; keep drops
+        labels it returns false for. Only categories that occur are kept.
+        """
+        if segment is None:
+            counts = self.counts.sum(axis=1)
+            sums = {name: s.sum(axis=1) for name, s in self.sums.items()}
+            first = self.first.min(axis=1)
+        else:
+            counts = self.counts[:, segment]
+            sums = {name: s[:, segment] for name, s in self.sums.items()}
+            first = self.first[:, segment]
+        labels = self.categories
+
+        if relabel is not None:
+            index = {}
+            remap = np.fromiter(
+                (index.setdefault(relabel(c), len(index)) for c in labels),
+                dtype=np.int64,
+                count=len(labels),
+            )
+            labels = list(index)
+            counts = np.bincount(remap, weights=counts, minlength=len(labels)).astype(
+                np.int64
+            )
+            sums = {
+                name: np.bincount(remap, weights=s, minlength=len(labels))
+                for name, s in sums.items()
+            }
+            merged_first = np.full(len(labels), self.size, dtype=np.int64)
+            np.minimum.at(merged_first, remap, first)
+            first = merged_first
+
+        occurs = first < self.size
+        if keep is not None:
+            occurs &= np.fromiter(
+                (bool(keep(c)) for c in labels), dtype=bool, count=len(labels)
+            )
+        order = np.flatnonzero(occurs)
+        order = order[np.argsort(first[order], kind="stable")]
+        return GroupView(
+            [labels[i] for i in order],
+            {"count": counts[order], **{name: s[order] for name, s in sums.items()}},
+        )
+
+
+class GroupView:
+    """Aggregated values of the categories that occur, in order of first appearance"""
+
+    def __init__(self, labels, values):
+        self.labels = labels
+        self.values = values
+
+    def tally(self, name="count"):
+        """{label: value} in order of first appearance"""
+        return dict(zip(self.labels, self.values[name].tolist()))
+
+    def ranked(self, name="count", limit=None):
+        """{label: value} largest first, ties in order of first appearance"""
+        values = self.values[name]
+        order = top_k(values, limit)
+        return {self.labels[i]: values[i].item() for i in order}
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Compiled row decoder shared by the Smartsheet scripts
+The column-id -> slot layout is resolved once per sheet, so decoding a row
+is a single pass over its cells into a fixed-width tuple
+"""
+
+# Fills the slot of a column the row has no cell for
+MISSING = object()
+
+
+class RowDecoder:
+    """Decodes sheet rows into tuples laid out by a column mapping"""
+
+    __slots__ = ("fields", "column_slots", "width")
+
+    def __init__(self, fields, column_slots):
+        self.fields = fields
+        self.column_slots = column_slots
+        self.width = len(fields)
+
+    @classmethod
+    def compile(cls, columns, column_mappings):
+        """Build a decoder from (column_id, title) pairs and a title -> field mapping"""
+        fields = tuple(dict.fromkeys(column_mappings.values()))
+        field_slots = {field: slot for slot, field in enumerate(fields)}
+        column_slots = {
+            col_id: field_slots[column_mappings[title]]
+            for col_id, title in columns
+            if title in column_mappings
+        }
+        return cls(fields, column_slots)
+
+    @classmethod
+    def for_columns(cls, columns, column_mappings):
+        """Decoder for REST API column dicts"""
+        return cls.compile(((c["id"], c["title"]) for c in columns), column_mappings)
+
+    @classmethod
+    def for_sdk_columns(cls, columns, column_mappings=None):
+        """Decoder for smartsheet SDK column objects; maps every title to itself by default"""
+        if column_mappings is None:
+            column_mappings = {col.title: col.title for col in columns}
+        return cls.compile(((c.id, c.title) for c in columns), column_mappings)
+
+    def slot(self, field):
+        return self.fields.index(field)
+
+    def decode(self, row, missing=MISSING):
+        """Decode a REST API row, preferring value over displayValue and skipping empty cells"""
+        values = [missing] * self.width
+        column_slots = self.column_slots
+        for cell in row.get("cells", ()):
+            slot = column_slots.get(cell.get("columnId"))
+            if slot is not None:
+                value = cell.get("value") or cell.get("displayValue")
+                if value is not None:
+                    values[slot] = value
+        return tuple(values)
+
+    def decode_sdk(self, row, missing=MISSING):
+        """Decode a smartsheet SDK row, keeping the raw cell values"""
+        values = [missing] * self.width
+        column_slots = self.column_slots
+        for cell in row.cells:
+            slot = column_slots.get(cell.column_id)
+            if slot is not None:
+                values[slot] = cell.value
+        return tuple(values)
+
+    def as_dict(self, values):
+        """Expand a decoded tuple into a record dict, leaving out missing cells"""
+        return {
+            field: value
+            for field, value in zip(self.fields, values)
+            if value is not MISSING
+        }
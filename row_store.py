@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Persisted store of decoded Smartsheet rows keyed by row id
+Lets the sync scripts merge in only the rows modified since the last run
+"""
+
+import os
+import json
+import gzip
+import hashlib
+
+from sync_state import SYNC_CACHE_DIR
+
+ROW_STORE_DIR = os.path.join(SYNC_CACHE_DIR, "rows")
+
+
+def layout_fingerprint(column_mappings):
+    """Hash of the column mapping; a changed mapping invalidates stored rows"""
+    payload = json.dumps(sorted(column_mappings.items()), ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class RowStore:
+    """Decoded rows for one consumer of one sheet"""
+
+    def __init__(self, path, layout):
+        self.path = path
+        self.layout = layout
+        self.since = None
+        self.rows = {}
+
+    @classmethod
+    def load(cls, consumer, sheet_id, column_mappings):
+        """Load the store, starting empty if it is missing or was built for another layout"""
+        path = os.path.join(ROW_STORE_DIR, f"{consumer}-{sheet_id}.json.gz")
+        store = cls(path, layout_fingerprint(column_mappings))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return store
+
+        if data.get("layout") == store.layout:
+            store.since = data.get("since")
+            store.rows = {int(k): v for k, v in data.get("rows", {}).items()}
+        return store
+
+    def save(self):
+        """Write the store atomically"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(
+                {"layout": self.layout, "since": self.since, "rows": self.rows},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.path)
+
+    def is_empty(self):
+        return not self.rows or not self.since
+
+    def clear(self):
+        self.rows = {}
+        self.since = None
+
+    def upsert(self, row_id, row_number, record):
+        self.rows[row_id] = {"n": row_number, "r": record}
+
+    def retain(self, row_ids):
+        """Drop every stored row whose id is not in row_ids (deleted upstream)"""
+        row_ids = set(row_ids)
+        removed = [row_id for row_id in self.rows if row_id not in row_ids]
+        for row_id in removed:
+            del self.rows[row_id]
+        return len(removed)
+
+    def records(self):
+        """Copies of the stored records in sheet row order"""
+        ordered = sorted(self.rows.values(), key=lambda entry: entry["n"] or 0)
+        return [dict(entry["r"]) for entry in ordered]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Build Filtering Cubes for the Transport and Warehouse Dashboards
+Adds a sparse pre-aggregated cube next to the record arrays of the
+published data files, so filters are answered from a few cells, and
+daily prefix sums of the transport requests for rolling-window KPIs.
+"""
+
+import os
+import sys
+import json
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Shared cube and daily builders, shard reader and publisher live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from daily_bins import daily_series
+from publish import dumps, write_json
+from record_shards import load_records
+from sparse_cube import build_cube
+
+
+def field(name):
+    return lambda record: record.get(name)
+
+
+def month_of(name):
+    """YYYY-MM of a date field, or None when the record has no date"""
+    return lambda record: str(record.get(name))[:7] if record.get(name) else None
+
+
+TRANSPORT_CUBE = (
+    {
+        'project': field('project'),
+        'supplier': field('supplier'),
+        'month': month_of('request_date'),
+        'status': field('status'),
+    },
+    {'amount': field('total_amount')},
+)
+
+# One cube per warehouse record set: (dimensions, measures)
+WAREHOUSE_CUBES = {
+    'inventory': (
+        {'project': field('project'), 'location': field('location'), 'sub_location': field('sub_location')},
+        {'balance': field('balance')},
+    ),
+    'surplus': (
+        {'store': field('store'), 'project': field('project')},
+        {'balance': field('balance')},
+    ),
+    'non_moving': (
+        {'warehouse': field('warehouse'), 'project': field('project')},
+        {'qty': field('qty')},
+    ),
+    'transfers': (
+        {
+            'month': field('month'),
+            'send_project': field('send_project'),
+            'request_project': field('request_project'),
+            'issued_by': field('issued_by'),
+        },
+        {'qty': field('qty_numeric')},
+    ),
+}
+
+
+def update_file(name, build):
+    """Rewrite a data file with the cubes that build(data) returns
+
+    The file is left as it is when it already holds the same cubes. A
+    sharded file is read back whole and written unsharded, so
+    shard_records.py runs after this script.
+    """
+    path = os.path.join(DATA_DIR, name)
+    if not os.path.exists(path):
+        print(f"Skipping {name}: not found")
+        return
+    data = load_records(path)
+    # Compared in JSON form, as they would be read back from the file
+    cubes = json.loads(dumps(build(data)))
+    if all(data.get(key) == value for key, value in cubes.items()):
+        print(f"Cubes unchanged in {name}")
+        return
+    data.update(cubes)
+    write_json(path, data)
+    print(f"Cubes written to {name}")
+
+
+def transport_cubes(data):
+    records = data.get('records', [])
+    dimensions, measures = TRANSPORT_CUBE
+    return {
+        'cube': build_cube(records, dimensions, measures),
+        'daily': daily_series(
+            [r.get('request_date') for r in records],
+            {
+                'requests': np.ones(len(records), dtype=np.int64),
+                'amount': np.array([r.get('total_amount') or 0 for r in records], dtype=np.float64),
+                'done': np.array([r.get('status') == 'Done' for r in records], dtype=bool),
+                'on_time': np.array([r.get('sla_status') == 'On Time' for r in records], dtype=bool),
+            },
+        ),
+    }
+
+
+def warehouse_cubes(data):
+    records = data.get('records', {})
+    return {
+        'cubes': {
+            name: build_cube(records.get(name, []), dimensions, measures)
+            for name, (dimensions, measures) in WAREHOUSE_CUBES.items()
+        }
+    }
+
+
+def main():
+    update_file('transport_data.json', transport_cubes)
+    update_file('warehouse_data.json', warehouse_cubes)
+
+
+if __name__ == '__main__':
+    main()
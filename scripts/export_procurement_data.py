@@ -6,9 +6,8 @@ for use in the Procurement Dashboard.
 """
 
 import os
-import json
+import sys
 from datetime import datetime
-from collections import defaultdict
 
 try:
     import smartsheet
@@ -27,88 +26,92 @@ VENDOR_SHEET_ID = 1185309157969796  # Vendor Evaluation Log 2025
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def get_cell_value(row, col_map, col_name):
-    """Get cell value by column name"""
-    col_id = col_map.get(col_name)
-    if not col_id:
+# Shared helpers live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from period_cube import pr_status_cube
+from publish import write_json
+from record_table import CategoricalColumn, GroupBy
+from row_decoder import RowDecoder
+
+# Columns read from each sheet, in the order rows are decoded
+PR_COLUMNS = (
+    'PR Status', 'PR Submission Date', 'PR Approved Date', 'PR Return Date',
+    'PR to PO in days', 'PR Note', 'Pending With', 'Pending Since',
+    'Pr Num', 'Project Name', 'Description', 'Vendor Name', 'PR Value', 'PO Value',
+)
+VENDOR_COLUMNS = ('Vendor Name', 'Vendor Category', 'Average %')
+
+def approved_month(approved_date, year):
+    """Month (1-12) of an approval date that falls in year, or None"""
+    if not approved_date:
+        return None
+    try:
+        if isinstance(approved_date, str):
+            date_obj = datetime.strptime(approved_date[:10], '%Y-%m-%d')
+        else:
+            date_obj = approved_date
+        return date_obj.month if date_obj.year == year else None
+    except Exception:
         return None
-    for cell in row.cells:
-        if cell.column_id == col_id:
-            return cell.value
-    return None
+
+def column_decoder(sheet, titles):
+    """Compile a decoder that reads the given column titles from a sheet"""
+    return RowDecoder.for_sdk_columns(sheet.columns, {title: title for title in titles})
 
 def export_pr_data(client):
     """Export PR to PO data"""
     print("📥 Fetching PR to PO data...")
     sheet = client.Sheets.get_sheet(PR_SHEET_ID)
 
-    # Create column map
-    col_map = {col.title: col.id for col in sheet.columns}
+    # Resolve column id -> slot once for the whole sheet
+    decoder = column_decoder(sheet, PR_COLUMNS)
 
     # Process rows
     pr_data = []
-    monthly_stats = defaultdict(lambda: {'approved': 0, 'returned': 0})
-    status_counts = defaultdict(int)
+    approved_months = []
 
     current_year = datetime.now().year
 
     for row in sheet.rows:
-        pr_status = get_cell_value(row, col_map, 'PR Status')
-        pr_date = get_cell_value(row, col_map, 'PR Submission Date')
-        pr_approved_date = get_cell_value(row, col_map, 'PR Approved Date')
-        pr_return_date = get_cell_value(row, col_map, 'PR Return Date')
-        pr_to_po_days = get_cell_value(row, col_map, 'PR to PO in days')
-
-        # Count by status
-        if pr_status:
-            status_counts[pr_status] += 1
-
-        # Parse date and get year/month - count by STATUS not just by date
-        if pr_approved_date:
-            try:
-                if isinstance(pr_approved_date, str):
-                    date_obj = datetime.strptime(pr_approved_date[:10], '%Y-%m-%d')
-                else:
-                    date_obj = pr_approved_date
-
-                year = date_obj.year
-                month = date_obj.month
-
-                if year == current_year:
-                    # Only count as approved if status is APPROVED
-                    if pr_status == 'APPROVED':
-                        monthly_stats[month]['approved'] += 1
-
-                    # Only count as returned if status is RETURNED
-                    if pr_status == 'RETURNED':
-                        monthly_stats[month]['returned'] += 1
-
-            except Exception as e:
-                pass
-
-        # Get additional columns for delay reasons
-        pr_note = get_cell_value(row, col_map, 'PR Note')
-        pending_with = get_cell_value(row, col_map, 'Pending With')
-        pending_since = get_cell_value(row, col_map, 'Pending Since')
+        (pr_status, pr_date, pr_approved_date, pr_return_date, pr_to_po_days,
+         pr_note, pending_with, pending_since, pr_num, project, description,
+         vendor, pr_value, po_value) = decoder.decode_sdk(row, missing=None)
+
+        # Approval month within the current year, counted by STATUS below
+        approved_months.append(approved_month(pr_approved_date, current_year))
 
         # Store row data
         pr_data.append({
-            'pr_num': get_cell_value(row, col_map, 'Pr Num'),
-            'project': get_cell_value(row, col_map, 'Project Name'),
-            'description': get_cell_value(row, col_map, 'Description'),
+            'pr_num': pr_num,
+            'project': project,
+            'description': description,
             'status': pr_status,
             'submission_date': str(pr_date)[:10] if pr_date else None,
             'approved_date': str(pr_approved_date)[:10] if pr_approved_date else None,
             'return_date': str(pr_return_date)[:10] if pr_return_date else None,
-            'vendor': get_cell_value(row, col_map, 'Vendor Name'),
-            'pr_value': get_cell_value(row, col_map, 'PR Value'),
-            'po_value': get_cell_value(row, col_map, 'PO Value'),
+            'vendor': vendor,
+            'pr_value': pr_value,
+            'po_value': po_value,
             'pr_to_po_days': pr_to_po_days,
             'pr_note': pr_note,
             'pending_with': pending_with,
             'pending_since': str(pending_since)[:10] if pending_since else None
         })
 
+    status = CategoricalColumn.encode(pr['status'] for pr in pr_data)
+    month = CategoricalColumn.encode(approved_months)
+
+    # Count by status
+    by_status = GroupBy([status], status.truthy())
+    status_counts = by_status.tally(by_status.count())
+
+    # Approved and returned PRs per approval month, in one (status, month) pass
+    monthly_stats = {m: {'approved': 0, 'returned': 0} for m in range(1, 13)}
+    counted = status.isin(['APPROVED', 'RETURNED']) & month.where(lambda m: m is not None)
+    by_month = GroupBy([status, month], counted)
+    for (pr_status, month_no), count in zip(by_month.labels(), by_month.count().tolist()):
+        monthly_stats[month_no][pr_status.lower()] = count
+
     # Build monthly arrays for charts
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     monthly_approved = [monthly_stats[i+1]['approved'] for i in range(12)]
@@ -141,13 +144,13 @@ def export_pr_data(client):
             'returned': monthly_returned,
             'return_rate': monthly_return_rate
         },
+        'status_cube': pr_status_cube(pr_data),  # Every year, for the year filter
         'all_prs': pr_data  # All PRs for filtering
     }
 
     # Save to file
     output_file = os.path.join(OUTPUT_DIR, 'pr_data.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    write_json(output_file, result, columns=['all_prs'])
 
     print(f"✅ PR data exported to {output_file}")
     print(f"   Total PRs: {len(pr_data)}")
@@ -161,8 +164,8 @@ def export_vendor_data(client):
     print("\n📥 Fetching Vendor Evaluation data...")
     sheet = client.Sheets.get_sheet(VENDOR_SHEET_ID, include='attachments')
 
-    # Create column map
-    col_map = {col.title: col.id for col in sheet.columns}
+    # Resolve column id -> slot once for the whole sheet
+    decoder = column_decoder(sheet, VENDOR_COLUMNS)
 
     # Process rows
     vendors = []
@@ -171,9 +174,7 @@ def export_vendor_data(client):
     evaluated_count = 0
 
     for row in sheet.rows:
-        vendor_name = get_cell_value(row, col_map, 'Vendor Name')
-        category = get_cell_value(row, col_map, 'Vendor Category')
-        avg_percent = get_cell_value(row, col_map, 'Average %')
+        vendor_name, category, avg_percent = decoder.decode_sdk(row, missing=None)
 
         if not vendor_name:
             continue
@@ -247,8 +248,7 @@ def export_vendor_data(client):
 
     # Save to file
     output_file = os.path.join(OUTPUT_DIR, 'vendor_data.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    write_json(output_file, result)
 
     print(f"✅ Vendor data exported to {output_file}")
     print(f"   Total Vendors: {len(vendors)}")
@@ -5,7 +5,7 @@ Processes Excel files and exports to JSON for dashboard consumption.
 """
 
 import pandas as pd
-import json
+import numpy as np
 from datetime import datetime
 import os
 import sys
@@ -15,6 +15,12 @@ SURPLUS_FILE = '/Users/a.rahman/Library/Caches/Spark Mail/messagesData/1/70920/M
 STORE_FILE = '/Users/a.rahman/Desktop/NIT/Amr/Invintory update till 2-12-2025/Asir Modon-2 Store Movment Materials.xlsx'
 OUTPUT_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'warehouse_data.json')
 
+# Shared group-by, ranking and publishing helpers live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from publish import write_json
+from ranking import top_k
+from record_table import CategoricalColumn, GroupBy
+
 def clean_value(val):
     """Clean and normalize values"""
     if pd.isna(val):
@@ -64,7 +70,6 @@ def process_surplus_transfers():
     df = df.dropna(subset=['Description'])
 
     transfers = []
-    monthly_data = {}
 
     for idx, row in df.iterrows():
         date_str = parse_date(row.get('date'))
@@ -84,13 +89,7 @@ def process_surplus_transfers():
         }
         transfers.append(transfer)
 
-        # Aggregate by month
-        if date_str:
-            month_key = date_str[:7]  # YYYY-MM
-            if month_key not in monthly_data:
-                monthly_data[month_key] = {'count': 0, 'quantity': 0}
-            monthly_data[month_key]['count'] += 1
-            monthly_data[month_key]['quantity'] += transfer['qty']
+    qty = np.array([t['qty'] for t in transfers], dtype=np.int64)
 
     # Get unique values for filters
     stores = sorted(list(set(t['store'] for t in transfers if t['store'])))
@@ -98,32 +97,30 @@ def process_surplus_transfers():
     to_projects = sorted(list(set(t['to_project'] for t in transfers if t['to_project'])))
     units = sorted(list(set(t['unit'] for t in transfers if t['unit'])))
 
+    # Aggregate by month (YYYY-MM)
+    month = CategoricalColumn.encode(t['date'][:7] if t['date'] else None for t in transfers)
+    by_month = GroupBy([month], month.truthy())
+    monthly_data = by_month.aggregate(count='count', quantity=('sum', qty))
+
     # Sort monthly data
-    sorted_months = sorted(monthly_data.keys())
     month_labels = []
     month_counts = []
     month_quantities = []
 
-    for m in sorted_months:
+    for m, g in sorted((m, g) for g, m in enumerate(by_month.labels())):
         month_labels.append(datetime.strptime(m, '%Y-%m').strftime('%b %Y'))
-        month_counts.append(monthly_data[m]['count'])
-        month_quantities.append(monthly_data[m]['quantity'])
+        month_counts.append(int(monthly_data['count'][g]))
+        month_quantities.append(int(monthly_data['quantity'][g]))
 
     # Top materials by quantity
-    material_qty = {}
-    for t in transfers:
-        desc = t['description']
-        if desc:
-            material_qty[desc] = material_qty.get(desc, 0) + t['qty']
-
-    top_materials = sorted(material_qty.items(), key=lambda x: x[1], reverse=True)[:10]
+    material = CategoricalColumn.encode(t['description'] for t in transfers)
+    by_material = GroupBy([material], material.truthy())
+    top_materials = list(by_material.ranked(by_material.sum(qty), 10).items())
 
     # Transfers by store
-    store_counts = {}
-    for t in transfers:
-        store = t['store']
-        if store:
-            store_counts[store] = store_counts.get(store, 0) + 1
+    store = CategoricalColumn.encode(t['store'] for t in transfers)
+    by_store = GroupBy([store], store.truthy())
+    store_counts = by_store.tally(by_store.count())
 
     confirmed_count = len([t for t in transfers if t['remark'] == 'Confirmed'])
 
@@ -131,7 +128,7 @@ def process_surplus_transfers():
         'summary': {
             'total_transfers': len(transfers),
             'total_quantity': sum(t['qty'] for t in transfers),
-            'unique_materials': len(material_qty),
+            'unique_materials': by_material.size,
             'active_stores': len(stores),
             'confirmed_count': confirmed_count,
             'pending_count': len(transfers) - confirmed_count
@@ -234,26 +231,21 @@ def process_inventory():
     zero_items = [m for m in active_materials if m['status'] == 'zero']
     normal_items = [m for m in active_materials if m['status'] == 'normal']
 
+    balance = np.array([m['balance'] for m in active_materials], dtype=np.int64)
+
     # Top materials by balance
-    top_balance = sorted([m for m in active_materials if m['balance'] > 0], key=lambda x: x['balance'], reverse=True)[:10]
-
-    # By location
-    location_data = {}
-    for m in active_materials:
-        loc = m['location'] or 'Unknown'
-        if loc not in location_data:
-            location_data[loc] = {'count': 0, 'balance': 0}
-        location_data[loc]['count'] += 1
-        location_data[loc]['balance'] += m['balance']
-
-    # By sub-location
-    sub_location_data = {}
-    for m in active_materials:
-        loc = m['sub_location'] or 'Unknown'
-        if loc not in sub_location_data:
-            sub_location_data[loc] = {'count': 0, 'balance': 0}
-        sub_location_data[loc]['count'] += 1
-        sub_location_data[loc]['balance'] += m['balance']
+    in_stock = np.flatnonzero(balance > 0)
+    top_balance = [active_materials[i] for i in in_stock[top_k(balance[in_stock], 10)]]
+
+    def by_field(field):
+        """Material count and balance per value of field, missing values as Unknown"""
+        groups = GroupBy([CategoricalColumn.encode(m[field] or 'Unknown' for m in active_materials)])
+        totals = groups.aggregate(count='count', balance=('sum', balance))
+        return {
+            'labels': groups.labels(),
+            'counts': totals['count'].tolist(),
+            'balances': totals['balance'].tolist()
+        }
 
     return {
         'summary': {
@@ -270,16 +262,8 @@ def process_inventory():
             'labels': [m['description'][:25] + '...' if len(m['description'] or '') > 25 else (m['description'] or 'N/A') for m in top_balance],
             'values': [m['balance'] for m in top_balance]
         },
-        'by_location': {
-            'labels': list(location_data.keys()),
-            'counts': [location_data[k]['count'] for k in location_data],
-            'balances': [location_data[k]['balance'] for k in location_data]
-        },
-        'by_sub_location': {
-            'labels': list(sub_location_data.keys()),
-            'counts': [sub_location_data[k]['count'] for k in sub_location_data],
-            'balances': [sub_location_data[k]['balance'] for k in sub_location_data]
-        },
+        'by_location': by_field('location'),
+        'by_sub_location': by_field('sub_location'),
         'status_distribution': {
             'labels': ['Critical', 'Low Stock', 'Zero Stock', 'Normal'],
             'counts': [len(critical_items), len(low_items), len(zero_items), len(normal_items)]
@@ -306,8 +290,11 @@ def process_movements():
     # Get date columns (datetime objects)
     date_columns = [col for col in df.columns if isinstance(col, datetime)]
 
-    daily_data = {}
-    material_issued = {}
+    # One entry per issued (date, quantity) cell, and each material's row total
+    issue_dates = []
+    issue_qtys = []
+    descriptions = []
+    row_totals = []
 
     for idx, row in df.iterrows():
         description = clean_value(row.get('MATERIALS DESCRIPTION', ''))
@@ -319,28 +306,33 @@ def process_movements():
         for date_col in date_columns:
             qty = clean_numeric(row.get(date_col, 0))
             if qty > 0:
-                date_str = date_col.strftime('%Y-%m-%d')
-                if date_str not in daily_data:
-                    daily_data[date_str] = 0
-                daily_data[date_str] += qty
+                issue_dates.append(date_col.strftime('%Y-%m-%d'))
+                issue_qtys.append(qty)
                 total_issued += qty
 
-        if total_issued > 0:
-            material_issued[description] = material_issued.get(description, 0) + total_issued
+        descriptions.append(description)
+        row_totals.append(total_issued)
+
+    # Daily totals
+    by_date = GroupBy([CategoricalColumn.encode(issue_dates)])
+    daily_data = by_date.tally(by_date.sum(np.array(issue_qtys, dtype=np.float64)))
 
     # Sort by date
     sorted_dates = sorted(daily_data.keys())
 
     # Top materials by issuance
-    top_issued = sorted(material_issued.items(), key=lambda x: x[1], reverse=True)[:10]
+    row_totals = np.array(row_totals, dtype=np.float64)
+    by_description = GroupBy([CategoricalColumn.encode(descriptions)], row_totals > 0)
+    top_issued = list(by_description.ranked(by_description.sum(row_totals), 10).items())
 
     # Weekly aggregation
-    weekly_data = {}
-    for date_str, qty in daily_data.items():
+    def week_of(date_str):
         date_obj = datetime.strptime(date_str, '%Y-%m-%d')
         week_start = date_obj - pd.Timedelta(days=date_obj.weekday())
-        week_key = week_start.strftime('%Y-%m-%d')
-        weekly_data[week_key] = weekly_data.get(week_key, 0) + qty
+        return week_start.strftime('%Y-%m-%d')
+
+    by_week = GroupBy([CategoricalColumn.encode(week_of(d) for d in daily_data)])
+    weekly_data = by_week.tally(by_week.sum(np.array(list(daily_data.values()), dtype=np.float64)))
 
     sorted_weeks = sorted(weekly_data.keys())
 
@@ -349,7 +341,7 @@ def process_movements():
 
     return {
         'summary': {
-            'total_issued_items': len(material_issued),
+            'total_issued_items': by_description.size,
             'total_issued_quantity': int(total_issued_qty),
             'active_days': active_days,
             'avg_daily_issuance': round(total_issued_qty / active_days, 1) if active_days else 0
@@ -402,8 +394,7 @@ def main():
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
 
     # Write JSON
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    write_json(OUTPUT_FILE, output)
 
     print(f"\nExport complete: {OUTPUT_FILE}")
     print(f"File size: {os.path.getsize(OUTPUT_FILE) / 1024:.1f} KB")
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Rebuild data/manifest.json From the Published Files
+Run after rebasing data commits onto ones pushed meanwhile, so the
+manifest lists the hashed copy of every data file's current content.
+"""
+
+import os
+import sys
+
+# Shared publisher lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from publish import rebuild_manifest
+
+
+def main():
+    manifest = rebuild_manifest()
+    print(f"Manifest lists {len(manifest['files'])} files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Shard the Record Arrays of the Large Dashboard Data Files
+Leaves summary, charts and filters in the data file as a small head and
+moves each record set into fixed-size shard files listed in its manifest.
+"""
+
+import os
+import sys
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Shared shard writer lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from record_shards import load_records, write_sharded
+
+# Record sets of each data file and the field their shard ranges report
+SHARDED_FILES = {
+    'warehouse_data.json': {
+        'inventory': 'id',
+        'surplus': 'id',
+        'non_moving': 'id',
+        'transfers': 'date',
+    },
+    'assets_data.json': {
+        'equipment': 'id',
+        'fleet': 'id',
+        'generators': 'id',
+        'stand_acs': 'id',
+        'testing_equipment': 'id',
+        'tools': 'id',
+    },
+}
+
+
+def main():
+    for name, keys in SHARDED_FILES.items():
+        path = os.path.join(DATA_DIR, name)
+        if not os.path.exists(path):
+            print(f"Skipping {name}: not found")
+            continue
+        head = write_sharded(path, load_records(path), keys)
+        counts = ', '.join(
+            f"{records} {manifest['rows']} rows/{len(manifest['shards'])} shards"
+            for records, manifest in head['record_shards'].items()
+        )
+        print(f"Sharded {name}: {counts}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Shared fetch pipeline for the Smartsheet sync scripts
+Polls the sheet version first and skips the download when nothing changed,
+then streams only the rows modified since the last run, page by page,
+into a local row store. Downloads are projected onto the mapped columns only.
+Full downloads can be cached raw and replayed later without the network
+"""
+
+import os
+import argparse
+from datetime import datetime, timedelta
+
+from requests import HTTPError
+
+from raw_cache import find_snapshot, iter_cached_pages, record_pages
+from row_decoder import RowDecoder
+from row_store import RowStore, layout_fingerprint
+from sync_state import load_state, save_state, get_sheet_state, set_sheet_state
+
+# Re-fetch a little before the last sync so edits made while it ran are not missed
+INCREMENTAL_OVERLAP = timedelta(minutes=5)
+
+
+def build_arg_parser(description):
+    """Command line options common to every sync script"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="download and rebuild even if the sheet version is unchanged",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the local row store and download every row",
+    )
+    parser.add_argument(
+        "--cache-raw",
+        action="store_true",
+        help="download every row and keep the raw response for --replay",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="rebuild the outputs from the cached raw response, without the network",
+    )
+    parser.add_argument(
+        "--replay-version",
+        type=int,
+        help="sheet version to replay (default: newest cached)",
+    )
+    return parser
+
+
+class StaleColumnCache(Exception):
+    """The cached column ids no longer match the sheet's mapped columns"""
+
+
+def _since_param(modified_at):
+    since = datetime.fromisoformat(modified_at.replace("Z", "+00:00"))
+    return (since - INCREMENTAL_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class SheetSync:
+    """Keeps one consumer's view of one sheet up to date between runs"""
+
+    def __init__(
+        self,
+        client,
+        sheet_id,
+        consumer,
+        column_mappings,
+        outputs=(),
+        force=False,
+        full=False,
+        include=None,
+        cache_raw=False,
+        replay=False,
+        replay_version=None,
+    ):
+        self.client = client
+        self.sheet_id = sheet_id
+        self.consumer = consumer
+        self.column_mappings = column_mappings
+        self.outputs = outputs
+        self.force = force
+        self.full = full
+        # Extra cell data such as "format"; only requested when a consumer needs it
+        self.include = include
+        self.cache_raw = cache_raw
+        self.replay = replay
+        self.replay_version = replay_version
+        self.sheet = None
+        self.store = None
+
+    @classmethod
+    def from_args(cls, client, sheet_id, consumer, column_mappings, outputs, args):
+        """Build a SheetSync from the options parsed by build_arg_parser"""
+        return cls(
+            client,
+            sheet_id,
+            consumer,
+            column_mappings,
+            outputs=outputs,
+            force=args.force,
+            full=args.full,
+            cache_raw=args.cache_raw,
+            replay=args.replay,
+            replay_version=args.replay_version,
+        )
+
+    @property
+    def sheet_name(self):
+        return self.sheet.get("name") if self.sheet else None
+
+    def is_unchanged(self):
+        """True when this consumer already synced the sheet's current version
+
+        --cache-raw always downloads, so it has a snapshot to write.
+        """
+        seen = get_sheet_state(load_state(), self.consumer, self.sheet_id)
+        if self.force or self.cache_raw or not seen:
+            return False
+        if not all(os.path.exists(p) for p in self.outputs):
+            return False
+        version = self.client.get_sheet_version(self.sheet_id)
+        if version != seen.get("version"):
+            return False
+        print(
+            f"Sheet {self.sheet_id} unchanged since last sync "
+            f"(version {version}, modified {seen.get('modified_at')})"
+        )
+        return True
+
+    def fetch(self):
+        """Bring the row store up to date and return the decoded records
+
+        Returns None when the run can be skipped.
+        """
+        if self.replay:
+            return self._replay()
+
+        if self.is_unchanged():
+            return None
+
+        self.store = RowStore.load(self.consumer, self.sheet_id, self.column_mappings)
+        if self.full or self.cache_raw or self.store.is_empty():
+            self._fetch_full()
+        else:
+            self._fetch_incremental()
+
+        self.store.since = self.sheet.get("modifiedAt")
+        return self.store.records()
+
+    def _fetch_full(self):
+        print("Downloading full sheet...")
+        self.store.clear()
+        self._download()
+
+    def _replay(self):
+        path = find_snapshot(self.sheet_id, self.replay_version)
+        if path is None:
+            raise FileNotFoundError(
+                f"No cached raw response for sheet {self.sheet_id}; run with --cache-raw first"
+            )
+        print(f"Replaying {path}...")
+
+        # In-memory store only: a replay never touches the persisted sync state
+        self.store = RowStore(None, layout_fingerprint(self.column_mappings))
+        for row_id, row_number, record in self.iter_rows(pages=iter_cached_pages(path)):
+            self.store.upsert(row_id, row_number, record)
+        return self.store.records()
+
+    def _fetch_incremental(self):
+        since = _since_param(self.store.since)
+        print(f"Downloading rows modified since {since}...")
+        changed = self._download({"rowsModifiedSince": since})
+        print(f"Merged {changed} changed rows into {len(self.store.rows)} stored rows")
+
+        # Deleted rows never show up as modified; reconcile ids when counts disagree
+        total_rows = self.sheet.get("totalRowCount")
+        if total_rows is not None and total_rows != len(self.store.rows):
+            removed = self.store.retain(self._fetch_row_ids())
+            print(f"Removed {removed} rows deleted upstream")
+
+    def _fetch_row_ids(self):
+        """List every current row id by downloading a single column"""
+        columns = self.sheet.get("columns", [])
+        params = {"exclude": "nonexistentCells"}
+        if columns:
+            params["columnIds"] = columns[0]["id"]
+        return [
+            row["id"]
+            for page in self.client.iter_sheet_pages(self.sheet_id, params=params)
+            for row in page.get("rows", [])
+        ]
+
+    def column_ids(self, refresh=False):
+        """Ids of the mapped columns, resolved once and cached in the sync state"""
+        layout = layout_fingerprint(self.column_mappings)
+        state = load_state()
+        seen = get_sheet_state(state, self.consumer, self.sheet_id)
+        if not refresh and seen.get("column_layout") == layout:
+            return seen.get("column_ids", [])
+
+        ids = [
+            col["id"]
+            for col in self.client.get_columns(self.sheet_id)
+            if col["title"] in self.column_mappings
+        ]
+        set_sheet_state(
+            state, self.consumer, self.sheet_id, column_layout=layout, column_ids=ids
+        )
+        save_state(state)
+        return ids
+
+    def _projection(self, column_ids):
+        params = {"exclude": "nonexistentCells"}
+        if column_ids:
+            params["columnIds"] = ",".join(str(col_id) for col_id in column_ids)
+        if self.include:
+            params["include"] = self.include
+        return params
+
+    def iter_rows(self, params=None, column_ids=None, pages=None):
+        """Stream (row_id, row_number, record) for every row the API returns
+
+        Pages are decoded and dropped one at a time, and the first page's
+        sheet metadata (name, version, columns) is kept on self.sheet.
+        """
+        decoder = None
+        if pages is None:
+            params = {**(params or {}), **self._projection(column_ids)}
+            pages = self.client.iter_sheet_pages(self.sheet_id, params=params)
+            if self.cache_raw and not params.get("rowsModifiedSince"):
+                pages = record_pages(pages, self.sheet_id)
+        for page in pages:
+            rows = page.pop("rows", [])
+            if decoder is None:
+                self.sheet = page
+                decoder = RowDecoder.for_columns(
+                    page.get("columns", []), self.column_mappings
+                )
+                if column_ids and len(decoder.column_slots) != len(column_ids):
+                    raise StaleColumnCache()
+            decode, as_dict = decoder.decode, decoder.as_dict
+            for row in rows:
+                yield row["id"], row.get("rowNumber"), as_dict(decode(row))
+
+    def _download(self, params=None):
+        try:
+            return self._download_projected(params, self.column_ids())
+        except (StaleColumnCache, HTTPError) as e:
+            # Columns were renamed or deleted since the ids were cached
+            if isinstance(e, HTTPError) and (
+                e.response is None or e.response.status_code not in (400, 404)
+            ):
+                raise
+            print("Column ids changed, resolving them again...")
+            return self._download_projected(params, self.column_ids(refresh=True))
+
+    def _download_projected(self, params, column_ids):
+        changed = 0
+        for row_id, row_number, record in self.iter_rows(params, column_ids):
+            self.store.upsert(row_id, row_number, record)
+            changed += 1
+        return changed
+
+    def commit(self):
+        """Persist the row store and the synced version after outputs were written"""
+        if self.replay:
+            return
+
+        if self.store is not None:
+            self.store.save()
+
+        state = load_state()
+        set_sheet_state(
+            state,
+            self.consumer,
+            self.sheet_id,
+            version=self.sheet.get("version"),
+            modified_at=self.sheet.get("modifiedAt"),
+        )
+        save_state(state)
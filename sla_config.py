@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+SLA rules shared by the calendar, duration and percentile modules
+"""
+
+import os
+
+# Durations at or under this many days count as on time
+ON_TIME_DAYS = 3
+
+# Working week and public holidays that business days are counted against
+CALENDAR_PATH = os.environ.get("SLA_CALENDAR_FILE", "sla_calendar.json")
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Shared Smartsheet API client for the sync scripts
+One pooled keep-alive session per run, gzip/deflate negotiation,
+per-request timeouts, per-run request and retry budgets and a
+token-bucket scheduler with Retry-After aware retries
+"""
+
+import os
+import math
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API_BASE_URL = "https://api.smartsheet.com/2.0"
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (
+    float(os.environ.get("SMARTSHEET_CONNECT_TIMEOUT", 10)),
+    float(os.environ.get("SMARTSHEET_READ_TIMEOUT", 120)),
+)
+
+# Upper bound on API requests a single sync run may issue; the pages a
+# sheet reports through totalRowCount are added to it as they are planned
+DEFAULT_REQUEST_BUDGET = int(os.environ.get("SMARTSHEET_REQUEST_BUDGET", 200))
+
+# Upper bound on retries (throttling, transient errors) a single run may issue
+DEFAULT_RETRY_BUDGET = int(os.environ.get("SMARTSHEET_RETRY_BUDGET", 100))
+
+# Keep-alive connections kept open to the API host
+DEFAULT_POOL_SIZE = 4
+
+# Rows per page when streaming a sheet
+DEFAULT_PAGE_SIZE = int(os.environ.get("SMARTSHEET_PAGE_SIZE", 500))
+
+# Smartsheet allows 300 requests per minute per token
+DEFAULT_RATE_LIMIT = float(os.environ.get("SMARTSHEET_RATE_LIMIT", 300))  # per minute
+DEFAULT_BURST = 10
+
+# Retry policy for throttling and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = int(os.environ.get("SMARTSHEET_MAX_RETRIES", 6))
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+
+
+class RequestBudgetExceeded(RuntimeError):
+    """Raised when a run tries to issue more requests or retries than its budget allows"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every request a client issues"""
+
+    def __init__(self, rate_per_minute=DEFAULT_RATE_LIMIT, capacity=DEFAULT_BURST):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                wait = self.paused_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold back every caller, e.g. after the API answered 429"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+def retry_after_seconds(response):
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_seconds(attempt):
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+class SmartsheetClient:
+    """Pooled HTTP client for the Smartsheet REST API"""
+
+    def __init__(
+        self,
+        token,
+        timeout=DEFAULT_TIMEOUT,
+        request_budget=DEFAULT_REQUEST_BUDGET,
+        retry_budget=DEFAULT_RETRY_BUDGET,
+        pool_size=DEFAULT_POOL_SIZE,
+        bucket=None,
+    ):
+        self.timeout = timeout
+        self.request_budget = request_budget
+        self.requests_made = 0
+        self.retry_budget = retry_budget
+        self.retries_made = 0
+        self.pool_size = pool_size
+        self.bucket = bucket or TokenBucket()
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+    def _consume_budget(self, retry=False):
+        """Count a request, or a retry of one, against its budget"""
+        with self._lock:
+            if retry:
+                if self.retries_made >= self.retry_budget:
+                    raise RequestBudgetExceeded(
+                        f"Retry budget of {self.retry_budget} exhausted for this run"
+                    )
+                self.retries_made += 1
+            else:
+                if self.requests_made >= self.request_budget:
+                    raise RequestBudgetExceeded(
+                        f"Request budget of {self.request_budget} exhausted for this run"
+                    )
+                self.requests_made += 1
+
+    def plan_requests(self, count):
+        """Widen the request budget by count requests known to be needed, e.g. a sheet's pages"""
+        with self._lock:
+            self.request_budget += count
+
+    def get(self, path, params=None):
+        """Issue a GET against the API and return the decoded JSON body
+
+        Throttled (429) and transient 5xx or connection failures are retried
+        with backoff, honouring Retry-After when the API sends it.
+        """
+        url = f"{API_BASE_URL}/{path.lstrip('/')}"
+        for attempt in range(MAX_RETRIES + 1):
+            self.bucket.acquire()
+            self._consume_budget(retry=attempt > 0)
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = backoff_seconds(attempt)
+                reason = "connection error"
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    return response.json()
+                delay = retry_after_seconds(response)
+                if delay is None:
+                    delay = backoff_seconds(attempt)
+                if response.status_code == 429:
+                    # Stop every worker sharing this bucket, not just this one
+                    self.bucket.pause(delay)
+                reason = f"HTTP {response.status_code}"
+            print(f"Smartsheet {reason} on {path}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+    def get_sheet(self, sheet_id, params=None):
+        """Fetch a full sheet"""
+        return self.get(f"sheets/{sheet_id}", params=params)
+
+    def map(self, func, items):
+        """Run func over items on the connection pool, yielding results in order
+
+        At most pool_size calls are in flight; the shared token bucket keeps
+        the combined request rate under the API limit.
+        """
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            pending = []
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= self.pool_size:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+    def iter_sheet_pages(self, sheet_id, params=None, page_size=DEFAULT_PAGE_SIZE):
+        """Fetch a sheet page by page so only a few pages of rows are held at a time
+
+        When the first page reports the sheet's total row count the remaining
+        pages are fetched in parallel and added to the request budget, so a
+        large sheet cannot exhaust it mid-sync; incremental (rowsModifiedSince) requests
+        do not know their row count up front and are fetched one by one.
+        """
+        params = params or {}
+
+        def fetch(page):
+            return self.get_sheet(
+                sheet_id, params={**params, "page": page, "pageSize": page_size}
+            )
+
+        data = fetch(1)
+        row_count = len(data.get("rows", []))
+        total_rows = data.get("totalRowCount")
+        yield data
+        if row_count < page_size:
+            return
+
+        if total_rows is not None and not params.get("rowsModifiedSince"):
+            last_page = math.ceil(total_rows / page_size)
+            self.plan_requests(last_page - 1)
+            yield from self.map(fetch, range(2, last_page + 1))
+            return
+
+        page = 2
+        while True:
+            data = fetch(page)
+            row_count = len(data.get("rows", []))
+            yield data
+            if row_count < page_size:
+                return
+            page += 1
+
+    def get_columns(self, sheet_id):
+        """Fetch the column definitions of a sheet (no row data)"""
+        return self.get(
+            f"sheets/{sheet_id}/columns", params={"includeAll": "true"}
+        ).get("data", [])
+
+    def get_sheet_version(self, sheet_id):
+        """Fetch only the sheet version number (cheap change check)"""
+        return self.get(f"sheets/{sheet_id}/version").get("version")
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_clients = {}
+
+
+def get_client(token):
+    """Return the run-wide client for a token so every fetch shares one pool and budget"""
+    client = _clients.get(token)
+    if client is None:
+        client = _clients[token] = SmartsheetClient(token)
+    return client
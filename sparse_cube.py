@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Sparse pre-aggregated cubes for dashboard filtering
+Records are reduced to one cell per occurring combination of dimension
+values, holding a row count and measure sums, so any filter combination
+is answered by summing the matching cells instead of scanning records
+"""
+
+import numpy as np
+
+from number_parser import parse_array
+from record_table import CategoricalColumn
+
+
+def _label_order(categories):
+    """Sorted labels with missing values last, and each category's position"""
+    order = sorted(
+        range(len(categories)),
+        key=lambda c: (categories[c] is None, str(categories[c])),
+    )
+    position = np.empty(len(categories), dtype=np.int64)
+    position[order] = np.arange(len(order))
+    return [categories[c] for c in order], position
+
+
+def build_cube(records, dimensions, measures=None):
+    """Count and sum records over every occurring combination of dimensions
+
+    dimensions and measures map a name to key(record); measure values are
+    parsed as numbers. Returns {"dimensions", "labels", "measures", "cells"}
+    where labels holds the sorted values of each dimension and every cell is
+    [index per dimension..., count, sum per measure...].
+    """
+    measures = measures or {}
+    labels = []
+    codes = []
+    for key in dimensions.values():
+        column = CategoricalColumn.encode(key(r) for r in records)
+        names, position = _label_order(column.categories)
+        labels.append(names)
+        codes.append(position[column.codes])
+
+    if not records:
+        cells = []
+    else:
+        keys, inverse = np.unique(np.column_stack(codes), axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        counts = np.bincount(inverse, minlength=len(keys))
+        sums = [
+            np.round(
+                np.bincount(
+                    inverse,
+                    weights=parse_array([key(r) for r in records]),
+                    minlength=len(keys),
+                ),
+                2,
+            )
+            for key in measures.values()
+        ]
+        cells = [
+            [*cell, count, *values]
+            for cell, count, *values in zip(
+                keys.tolist(), counts.tolist(), *(s.tolist() for s in sums)
+            )
+        ]
+
+    return {
+        "dimensions": list(dimensions),
+        "labels": labels,
+        "measures": ["count", *measures],
+        "cells": cells,
+    }
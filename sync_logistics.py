@@ -4,123 +4,27 @@ Sync Transportation & Payments data from Smartsheet
 Sheet: Transportation_Tracking
 """
 
-import os
-import json
-import requests
 from datetime import datetime
-from collections import Counter
 
-# Configuration
-SMARTSHEET_TOKEN = os.environ.get(
-    "SMARTSHEET_TOKEN", "r6WG6zpLw2TR84F54tZCCzMtqjkTlTbuWDiws"
+from number_parser import parse_number
+from publish import write_json
+from smartsheet_client import get_client
+from sparse_cube import build_cube
+from sheet_sync import SheetSync, build_arg_parser
+from transportation_sheet import (
+    SMARTSHEET_TOKEN,
+    TRANSPORTATION_SHEET_ID,
+    COLUMN_MAPPINGS,
+    process_sheet,
 )
-TRANSPORTATION_SHEET_ID = 7876932495429508  # Transportation_Tracking
-
-# Column mappings
-COLUMN_MAPPINGS = {
-    "#": "serial_no",
-    "Job Order NO.": "job_order_no",
-    "Company": "company",
-    "Project Name": "project",
-    "Rqstr Name": "requester",
-    "Rqst Date": "request_date",
-    "supplier": "supplier",
-    "EQUIPMENT 1": "equipment_1",
-    "price1": "price_1",
-    "EQUIPMENT 2": "equipment_2",
-    "Price2": "price_2",
-    "EQUIPMENT 3": "equipment_3",
-    "Price3": "price_3",
-    "EQUIPMENT 4": "equipment_4",
-    "Price4": "price_4",
-    "EQUIPMENT 5": "equipment_5",
-    "price5": "price_5",
-    "Type of Rent": "rent_type",
-    "Total Amount": "total_amount",
-    "Act Date2": "actual_date",
-    "Duration": "duration",
-    "Status": "status",
-    "Pending with": "pending_with",
-    "Remarks": "remarks",
-}
-
-
-def safe_float(value):
-    """Safely convert value to float"""
-    if value is None:
-        return 0.0
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        cleaned = (
-            str(value)
-            .replace(",", "")
-            .replace(" ", "")
-            .replace("SAR", "")
-            .replace("USD", "")
-        )
-        return float(cleaned) if cleaned else 0.0
-    except:
-        return 0.0
-
-
-def get_sheet_data(sheet_id):
-    """Fetch data from Smartsheet API"""
-    headers = {
-        "Authorization": f"Bearer {SMARTSHEET_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
-    url = f"https://api.smartsheet.com/2.0/sheets/{sheet_id}"
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
-
-
-def process_sheet(sheet_data):
-    """Process sheet data into records"""
-    col_map = {}
-    for col in sheet_data.get("columns", []):
-        if col["title"] in COLUMN_MAPPINGS:
-            col_map[col["id"]] = COLUMN_MAPPINGS[col["title"]]
-
-    records = []
-    for row in sheet_data.get("rows", []):
-        record = {}
-
-        for cell in row.get("cells", []):
-            col_id = cell.get("columnId")
-            value = cell.get("value") or cell.get("displayValue")
-
-            if col_id in col_map and value is not None:
-                record[col_map[col_id]] = value
 
-        # Only add if has job order number or project
-        if record.get("job_order_no") or record.get("project"):
-            records.append(record)
-
-    return records
+TRANSPORTATION_OUTPUT = "transportation_full_data.json"
+PAYMENTS_OUTPUT = "payments_full_data.json"
 
 
 def prepare_transportation_data(records):
     """Prepare transportation dashboard data"""
-    # Calculate total amount for each record
-    for r in records:
-        if not r.get("total_amount"):
-            total = sum(
-                [
-                    safe_float(r.get("price_1")),
-                    safe_float(r.get("price_2")),
-                    safe_float(r.get("price_3")),
-                    safe_float(r.get("price_4")),
-                    safe_float(r.get("price_5")),
-                ]
-            )
-            r["total_amount"] = total
-        else:
-            r["total_amount"] = safe_float(r.get("total_amount"))
-
-    # Status normalization
+    # Status normalization (total_amount is derived once in process_sheet)
     for r in records:
         status = str(r.get("status", "")).strip().lower()
         if status in ["done", "completed", "complete"]:
@@ -161,6 +65,20 @@ def prepare_transportation_data(records):
     statuses = sorted(set(r.get("status") for r in records if r.get("status")))
     companies = sorted(set(r.get("company") for r in records if r.get("company")))
 
+    # Filtering cube: counts and amounts per project, supplier, month and status
+    cube = build_cube(
+        records,
+        {
+            "project": lambda r: r.get("project"),
+            "supplier": lambda r: r.get("supplier"),
+            "month": lambda r: str(r.get("request_date"))[:7]
+            if r.get("request_date")
+            else None,
+            "status": lambda r: r.get("status"),
+        },
+        {"amount": lambda r: r.get("total_amount", 0)},
+    )
+
     # Format records for output
     formatted_records = []
     for r in records:
@@ -184,7 +102,7 @@ def prepare_transportation_data(records):
                 "actual_date": str(r.get("actual_date", ""))
                 if r.get("actual_date")
                 else "",
-                "duration": safe_float(r.get("duration")),
+                "duration": parse_number(r.get("duration")),
                 "status": r.get("status", "In Progress"),
                 "pending_with": r.get("pending_with", ""),
                 "remarks": r.get("remarks", ""),
@@ -205,13 +123,14 @@ def prepare_transportation_data(records):
             "status": statuses if statuses else ["Done", "In Progress", "Not Done"],
             "companies": companies,
         },
+        "cube": cube,
         "records": formatted_records,
     }
 
 
 def prepare_payments_data(records):
     """Prepare payments dashboard data - filter records with amounts"""
-    payment_records = [r for r in records if safe_float(r.get("total_amount")) > 0]
+    payment_records = [r for r in records if parse_number(r.get("total_amount")) > 0]
 
     # Extract unique values for filters
     projects = sorted(
@@ -251,12 +170,12 @@ def prepare_payments_data(records):
                 else "",
                 "supplier": r.get("supplier", "Unknown"),
                 "equipment_1": r.get("equipment_1", ""),
-                "total_amount": safe_float(r.get("total_amount")),
+                "total_amount": parse_number(r.get("total_amount")),
                 "payment_status": r.get("payment_status", "Pending"),
-                "duration": safe_float(r.get("duration")),
+                "duration": parse_number(r.get("duration")),
                 "invoice_received": "Yes" if r.get("status") == "Done" else "No",
-                "invoice_receive_days": safe_float(r.get("duration")),
-                "payment_cycle_days": safe_float(r.get("duration")) + 30,  # Estimate
+                "invoice_receive_days": parse_number(r.get("duration")),
+                "payment_cycle_days": parse_number(r.get("duration")) + 30,  # Estimate
             }
         )
 
@@ -277,7 +196,11 @@ def prepare_payments_data(records):
     }
 
 
-def main():
+def main(argv=None):
+    args = build_arg_parser(
+        "Sync transportation and payments data from Smartsheet"
+    ).parse_args(argv)
+
     print(f"=== Logistics Data Sync ===")
     print(f"Started at: {datetime.now()}")
     print(f"Sheet ID: {TRANSPORTATION_SHEET_ID}")
@@ -285,12 +208,23 @@ def main():
     try:
         # Fetch data from Smartsheet
         print("\nFetching data from Smartsheet...")
-        sheet_data = get_sheet_data(TRANSPORTATION_SHEET_ID)
-        print(f"Sheet name: {sheet_data.get('name')}")
+        sync = SheetSync.from_args(
+            get_client(SMARTSHEET_TOKEN),
+            TRANSPORTATION_SHEET_ID,
+            "sync_logistics",
+            COLUMN_MAPPINGS,
+            [TRANSPORTATION_OUTPUT, PAYMENTS_OUTPUT],
+            args,
+        )
+        rows = sync.fetch()
+        if rows is None:
+            print("Nothing to do.")
+            return True
+        print(f"Sheet name: {sync.sheet_name}")
 
         # Process data
         print("\nProcessing records...")
-        records = process_sheet(sheet_data)
+        records = process_sheet(rows)
         print(f"Total records found: {len(records)}")
 
         # Prepare transportation data
@@ -298,8 +232,7 @@ def main():
         transportation_data = prepare_transportation_data(records)
 
         # Save transportation data
-        with open("transportation_full_data.json", "w", encoding="utf-8") as f:
-            json.dump(transportation_data, f, ensure_ascii=False, indent=2)
+        write_json(TRANSPORTATION_OUTPUT, transportation_data, columns=["records"])
         print(
             f"Saved transportation_full_data.json ({transportation_data['metadata']['total_records']} records)"
         )
@@ -309,12 +242,13 @@ def main():
         payments_data = prepare_payments_data(records)
 
         # Save payments data
-        with open("payments_full_data.json", "w", encoding="utf-8") as f:
-            json.dump(payments_data, f, ensure_ascii=False, indent=2)
+        write_json(PAYMENTS_OUTPUT, payments_data, columns=["records"])
         print(
             f"Saved payments_full_data.json ({payments_data['metadata']['total_records']} records)"
         )
 
+        sync.commit()
+
         # Summary
         print(f"\n=== Sync Complete ===")
         print(
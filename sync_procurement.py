@@ -5,16 +5,24 @@ Sheet: PR to PO Report 25th Dec-2025
 """
 
 import os
-import json
-import requests
 from datetime import datetime
-from collections import Counter
+import numpy as np
+
+from daily_bins import daily_series
+from number_parser import parse_number
+from period_cube import pr_status_cube
+from publish import write_json
+from record_table import GroupBy, RecordTable
+from smartsheet_client import get_client
+from sparse_cube import build_cube
+from sheet_sync import SheetSync, build_arg_parser
 
 # Configuration
 SMARTSHEET_TOKEN = os.environ.get(
     "SMARTSHEET_TOKEN", "r6WG6zpLw2TR84F54tZCCzMtqjkTlTbuWDiws"
 )
 PR_TO_PO_SHEET_ID = 5789339180027780  # PR to PO Report 25th Dec-2025
+OUTPUT_PATH = "data/pr_data.json"
 
 # Column mappings
 COLUMN_MAPPINGS = {
@@ -46,123 +54,107 @@ COLUMN_MAPPINGS = {
 }
 
 
-def get_sheet_data(sheet_id):
-    """Fetch data from Smartsheet API"""
-    headers = {
-        "Authorization": f"Bearer {SMARTSHEET_TOKEN}",
-        "Content-Type": "application/json",
-    }
+# Filtering cube shipped to the dashboard: dimensions and summed measures
+CUBE_DIMENSIONS = {
+    "project": lambda pr: pr.get("project"),
+    "vendor": lambda pr: pr.get("vendor"),
+    "month": lambda pr: pr_month(pr),
+    "status": lambda pr: pr.get("status"),
+}
+CUBE_MEASURES = {
+    "pr_value": lambda pr: pr.get("pr_value"),
+    "po_value": lambda pr: pr.get("po_value"),
+}
 
-    url = f"https://api.smartsheet.com/2.0/sheets/{sheet_id}"
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
 
+def process_sheet(rows):
+    """Process decoded sheet rows into PR records"""
+    # Only keep rows with a PR number
+    return [pr for pr in rows if pr.get("pr_num")]
 
-def process_sheet(sheet_data):
-    """Process sheet data into dashboard format"""
-    # Build column mapping
-    col_map = {}
-    for col in sheet_data.get("columns", []):
-        if col["title"] in COLUMN_MAPPINGS:
-            col_map[col["id"]] = COLUMN_MAPPINGS[col["title"]]
 
-    # Extract PRs
-    prs = []
-    for row in sheet_data.get("rows", []):
-        pr = {}
+def get_year(pr):
+    """Year of the PR's submission (or approval) date"""
+    date_str = pr.get("submission_date") or pr.get("approved_date")
+    if date_str:
+        try:
+            return int(str(date_str)[:4])
+        except:
+            pass
+    return None
 
-        for cell in row.get("cells", []):
-            col_id = cell.get("columnId")
-            value = cell.get("value") or cell.get("displayValue")
 
-            if col_id in col_map and value is not None:
-                pr[col_map[col_id]] = value
+def get_month(pr):
+    """Month number (1-12) of the PR's submission (or approval) date"""
+    date_str = pr.get("submission_date") or pr.get("approved_date")
+    if date_str:
+        try:
+            return int(str(date_str)[5:7])
+        except:
+            pass
+    return None
 
-        # Only add if has PR number
-        if pr.get("pr_num"):
-            prs.append(pr)
 
-    return prs
+def pr_month(pr):
+    """YYYY-MM of the PR dated the way the dashboard filters it (approval first)"""
+    date_str = pr.get("approved_date") or pr.get("submission_date")
+    return str(date_str)[:7] if date_str else None
 
 
-def safe_float(value):
-    """Safely convert value to float"""
-    if value is None:
-        return 0.0
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        # Remove currency symbols, commas, spaces
-        cleaned = (
-            str(value)
-            .replace(",", "")
-            .replace(" ", "")
-            .replace("SAR", "")
-            .replace("USD", "")
+def numeric_days(value):
+    """PR to PO days only count when the sheet holds an actual number"""
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+def build_pr_table(all_prs):
+    """Columnar view of the PRs used by the statistics"""
+    return (
+        RecordTable(all_prs)
+        .add_numeric("pr_value", lambda pr: pr.get("pr_value"), parse_number)
+        .add_numeric("po_value", lambda pr: pr.get("po_value"), parse_number)
+        .add_numeric("saving_amount", lambda pr: pr.get("saving_amount"), parse_number)
+        .add_numeric("pr_to_po_days", lambda pr: pr.get("pr_to_po_days"), numeric_days)
+        .add_numeric(
+            "month", get_month, lambda m: np.nan if m is None else float(m)
         )
-        return float(cleaned) if cleaned else 0.0
-    except:
-        return 0.0
+        .add_categorical("status", lambda pr: pr.get("status"))
+        .add_categorical("project", lambda pr: pr.get("project"))
+        .add_categorical("vendor", lambda pr: pr.get("vendor"))
+        .add_categorical("agent", lambda pr: pr.get("agent"))
+        .add_categorical("year", get_year)
+        .add_flag("has_po", lambda pr: pr.get("po_num"))
+    )
 
 
-def calculate_statistics(all_prs):
-    """Calculate KPIs and statistics from PR data"""
-    current_year = datetime.now().year
+def calculate_statistics(table):
+    """Calculate KPIs and statistics from the PR table"""
+    status = table["status"]
+    has_status = status.truthy()
+    is_approved = status.isin(["APPROVED"])
+    is_returned = status.isin(["RETURNED"])
+    is_rejected = status.isin(["REJECTED"])
 
     # Status counts
-    status_breakdown = Counter(
-        pr.get("status", "UNKNOWN") for pr in all_prs if pr.get("status")
-    )
-
-    # Filter PRs by year
-    def get_year(pr):
-        date_str = pr.get("submission_date") or pr.get("approved_date")
-        if date_str:
-            try:
-                return int(str(date_str)[:4])
-            except:
-                pass
-        return None
-
-    prs_current_year = [pr for pr in all_prs if get_year(pr) == current_year]
-    prs_2025 = [pr for pr in all_prs if get_year(pr) == 2025]
-
-    # Current year stats
-    approved_current = len(
-        [p for p in prs_current_year if p.get("status") == "APPROVED"]
-    )
-    returned_current = len(
-        [p for p in prs_current_year if p.get("status") == "RETURNED"]
-    )
-    rejected_current = len(
-        [p for p in prs_current_year if p.get("status") == "REJECTED"]
-    )
+    by_status = GroupBy([status], has_status)
+    status_breakdown = by_status.tally(by_status.count())
 
     # 2025 stats (for compatibility)
-    approved_2025 = len([p for p in prs_2025 if p.get("status") == "APPROVED"])
-    returned_2025 = len([p for p in prs_2025 if p.get("status") == "RETURNED"])
+    year = table["year"]
+    in_2025 = year.isin([2025])
+    approved_2025 = int(np.count_nonzero(in_2025 & is_approved))
+    returned_2025 = int(np.count_nonzero(in_2025 & is_returned))
 
     # Monthly breakdown for 2025 (most recent complete year)
-    monthly_approved = [0] * 12
-    monthly_returned = [0] * 12
-    monthly_rejected = [0] * 12
-
-    for pr in prs_2025:
-        date_str = pr.get("submission_date") or pr.get("approved_date")
-        if date_str:
-            try:
-                month = int(str(date_str)[5:7]) - 1  # 0-indexed
-                if 0 <= month < 12:
-                    status = pr.get("status")
-                    if status == "APPROVED":
-                        monthly_approved[month] += 1
-                    elif status == "RETURNED":
-                        monthly_returned[month] += 1
-                    elif status == "REJECTED":
-                        monthly_rejected[month] += 1
-            except:
-                pass
+    month = table["month"]
+    in_month = in_2025 & month.present & (month.values >= 1) & (month.values <= 12)
+
+    def monthly_counts(mask):
+        months = month.values[in_month & mask].astype(np.int64) - 1
+        return np.bincount(months, minlength=12).tolist()
+
+    monthly_approved = monthly_counts(is_approved)
+    monthly_returned = monthly_counts(is_returned)
+    monthly_rejected = monthly_counts(is_rejected)
 
     # Calculate return rates
     monthly_return_rate = []
@@ -175,93 +167,71 @@ def calculate_statistics(all_prs):
         monthly_return_rate.append(rate)
 
     # PR to PO statistics
-    valid_days = [
-        pr["pr_to_po_days"]
-        for pr in all_prs
-        if pr.get("pr_to_po_days") and isinstance(pr["pr_to_po_days"], (int, float))
-    ]
+    valid_days = table["pr_to_po_days"].valid()
 
-    avg_pr_to_po = round(sum(valid_days) / len(valid_days), 1) if valid_days else 0
-    within_30_days = len([d for d in valid_days if d <= 30])
-    after_30_days = len([d for d in valid_days if d > 30])
+    avg_pr_to_po = (
+        round(float(valid_days.sum()) / len(valid_days), 1) if len(valid_days) else 0
+    )
+    within_30_days = int(np.count_nonzero(valid_days <= 30))
+    after_30_days = int(np.count_nonzero(valid_days > 30))
 
     # Total values
-    total_pr_value = sum(safe_float(pr.get("pr_value")) for pr in all_prs)
-    total_po_value = sum(safe_float(pr.get("po_value")) for pr in all_prs)
-    total_savings = sum(safe_float(pr.get("saving_amount")) for pr in all_prs)
+    po_value = table["po_value"].values
+    total_pr_value = float(table["pr_value"].values.sum())
+    total_po_value = float(po_value.sum())
+    total_savings = float(table["saving_amount"].values.sum())
 
-    # Projects list
-    projects = sorted(set(pr.get("project") for pr in all_prs if pr.get("project")))
+    def options(column):
+        return sorted(c for c in table[column].categories if c)
 
-    # Vendors list
-    vendors = sorted(set(pr.get("vendor") for pr in all_prs if pr.get("vendor")))
-
-    # Agents list
-    agents = sorted(set(pr.get("agent") for pr in all_prs if pr.get("agent")))
-
-    # Status list
-    statuses = sorted(set(pr.get("status") for pr in all_prs if pr.get("status")))
+    # Filter lists
+    projects = options("project")
+    vendors = options("vendor")
+    agents = options("agent")
+    statuses = options("status")
 
     # Years extraction
-    years = sorted(
-        [y for y in set(get_year(pr) for pr in all_prs) if y is not None], reverse=True
-    )
+    years = sorted([y for y in year.categories if y is not None], reverse=True)
 
     # Top projects by PR count
-    project_counts = Counter(pr.get("project") for pr in all_prs if pr.get("project"))
-    top_projects = dict(project_counts.most_common(15))
+    by_project = GroupBy([table["project"]], table["project"].truthy())
+    top_projects = by_project.ranked(by_project.count(), 15)
 
     # Top vendors by PO value
-    vendor_values = {}
-    for pr in all_prs:
-        vendor = pr.get("vendor")
-        if vendor:
-            vendor_values[vendor] = vendor_values.get(vendor, 0) + safe_float(
-                pr.get("po_value")
-            )
-    top_vendors = dict(
-        sorted(vendor_values.items(), key=lambda x: x[1], reverse=True)[:15]
-    )
+    by_vendor = GroupBy([table["vendor"]], table["vendor"].truthy())
+    top_vendors = by_vendor.ranked(by_vendor.sum(po_value), 15)
 
     # Agent performance
-    agent_stats = {}
-    for pr in all_prs:
-        agent = pr.get("agent")
-        if agent:
-            if agent not in agent_stats:
-                agent_stats[agent] = {
-                    "total": 0,
-                    "approved": 0,
-                    "returned": 0,
-                    "rejected": 0,
-                }
-            agent_stats[agent]["total"] += 1
-            status = pr.get("status")
-            if status == "APPROVED":
-                agent_stats[agent]["approved"] += 1
-            elif status == "RETURNED":
-                agent_stats[agent]["returned"] += 1
-            elif status == "REJECTED":
-                agent_stats[agent]["rejected"] += 1
+    by_agent = GroupBy([table["agent"]], table["agent"].truthy())
+    agent_totals = by_agent.aggregate(
+        total="count",
+        approved=("sum", is_approved),
+        returned=("sum", is_returned),
+        rejected=("sum", is_rejected),
+    )
+    agent_stats = {
+        label: {name: int(totals[g]) for name, totals in agent_totals.items()}
+        for g, label in enumerate(by_agent.labels())
+    }
 
     return {
         "summary": {
-            "total_prs": len(all_prs),
-            "total_approved": dict(status_breakdown).get("APPROVED", 0),
-            "total_returned": dict(status_breakdown).get("RETURNED", 0),
-            "total_rejected": dict(status_breakdown).get("REJECTED", 0),
-            "total_in_process": dict(status_breakdown).get("IN PROCESS", 0),
-            "total_incomplete": dict(status_breakdown).get("INCOMPLETE", 0),
+            "total_prs": len(table),
+            "total_approved": status_breakdown.get("APPROVED", 0),
+            "total_returned": status_breakdown.get("RETURNED", 0),
+            "total_rejected": status_breakdown.get("REJECTED", 0),
+            "total_in_process": status_breakdown.get("IN PROCESS", 0),
+            "total_incomplete": status_breakdown.get("INCOMPLETE", 0),
             "total_approved_2025": approved_2025,
             "total_returned_2025": returned_2025,
             "return_rate_2025": round((returned_2025 / approved_2025 * 100), 1)
             if approved_2025 > 0
             else 0,
-            "status_breakdown": dict(status_breakdown),
+            "status_breakdown": status_breakdown,
             "avg_pr_to_po_days": avg_pr_to_po,
             "within_30_days": within_30_days,
             "after_30_days": after_30_days,
-            "total_with_po": len([pr for pr in all_prs if pr.get("po_num")]),
+            "total_with_po": int(np.count_nonzero(table["has_po"])),
             "total_pr_value": round(total_pr_value, 2),
             "total_po_value": round(total_po_value, 2),
             "total_savings": round(total_savings, 2),
@@ -295,6 +265,21 @@ def calculate_statistics(all_prs):
         },
         "charts": {"top_projects": top_projects, "top_vendors": top_vendors},
         "agent_stats": agent_stats,
+        "status_cube": pr_status_cube(table.records),
+        "cube": build_cube(table.records, CUBE_DIMENSIONS, CUBE_MEASURES),
+        "daily": daily_series(
+            [
+                pr.get("submission_date") or pr.get("approved_date")
+                for pr in table.records
+            ],
+            {
+                "prs": np.ones(len(table), dtype=np.int64),
+                "pr_value": table["pr_value"].values,
+                "approved": is_approved,
+                "within_30_days": table["pr_to_po_days"].present
+                & (table["pr_to_po_days"].values <= 30),
+            },
+        ),
     }
 
 
@@ -318,9 +303,9 @@ def format_pr_for_output(pr):
         if pr.get("reject_date")
         else None,
         "vendor": pr.get("vendor"),
-        "pr_value": safe_float(pr.get("pr_value")),
+        "pr_value": parse_number(pr.get("pr_value")),
         "po_num": pr.get("po_num"),
-        "po_value": safe_float(pr.get("po_value")),
+        "po_value": parse_number(pr.get("po_value")),
         "po_status": pr.get("po_status", ""),
         "pr_to_po_days": pr.get("pr_to_po_days"),
         "pr_note": pr.get("pr_note", ""),
@@ -330,11 +315,13 @@ def format_pr_for_output(pr):
         else None,
         "agent": pr.get("agent", ""),
         "currency": pr.get("currency", "SAR"),
-        "saving_amount": safe_float(pr.get("saving_amount")),
+        "saving_amount": parse_number(pr.get("saving_amount")),
     }
 
 
-def main():
+def main(argv=None):
+    args = build_arg_parser("Sync procurement data from Smartsheet").parse_args(argv)
+
     print(f"=== Procurement Data Sync ===")
     print(f"Started at: {datetime.now()}")
     print(f"Sheet ID: {PR_TO_PO_SHEET_ID}")
@@ -342,17 +329,28 @@ def main():
     try:
         # Fetch data from Smartsheet
         print("\nFetching data from Smartsheet...")
-        sheet_data = get_sheet_data(PR_TO_PO_SHEET_ID)
-        print(f"Sheet name: {sheet_data.get('name')}")
+        sync = SheetSync.from_args(
+            get_client(SMARTSHEET_TOKEN),
+            PR_TO_PO_SHEET_ID,
+            "sync_procurement",
+            COLUMN_MAPPINGS,
+            [OUTPUT_PATH],
+            args,
+        )
+        rows = sync.fetch()
+        if rows is None:
+            print("Nothing to do.")
+            return True
+        print(f"Sheet name: {sync.sheet_name}")
 
         # Process data
         print("\nProcessing PR data...")
-        all_prs = process_sheet(sheet_data)
+        all_prs = process_sheet(rows)
         print(f"Total PRs found: {len(all_prs)}")
 
         # Calculate statistics
         print("\nCalculating statistics...")
-        stats = calculate_statistics(all_prs)
+        stats = calculate_statistics(build_pr_table(all_prs))
 
         # Format PRs for output
         formatted_prs = [format_pr_for_output(pr) for pr in all_prs]
@@ -360,16 +358,16 @@ def main():
         # Create output data
         output_data = {
             "last_updated": datetime.now().isoformat(),
-            "source_sheet": sheet_data.get("name"),
+            "source_sheet": sync.sheet_name,
             "source_sheet_id": PR_TO_PO_SHEET_ID,
             **stats,
             "all_prs": formatted_prs,
         }
 
         # Save to JSON
-        output_path = "data/pr_data.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        output_path = OUTPUT_PATH
+        write_json(output_path, output_data, columns=["all_prs"])
+        sync.commit()
 
         print(f"\n=== Sync Complete ===")
         print(f"Data saved to: {output_path}")
@@ -3,101 +3,33 @@
 Sync SLA Dashboard data from Smartsheet Transportation_Tracking
 """
 
-import os
-import json
-import requests
 from datetime import datetime
-from collections import Counter
 
-# Configuration
-SMARTSHEET_TOKEN = os.environ.get(
-    "SMARTSHEET_TOKEN", "r6WG6zpLw2TR84F54tZCCzMtqjkTlTbuWDiws"
+import numpy as np
+
+from business_days import on_time_mask, sla_days
+from daily_bins import daily_series
+from number_parser import parse_number
+from percentiles import (
+    MonthlySketches,
+    duration_percentiles,
+    grouped_duration_stats,
+    position_index,
+    select_quantiles,
+)
+from publish import write_json
+from ranking import MonthlyHeavyHitters, history_leaders
+from record_table import CategoricalColumn, GroupBy, RecordTable
+from smartsheet_client import get_client
+from sheet_sync import SheetSync, build_arg_parser
+from transportation_sheet import (
+    SMARTSHEET_TOKEN,
+    TRANSPORTATION_SHEET_ID,
+    COLUMN_MAPPINGS,
+    process_sheet,
 )
-TRANSPORTATION_SHEET_ID = 7876932495429508  # Transportation_Tracking
-
-# Column mappings
-COLUMN_MAPPINGS = {
-    "#": "serial_no",
-    "Job Order NO.": "job_order_no",
-    "Company": "company",
-    "Project Name": "project",
-    "Rqstr Name": "requester",
-    "Rqst Date": "request_date",
-    "supplier": "supplier",
-    "EQUIPMENT 1": "equipment_1",
-    "price1": "price_1",
-    "EQUIPMENT 2": "equipment_2",
-    "Price2": "price_2",
-    "EQUIPMENT 3": "equipment_3",
-    "Price3": "price_3",
-    "EQUIPMENT 4": "equipment_4",
-    "Price4": "price_4",
-    "EQUIPMENT 5": "equipment_5",
-    "price5": "price_5",
-    "Type of Rent": "rent_type",
-    "Total Amount": "total_amount",
-    "Act Date2": "actual_date",
-    "Duration": "duration",
-    "Status": "status",
-    "Pending with": "pending_with",
-    "Remarks": "remarks",
-}
-
-
-def safe_float(value):
-    """Safely convert value to float"""
-    if value is None:
-        return 0.0
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        cleaned = (
-            str(value)
-            .replace(",", "")
-            .replace(" ", "")
-            .replace("SAR", "")
-            .replace("USD", "")
-        )
-        return float(cleaned) if cleaned else 0.0
-    except:
-        return 0.0
-
-
-def get_sheet_data(sheet_id):
-    """Fetch data from Smartsheet API"""
-    headers = {
-        "Authorization": f"Bearer {SMARTSHEET_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
-    url = f"https://api.smartsheet.com/2.0/sheets/{sheet_id}"
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
-
-
-def process_sheet(sheet_data):
-    """Process sheet data into records"""
-    col_map = {}
-    for col in sheet_data.get("columns", []):
-        if col["title"] in COLUMN_MAPPINGS:
-            col_map[col["id"]] = COLUMN_MAPPINGS[col["title"]]
-
-    records = []
-    for row in sheet_data.get("rows", []):
-        record = {}
-
-        for cell in row.get("cells", []):
-            col_id = cell.get("columnId")
-            value = cell.get("value") or cell.get("displayValue")
-
-            if col_id in col_map and value is not None:
-                record[col_map[col_id]] = value
-
-        if record.get("job_order_no") or record.get("project"):
-            records.append(record)
 
-    return records
+OUTPUT_PATH = "data/sla_data.json"
 
 
 def calculate_sla_metrics(records):
@@ -125,41 +57,35 @@ def calculate_sla_metrics(records):
     in_progress_orders = len([r for r in records if r.get("status") == "In Progress"])
     not_done_orders = len([r for r in records if r.get("status") == "Not Done"])
 
-    # Calculate amounts
-    for r in records:
-        if not r.get("total_amount"):
-            total = sum(
-                [
-                    safe_float(r.get("price_1")),
-                    safe_float(r.get("price_2")),
-                    safe_float(r.get("price_3")),
-                    safe_float(r.get("price_4")),
-                    safe_float(r.get("price_5")),
-                ]
-            )
-            r["total_amount"] = total
-        else:
-            r["total_amount"] = safe_float(r.get("total_amount"))
-
+    # Amounts (total_amount is derived once in process_sheet)
     total_amount = sum(r.get("total_amount", 0) for r in records)
 
     # Duration statistics
     durations = [
-        safe_float(r.get("duration"))
+        parse_number(r.get("duration"))
         for r in records
-        if r.get("duration") and safe_float(r.get("duration")) > 0
+        if r.get("duration") and parse_number(r.get("duration")) > 0
     ]
 
+    # On time means within 3 business days of the request; rows whose dates
+    # cannot be used keep their recorded duration
+    recorded = np.array([parse_number(r.get("duration")) for r in records])
+    has_duration = np.array([bool(r.get("duration")) for r in records], bool)
+    has_duration &= recorded > 0
+    within_sla = has_duration & on_time_mask(
+        sla_days(
+            [r.get("request_date") for r in records],
+            [r.get("actual_date") for r in records],
+            recorded,
+        )
+    )
+
     if durations:
         avg_duration = sum(durations) / len(durations)
-        sorted_durations = sorted(durations)
-        median_duration = sorted_durations[len(sorted_durations) // 2]
-        p90_index = int(len(sorted_durations) * 0.9)
-        p90_duration = sorted_durations[min(p90_index, len(sorted_durations) - 1)]
-
-        # On-time rate (completed within 3 days)
-        on_time = len([d for d in durations if d <= 3])
-        on_time_rate = (on_time / len(durations)) * 100
+        median_duration, p90_duration = select_quantiles(durations, (0.5, 0.9), position_index)
+
+        # On-time rate (completed within 3 business days)
+        on_time_rate = (np.count_nonzero(within_sla) / len(durations)) * 100
     else:
         avg_duration = 0
         median_duration = 0
@@ -172,88 +98,55 @@ def calculate_sla_metrics(records):
     # Open orders
     open_orders = in_progress_orders + not_done_orders
 
-    # Company breakdown
-    company_counts = Counter(
-        r.get("company", "Unknown") for r in records if r.get("company")
-    )
+    table = build_record_table(records)
+    amount = table["amount"].values
+    is_done = table["status"].isin(["Done"])
 
-    # Supplier statistics
-    supplier_counts = Counter(
-        r.get("supplier")
-        for r in records
-        if r.get("supplier") and not str(r.get("supplier", "")).startswith("202")
-    )
-    supplier_amounts = {}
-    for r in records:
-        supplier = r.get("supplier")
-        if supplier and not str(supplier).startswith("202"):
-            supplier_amounts[supplier] = supplier_amounts.get(supplier, 0) + r.get(
-                "total_amount", 0
-            )
+    # Company breakdown
+    by_company = GroupBy([table["company"]], table["company"].truthy())
+    company_counts = by_company.tally(by_company.count())
 
-    top_suppliers = dict(supplier_counts.most_common(10))
-    top_suppliers_by_amount = dict(
-        sorted(supplier_amounts.items(), key=lambda x: x[1], reverse=True)[:10]
+    # Supplier statistics (date values pasted into the supplier column are skipped)
+    supplier = table["supplier"]
+    by_supplier = GroupBy(
+        [supplier], supplier.where(lambda s: s and not str(s).startswith("202"))
     )
+    top_suppliers = by_supplier.ranked(by_supplier.count(), 10)
+    top_suppliers_by_amount = by_supplier.ranked(by_supplier.sum(amount), 10)
 
     # Project statistics
-    project_counts = Counter(r.get("project") for r in records if r.get("project"))
-    project_amounts = {}
-    for r in records:
-        project = r.get("project")
-        if project:
-            project_amounts[project] = project_amounts.get(project, 0) + r.get(
-                "total_amount", 0
-            )
-
-    top_projects_by_orders = dict(project_counts.most_common(20))
-    top_projects_by_amount = dict(
-        sorted(project_amounts.items(), key=lambda x: x[1], reverse=True)[:20]
-    )
+    by_project = GroupBy([table["project"]], table["project"].truthy())
+    top_projects_by_orders = by_project.ranked(by_project.count(), 20)
+    top_projects_by_amount = by_project.ranked(by_project.sum(amount), 20)
 
-    # Equipment statistics
-    equipment_counts = Counter()
-    equipment_amounts = {}
-    for r in records:
-        for i in range(1, 6):
-            eq = r.get(f"equipment_{i}")
-            price = safe_float(r.get(f"price_{i}"))
-            if eq and isinstance(eq, str):
-                equipment_counts[eq] += 1
-                equipment_amounts[eq] = equipment_amounts.get(eq, 0) + price
-
-    equipment_distribution = dict(equipment_counts.most_common(15))
-    equipment_by_amount = dict(
-        sorted(equipment_amounts.items(), key=lambda x: x[1], reverse=True)[:15]
-    )
+    # Equipment statistics, one row per filled equipment slot
+    slots = [
+        (r.get(f"equipment_{i}"), parse_number(r.get(f"price_{i}")))
+        for r in records
+        for i in range(1, 6)
+    ]
+    slots = [(eq, price) for eq, price in slots if eq and isinstance(eq, str)]
+    by_equipment = GroupBy([CategoricalColumn.encode(eq for eq, _ in slots)])
+    prices = np.array([price for _, price in slots], dtype=np.float64)
+    equipment_distribution = by_equipment.ranked(by_equipment.count(), 15)
+    equipment_by_amount = by_equipment.ranked(by_equipment.sum(prices), 15)
 
     # Monthly trend
-    monthly_data = {}
-    for r in records:
-        date_str = r.get("request_date")
-        if date_str:
-            try:
-                month = str(date_str)[:7]  # YYYY-MM
-                if month not in monthly_data:
-                    monthly_data[month] = {"orders": 0, "amount": 0, "done": 0}
-                monthly_data[month]["orders"] += 1
-                monthly_data[month]["amount"] += r.get("total_amount", 0)
-                if r.get("status") == "Done":
-                    monthly_data[month]["done"] += 1
-            except:
-                pass
-
+    by_month = GroupBy([table["month"]], table["month"].truthy())
+    monthly = by_month.aggregate(
+        orders="count", amount=("sum", amount), done=("sum", is_done)
+    )
     monthly_trend = [
         {
-            "month": k,
-            "orders": v["orders"],
-            "amount": v["amount"],
-            "done": v["done"],
-            "completion_rate": round((v["done"] / v["orders"] * 100), 1)
-            if v["orders"] > 0
+            "month": month,
+            "orders": int(monthly["orders"][g]),
+            "amount": float(monthly["amount"][g]),
+            "done": int(monthly["done"][g]),
+            "completion_rate": round((monthly["done"][g] / monthly["orders"][g] * 100), 1)
+            if monthly["orders"][g] > 0
             else 0,
         }
-        for k, v in sorted(monthly_data.items())
+        for month, g in sorted((month, g) for g, month in enumerate(by_month.labels()))
     ]
 
     return {
@@ -284,27 +177,78 @@ def calculate_sla_metrics(records):
         "equipment_distribution": equipment_distribution,
         "equipment_by_amount": equipment_by_amount,
         "monthly_trend": monthly_trend,
+        **grouped_duration_sections(records, within_sla),
+        "daily": daily_series(
+            [r.get("request_date") for r in records],
+            {
+                "orders": np.ones(len(records), dtype=np.int64),
+                "amount": amount,
+                "done": is_done,
+                "on_time": within_sla,
+            },
+        ),
     }
 
 
+def build_record_table(records):
+    """Columnar view of the normalized records used by the SLA metrics"""
+    return (
+        RecordTable(records)
+        .add_numeric("amount", lambda r: r.get("total_amount", 0), parse_number)
+        .add_categorical("status", lambda r: r.get("status"))
+        .add_categorical("company", lambda r: r.get("company"))
+        .add_categorical("supplier", lambda r: r.get("supplier"))
+        .add_categorical("project", lambda r: r.get("project"))
+        .add_categorical(
+            "month",
+            lambda r: str(r.get("request_date"))[:7] if r.get("request_date") else None,
+        )
+    )
+
+
+def grouped_duration_sections(records, within_sla):
+    """Per-supplier, per-project and per-equipment duration distributions
+
+    within_sla flags the records completed within the business-day SLA.
+    """
+    groups = {"sla_by_supplier": [], "sla_by_project": [], "sla_by_equipment": []}
+    durations = {name: [] for name in groups}
+    in_time = {name: [] for name in groups}
+
+    def add(name, label, duration, met):
+        groups[name].append(label)
+        durations[name].append(duration)
+        in_time[name].append(met)
+
+    for r, met in zip(records, within_sla.tolist()):
+        duration = parse_number(r.get("duration"))
+        if not (r.get("duration") and duration > 0):
+            continue
+        supplier = r.get("supplier")
+        if supplier and not str(supplier).startswith("202"):
+            add("sla_by_supplier", supplier, duration, met)
+        if r.get("project"):
+            add("sla_by_project", r.get("project"), duration, met)
+        for eq in dict.fromkeys(r.get(f"equipment_{i}") for i in range(1, 6)):
+            if eq and isinstance(eq, str):
+                add("sla_by_equipment", eq, duration, met)
+
+    sections = {}
+    for name, labels in groups.items():
+        column = CategoricalColumn.encode(labels)
+        sections[name] = grouped_duration_stats(
+            column.codes,
+            column.categories,
+            durations[name],
+            on_time=np.array(in_time[name], dtype=bool),
+        )
+    return sections
+
+
 def format_records_for_output(records):
     """Format records for JSON output"""
     formatted = []
     for r in records:
-        # Calculate total amount if not present
-        if not r.get("total_amount"):
-            total = sum(
-                [
-                    safe_float(r.get("price_1")),
-                    safe_float(r.get("price_2")),
-                    safe_float(r.get("price_3")),
-                    safe_float(r.get("price_4")),
-                    safe_float(r.get("price_5")),
-                ]
-            )
-        else:
-            total = safe_float(r.get("total_amount"))
-
         formatted.append(
             {
                 "job_order_no": r.get("job_order_no", ""),
@@ -318,11 +262,11 @@ def format_records_for_output(records):
                 "equipment_1": r.get("equipment_1", ""),
                 "equipment_2": r.get("equipment_2", ""),
                 "equipment_3": r.get("equipment_3", ""),
-                "total_amount": total,
+                "total_amount": r.get("total_amount", 0),
                 "actual_date": str(r.get("actual_date", ""))
                 if r.get("actual_date")
                 else "",
-                "duration": safe_float(r.get("duration")),
+                "duration": parse_number(r.get("duration")),
                 "status": r.get("status", "In Progress"),
                 "pending_with": r.get("pending_with", ""),
                 "remarks": r.get("remarks", ""),
@@ -332,7 +276,119 @@ def format_records_for_output(records):
     return formatted
 
 
-def main():
+def request_duration_percentiles(records, sketches):
+    """Duration percentiles overall, per request month and over trailing months"""
+    durations = []
+    months = []
+    for r in records:
+        duration = parse_number(r.get("duration"))
+        if r.get("duration") and duration > 0:
+            date_str = r.get("request_date")
+            durations.append(duration)
+            months.append(str(date_str)[:7] if date_str else None)
+    return duration_percentiles(durations, months, sketches)
+
+
+def request_history_leaders(records, leaders):
+    """All-history supplier, project and equipment leaders by orders and amount"""
+    table = build_record_table(records)
+    month = table["month"]
+    months = [month.categories[c] for c in month.codes.tolist()]
+    amount = table["amount"].values
+    suppliers = [
+        s if s and not str(s).startswith("202") else None
+        for s in (r.get("supplier") for r in records)
+    ]
+    projects = [r.get("project") for r in records]
+
+    # One row per filled equipment slot, dated by its order's request month
+    slots = [
+        (m, r.get(f"equipment_{i}"), parse_number(r.get(f"price_{i}")))
+        for r, m in zip(records, months)
+        for i in range(1, 6)
+        if r.get(f"equipment_{i}") and isinstance(r.get(f"equipment_{i}"), str)
+    ]
+    slot_months = [m for m, _, _ in slots]
+    equipment = [eq for _, eq, _ in slots]
+    prices = [price for _, _, price in slots]
+
+    return {
+        **history_leaders(
+            leaders,
+            months,
+            {
+                "suppliers": (suppliers, None, 10),
+                "suppliers_by_amount": (suppliers, amount, 10),
+                "projects": (projects, None, 20),
+                "projects_by_amount": (projects, amount, 20),
+            },
+        ),
+        **history_leaders(
+            leaders,
+            slot_months,
+            {
+                "equipment": (equipment, None, 15),
+                "equipment_by_amount": (equipment, prices, 15),
+            },
+        ),
+    }
+
+
+def build_sla_output(records, source_sheet, sketches=None, leaders=None):
+    """Build the sla_data.json payload from transportation records
+
+    Pass the consumer's persisted MonthlySketches and MonthlyHeavyHitters so
+    only the months that changed are re-summarized between runs;
+    without them both live in memory for this run only.
+    """
+    sla_data = calculate_sla_metrics(records)
+    sla_data["duration_percentiles"] = request_duration_percentiles(
+        records, sketches or MonthlySketches(None)
+    )
+    sla_data["all_time_leaders"] = request_history_leaders(
+        records, leaders or MonthlyHeavyHitters(None)
+    )
+    formatted_records = format_records_for_output(records)
+
+    # Extract filter options
+    projects = sorted(set(r.get("project") for r in records if r.get("project")))
+    suppliers = sorted(
+        [
+            str(s)
+            for s in set(
+                r.get("supplier")
+                for r in records
+                if r.get("supplier")
+                and not str(r.get("supplier", "")).startswith("202")
+            )
+        ]
+    )
+    companies = sorted(set(r.get("company") for r in records if r.get("company")))
+    statuses = sorted(set(r.get("status") for r in records if r.get("status")))
+
+    # Add metadata
+    output_data = {
+        "metadata": {
+            "last_update": datetime.now().isoformat(),
+            "source_sheet": source_sheet,
+            "total_records": len(records),
+        },
+        "filters": {
+            "projects": projects,
+            "suppliers": suppliers,
+            "companies": companies,
+            "statuses": statuses,
+        },
+        "records": formatted_records,
+        **sla_data,
+    }
+
+    return output_data
+
+
+def main(argv=None):
+    args = build_arg_parser("Sync SLA dashboard data from Smartsheet").parse_args(argv)
+
     print(f"=== SLA Dashboard Data Sync ===")
     print(f"Started at: {datetime.now()}")
     print(f"Sheet ID: {TRANSPORTATION_SHEET_ID}")
@@ -340,59 +396,41 @@ def main():
     try:
         # Fetch data
         print("\nFetching data from Smartsheet...")
-        sheet_data = get_sheet_data(TRANSPORTATION_SHEET_ID)
-        print(f"Sheet name: {sheet_data.get('name')}")
+        sync = SheetSync.from_args(
+            get_client(SMARTSHEET_TOKEN),
+            TRANSPORTATION_SHEET_ID,
+            "sync_sla",
+            COLUMN_MAPPINGS,
+            [OUTPUT_PATH],
+            args,
+        )
+        rows = sync.fetch()
+        if rows is None:
+            print("Nothing to do.")
+            return True
+        print(f"Sheet name: {sync.sheet_name}")
 
         # Process data
         print("\nProcessing records...")
-        records = process_sheet(sheet_data)
+        records = process_sheet(rows)
         print(f"Total records: {len(records)}")
 
-        # Calculate SLA metrics
+        # Calculate SLA metrics and format records
         print("\nCalculating SLA metrics...")
-        sla_data = calculate_sla_metrics(records)
-
-        # Format records for output
-        print("\nFormatting records...")
-        formatted_records = format_records_for_output(records)
-
-        # Extract filter options
-        projects = sorted(set(r.get("project") for r in records if r.get("project")))
-        suppliers = sorted(
-            [
-                str(s)
-                for s in set(
-                    r.get("supplier")
-                    for r in records
-                    if r.get("supplier")
-                    and not str(r.get("supplier", "")).startswith("202")
-                )
-            ]
+        sketches = MonthlySketches.load(
+            "sync_sla", TRANSPORTATION_SHEET_ID, persist=not args.replay
         )
-        companies = sorted(set(r.get("company") for r in records if r.get("company")))
-        statuses = sorted(set(r.get("status") for r in records if r.get("status")))
-
-        # Add metadata
-        output_data = {
-            "metadata": {
-                "last_update": datetime.now().isoformat(),
-                "source_sheet": sheet_data.get("name"),
-                "total_records": len(records),
-            },
-            "filters": {
-                "projects": projects,
-                "suppliers": suppliers,
-                "companies": companies,
-                "statuses": statuses,
-            },
-            "records": formatted_records,
-            **sla_data,
-        }
+        leaders = MonthlyHeavyHitters.load(
+            "sync_sla", TRANSPORTATION_SHEET_ID, persist=not args.replay
+        )
+        sla_data = build_sla_output(records, sync.sheet_name, sketches, leaders)
 
         # Save to JSON
-        output_path = "data/sla_data.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        output_path = OUTPUT_PATH
+        write_json(output_path, sla_data)
+        sync.commit()
+        sketches.save()
+        leaders.save()
 
         print(f"\n=== Sync Complete ===")
         print(f"Data saved to: {output_path}")
@@ -1,43 +1,32 @@
 #!/usr/bin/env python3
 """
-Sync SLA data from Smartsheet to data.js
+Sync SLA data from Smartsheet to the dashboard data modules
 This script is run by GitHub Actions to keep all dashboards updated
 """
 
 import os
-import json
-import re
-import requests
 from datetime import datetime
-from collections import Counter
-
-def parse_cost(value):
-    """Parse cost value that may contain currency symbols and formatting"""
-    if value is None:
-        return 0
-    if isinstance(value, (int, float)):
-        return float(value)
-    # Remove currency symbols, commas, and whitespace
-    cleaned = re.sub(r'[^\d.]', '', str(value))
-    try:
-        return float(cleaned) if cleaned else 0
-    except ValueError:
-        return 0
-
-def parse_days(value):
-    """Parse days value"""
-    if value is None:
-        return 0
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        return float(value)
-    except:
-        return 0
+import numpy as np
+
+from business_days import on_time_mask, sla_days
+from daily_bins import daily_series
+from number_parser import parse_number
+from percentiles import (
+    MonthlySketches, duration_percentiles, grouped_duration_stats, position_index, select_quantiles
+)
+from publish import write_json, write_modules
+from ranking import MonthlyHeavyHitters, history_leaders
+from record_table import GroupAggregate, RecordTable
+from smartsheet_client import get_client
+from sheet_sync import SheetSync, build_arg_parser
 
 # Configuration
 SMARTSHEET_TOKEN = os.environ.get('SMARTSHEET_TOKEN')
 
+# Per-dataset script modules, loaded by the dashboards through NesmaData.load
+DATA_MODULES_DIR = 'data/modules'
+DATA_MODULES_MANIFEST = os.path.join(DATA_MODULES_DIR, 'manifest.json')
+
 # Sheet IDs
 JOB_ORDERS_SHEET_ID = 2606397737881476  # Job Orders Tracking sheet (SLA)
 
@@ -63,128 +52,153 @@ JOB_ORDERS_COLUMNS = {
     'Comments': 'comments'
 }
 
-def get_sheet_data(sheet_id):
-    """Fetch data from Smartsheet API"""
-    headers = {
-        'Authorization': f'Bearer {SMARTSHEET_TOKEN}',
-        'Content-Type': 'application/json'
+def process_sheet(rows):
+    """Process decoded sheet rows into dashboard format"""
+    # Only add if has job order number
+    return [o for o in rows if o.get('job_order_no')]
+
+def order_status(o):
+    """Done / In Progress / Not Done from the performed flag and completion date"""
+    if o.get('performed') == 'Yes' and o.get('completion_date'):
+        return 'Done'
+    if o.get('performed') == 'Yes':
+        return 'In Progress'
+    return 'Not Done'
+
+def order_month(o):
+    """YYYY-MM of the job order date, or None when the order has no date"""
+    date_str = o.get('job_order_date', '')
+    return str(date_str)[:7] if date_str else None
+
+def build_order_table(orders):
+    """Columnar view of the job orders shared by all KPI calculations"""
+    return (
+        RecordTable(orders)
+        .add_numeric('cost', lambda o: o.get('cost'), parse_number)
+        .add_numeric('completion_days', lambda o: o.get('completion_days'), parse_number)
+        .add_numeric('payment_cycle_days', lambda o: o.get('payment_cycle_days'), parse_number)
+        .add_numeric('invoice_receive_days', lambda o: o.get('invoice_receive_days'), parse_number)
+        .add_categorical('status', order_status)
+        .add_categorical('month', order_month)
+        .add_categorical('supplier', lambda o: o.get('supplier'))
+        .add_categorical('project', lambda o: o.get('project'))
+        .add_categorical('equipment_type', lambda o: o.get('equipment_type'))
+        .add_categorical('requester', lambda o: o.get('requester'))
+        .add_categorical('invoice_applicable', lambda o: o.get('invoice_applicable'))
+        .add_categorical('payment_status', lambda o: o.get('payment_status'))
+        .add_flag('open', lambda o: not o.get('completion_date'))
+    )
+
+def with_unknown(value):
+    """Label a missing cell the way o.get(field, 'Unknown') would"""
+    return 'Unknown' if value is None else value
+
+def average(values):
+    return values.sum() / len(values) if len(values) else 0
+
+# Segments of the fused aggregation: every order, split by invoice applicability
+NO_INVOICE, INVOICE = 0, 1
+
+# Categorical columns the SLA and payments KPIs group by
+GROUPED_COLUMNS = ('status', 'month', 'supplier', 'project', 'equipment_type', 'requester', 'payment_status')
+
+def aggregate_orders(table):
+    """Gather every grouped SLA and payments metric in one pass per column
+
+    Each group column is reduced once into counts and cost sums per
+    (category, invoice segment); the SLA KPIs read both segments and the
+    payments KPIs read the invoice segment only.
+    """
+    invoice = table['invoice_applicable'].isin(['Yes']).astype(np.int64)
+    weights = {'cost': table['cost'].values}
+    groups = {
+        name: GroupAggregate.compute(table[name], invoice, 2, weights)
+        for name in GROUPED_COLUMNS
     }
+    return {'table': table, 'invoice': invoice.astype(bool), 'groups': groups}
+
+def monthly_rows(view, count_name):
+    """Monthly trend rows sorted by YYYY-MM"""
+    counts = view.tally('count')
+    amounts = view.tally('cost')
+    return [
+        {'month': month, count_name: counts[month], 'amount': amounts[month]}
+        for month in sorted(counts)
+    ]
 
-    url = f'https://api.smartsheet.com/2.0/sheets/{sheet_id}'
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
-
-def process_sheet(sheet_data, column_mappings):
-    """Process sheet data into dashboard format"""
-    # Build column mapping
-    col_map = {}
-    for col in sheet_data.get('columns', []):
-        if col['title'] in column_mappings:
-            col_map[col['id']] = column_mappings[col['title']]
-
-    # Extract orders
-    orders = []
-    for row in sheet_data.get('rows', []):
-        order = {}
-
-        for cell in row.get('cells', []):
-            col_id = cell.get('columnId')
-            value = cell.get('value') or cell.get('displayValue')
-
-            if col_id in col_map and value is not None:
-                order[col_map[col_id]] = value
-
-        # Only add if has job order number
-        if order.get('job_order_no'):
-            orders.append(order)
-
-    return orders
-
-def calculate_sla_kpis(orders):
-    """Calculate SLA KPIs from orders data"""
-    total = len(orders)
+def calculate_sla_kpis(aggregates):
+    """Calculate SLA KPIs from the fused order aggregates"""
+    table, groups = aggregates['table'], aggregates['groups']
+    total = len(table)
 
     # Count statuses
-    done = sum(1 for o in orders if o.get('performed') == 'Yes' and o.get('completion_date'))
-    in_progress = sum(1 for o in orders if o.get('performed') == 'Yes' and not o.get('completion_date'))
+    status = groups['status'].view().tally()
+    done = status.get('Done', 0)
+    in_progress = status.get('In Progress', 0)
     not_done = total - done - in_progress
 
     # Calculate completion times
-    completion_times = [parse_days(o.get('completion_days')) for o in orders if o.get('completion_days')]
-
-    avg_duration = sum(completion_times) / len(completion_times) if completion_times else 0
-    sorted_times = sorted(completion_times)
-    median_duration = sorted_times[len(sorted_times)//2] if sorted_times else 0
-    p90_duration = sorted_times[int(len(sorted_times)*0.9)] if sorted_times else 0
-
-    # On-time rate (completed within 3 days)
-    on_time = sum(1 for t in completion_times if t <= 3)
-    on_time_rate = (on_time / len(completion_times) * 100) if completion_times else 0
+    days = table['completion_days']
+    completion_times = days.valid()
+
+    avg_duration = average(completion_times)
+    median_duration, p90_duration = (
+        select_quantiles(completion_times, (0.5, 0.9), position_index)
+        if len(completion_times) else (0, 0)
+    )
+
+    # On-time rate (completed within 3 business days of the job order date;
+    # orders whose dates cannot be used keep their recorded completion days)
+    within_sla = days.present & on_time_mask(sla_days(
+        [o.get('job_order_date') for o in table.records],
+        [o.get('completion_date') for o in table.records],
+        days.values
+    ))
+    on_time = np.count_nonzero(within_sla)
+    on_time_rate = (on_time / len(completion_times) * 100) if len(completion_times) else 0
 
     # Total cost
-    total_amount = sum(parse_cost(o.get('cost')) for o in orders if o.get('cost'))
+    total_amount = groups['status'].sums['cost'].sum()
 
     # Open orders (not completed)
-    open_orders = sum(1 for o in orders if not o.get('completion_date'))
+    open_orders = int(np.count_nonzero(table['open']))
 
-    # Suppliers distribution
-    suppliers = Counter(o.get('supplier', 'Unknown') for o in orders if o.get('supplier'))
-    top_suppliers = dict(suppliers.most_common(10))
-
-    # Suppliers by cost
-    supplier_costs = {}
-    for o in orders:
-        sup = o.get('supplier', 'Unknown')
-        if sup:
-            supplier_costs[sup] = supplier_costs.get(sup, 0) + parse_cost(o.get('cost'))
-    top_supplier_costs = dict(sorted(supplier_costs.items(), key=lambda x: x[1], reverse=True)[:10])
-
-    # Projects distribution by count
-    projects_count = Counter(o.get('project', 'Unknown') for o in orders if o.get('project'))
-    top_projects_count = dict(projects_count.most_common(20))
-
-    # Projects distribution by cost
-    projects = {}
-    for o in orders:
-        proj = o.get('project', 'Unknown')
-        cost = parse_cost(o.get('cost'))
-        projects[proj] = projects.get(proj, 0) + cost
-    top_projects = dict(sorted(projects.items(), key=lambda x: x[1], reverse=True)[:20])
+    # Suppliers by count, and by cost with orders without a supplier as Unknown
+    supplier = groups['supplier']
+    top_suppliers = supplier.view(keep=bool).ranked('count', 10)
+    top_supplier_costs = supplier.view(keep=bool, relabel=with_unknown).ranked('cost', 10)
 
-    # Equipment distribution by count
-    equipment = Counter(o.get('equipment_type', 'Unknown') for o in orders if o.get('equipment_type'))
-    equipment_count = dict(equipment.most_common(15))
+    # Projects by count, and by cost with orders without a project as Unknown
+    project = groups['project']
+    top_projects_count = project.view(keep=bool).ranked('count', 20)
+    top_projects = project.view(relabel=with_unknown).ranked('cost', 20)
 
-    # Equipment distribution by cost
-    equipment_costs = {}
-    for o in orders:
-        eq = o.get('equipment_type', 'Unknown')
-        if eq:
-            equipment_costs[eq] = equipment_costs.get(eq, 0) + parse_cost(o.get('cost'))
-    equipment_cost = dict(sorted(equipment_costs.items(), key=lambda x: x[1], reverse=True)[:15])
+    # Equipment by count, and by cost with orders without equipment as Unknown
+    equipment = groups['equipment_type']
+    equipment_count = equipment.view(keep=bool).ranked('count', 15)
+    equipment_cost = equipment.view(keep=bool, relabel=with_unknown).ranked('cost', 15)
 
     # Monthly trend
-    monthly = {}
-    for o in orders:
-        date_str = o.get('job_order_date', '')
-        if date_str:
-            try:
-                if isinstance(date_str, str):
-                    month = date_str[:7]  # YYYY-MM
-                else:
-                    month = str(date_str)[:7]
-                if month not in monthly:
-                    monthly[month] = {'orders': 0, 'amount': 0}
-                monthly[month]['orders'] += 1
-                monthly[month]['amount'] += parse_cost(o.get('cost'))
-            except:
-                pass
-
-    monthly_trend = [
-        {'month': k, 'orders': v['orders'], 'amount': v['amount']}
-        for k, v in sorted(monthly.items())
-    ]
+    monthly_trend = monthly_rows(groups['month'].view(keep=bool), 'orders')
+
+    # Completion time distribution per supplier, project and equipment
+    def duration_stats(name):
+        column = table[name]
+        mask = days.present & column.truthy()
+        return grouped_duration_stats(
+            column.codes[mask], column.categories, days.values[mask], on_time=within_sla[mask]
+        )
+
+    # Daily bins as prefix sums, so any date range is two lookups
+    daily = daily_series(
+        [o.get('job_order_date') for o in table.records],
+        {
+            'orders': np.ones(total, dtype=np.int64),
+            'amount': table['cost'].values,
+            'done': table['status'].isin(['Done']),
+            'on_time': within_sla,
+        },
+    )
 
     return {
         'summary': {
@@ -192,9 +206,9 @@ def calculate_sla_kpis(orders):
             'done_orders': done,
             'in_progress_orders': in_progress,
             'not_done_orders': not_done,
-            'on_time_rate': round(on_time_rate, 2),
-            'total_amount': round(total_amount, 2),
-            'avg_duration': round(avg_duration, 2),
+            'on_time_rate': round(float(on_time_rate), 2),
+            'total_amount': round(float(total_amount), 2),
+            'avg_duration': round(float(avg_duration), 2),
             'median_duration': median_duration,
             'p90_duration': p90_duration,
             'open_orders': open_orders,
@@ -213,72 +227,69 @@ def calculate_sla_kpis(orders):
         'equipment_distribution': equipment_count,
         'equipment_count': equipment_count,
         'equipment_cost': equipment_cost,
-        'monthly_trend': monthly_trend
+        'monthly_trend': monthly_trend,
+        'sla_by_supplier': duration_stats('supplier'),
+        'sla_by_project': duration_stats('project'),
+        'sla_by_equipment': duration_stats('equipment_type'),
+        'daily': daily
     }
 
-def calculate_payments_kpis(orders):
-    """Calculate Payments KPIs from orders data"""
-    # Filter orders with invoice applicable
-    invoice_orders = [o for o in orders if o.get('invoice_applicable') == 'Yes']
-    total = len(invoice_orders)
-
-    # Payment status counts
-    paid = sum(1 for o in invoice_orders if o.get('payment_status') == 'Paid')
-    pending = sum(1 for o in invoice_orders if o.get('payment_status') in ['Pending Approval', 'Pending', 'Under Review'])
+def completion_percentiles(table, sketches):
+    """Completion time percentiles overall, per job order month and over trailing months"""
+    days = table['completion_days']
+    month = table['month']
+    months = np.array(month.categories, dtype=object)[month.codes]
+    return duration_percentiles(days.values[days.present], months[days.present], sketches)
+
+def order_history_leaders(table, leaders):
+    """All-history supplier, project and equipment leaders by orders and cost"""
+    def labels(name):
+        column = table[name]
+        return [column.categories[c] for c in column.codes.tolist()]
+
+    cost = table['cost'].values
+    supplier, project, equipment = labels('supplier'), labels('project'), labels('equipment_type')
+    return history_leaders(leaders, labels('month'), {
+        'suppliers': (supplier, None, 10),
+        'suppliers_by_cost': (supplier, cost, 10),
+        'projects': (project, None, 20),
+        'projects_by_cost': (project, cost, 20),
+        'equipment': (equipment, None, 15),
+        'equipment_by_cost': (equipment, cost, 15),
+    })
+
+def calculate_payments_kpis(aggregates):
+    """Calculate Payments KPIs from the invoice segment of the fused order aggregates"""
+    table, groups, invoice = aggregates['table'], aggregates['groups'], aggregates['invoice']
+
+    # Payment status counts over orders with invoice applicable
+    payment_status = groups['payment_status'].view(INVOICE).tally()
+    total = sum(payment_status.values())
+    paid = payment_status.get('Paid', 0)
+    pending = sum(payment_status.get(s, 0) for s in ['Pending Approval', 'Pending', 'Under Review'])
     other = total - paid - pending
 
     # Total amount
-    total_amount = sum(parse_cost(o.get('cost')) for o in invoice_orders if o.get('cost'))
+    total_amount = groups['payment_status'].sums['cost'][:, INVOICE].sum()
 
     # Calculate averages
-    completion_days = [parse_days(o.get('completion_days')) for o in invoice_orders if o.get('completion_days')]
-    avg_completion = sum(completion_days) / len(completion_days) if completion_days else 0
-
-    payment_cycles = [parse_days(o.get('payment_cycle_days')) for o in invoice_orders if o.get('payment_cycle_days')]
-    avg_payment_cycle = sum(payment_cycles) / len(payment_cycles) if payment_cycles else 0
-
-    invoice_receive = [parse_days(o.get('invoice_receive_days')) for o in invoice_orders if o.get('invoice_receive_days')]
-    avg_invoice_receive = sum(invoice_receive) / len(invoice_receive) if invoice_receive else 0
+    avg_completion = average(table['completion_days'].valid(invoice))
+    avg_payment_cycle = average(table['payment_cycle_days'].valid(invoice))
+    avg_invoice_receive = average(table['invoice_receive_days'].valid(invoice))
 
     payment_rate = (paid / total * 100) if total else 0
 
-    # Suppliers count
-    suppliers = Counter(o.get('supplier', 'Unknown') for o in invoice_orders if o.get('supplier'))
-    top_suppliers = dict(suppliers.most_common(15))
-
-    # Projects count
-    projects = Counter(o.get('project', 'Unknown') for o in invoice_orders if o.get('project'))
-    top_projects = dict(projects.most_common(20))
-
-    # Equipment requested
-    equipment = Counter(o.get('equipment_type', 'Unknown') for o in invoice_orders if o.get('equipment_type'))
-    equipment_requested = dict(equipment.most_common(15))
+    # Suppliers, projects, equipment and requesters by invoice count
+    def top(name, limit):
+        return groups[name].view(INVOICE, keep=bool).ranked('count', limit)
 
-    # Requesters
-    requesters = Counter(o.get('requester', 'Unknown') for o in invoice_orders if o.get('requester'))
-    top_requesters = dict(requesters.most_common(10))
+    top_suppliers = top('supplier', 15)
+    top_projects = top('project', 20)
+    equipment_requested = top('equipment_type', 15)
+    top_requesters = top('requester', 10)
 
     # Monthly trend for invoices
-    monthly = {}
-    for o in invoice_orders:
-        date_str = o.get('job_order_date', '')
-        if date_str:
-            try:
-                if isinstance(date_str, str):
-                    month = date_str[:7]
-                else:
-                    month = str(date_str)[:7]
-                if month not in monthly:
-                    monthly[month] = {'invoices': 0, 'amount': 0}
-                monthly[month]['invoices'] += 1
-                monthly[month]['amount'] += parse_cost(o.get('cost'))
-            except:
-                pass
-
-    monthly_trend = [
-        {'month': k, 'invoices': v['invoices'], 'amount': v['amount']}
-        for k, v in sorted(monthly.items())
-    ]
+    monthly_trend = monthly_rows(groups['month'].view(INVOICE, keep=bool), 'invoices')
 
     return {
         'summary': {
@@ -286,10 +297,10 @@ def calculate_payments_kpis(orders):
             'paid_invoices': paid,
             'pending_invoices': pending,
             'other_status': other,
-            'total_amount': round(total_amount, 2),
-            'avg_completion_days': round(avg_completion, 1),
-            'avg_payment_cycle': round(avg_payment_cycle, 1),
-            'avg_invoice_receive': round(avg_invoice_receive, 1),
+            'total_amount': round(float(total_amount), 2),
+            'avg_completion_days': round(float(avg_completion), 1),
+            'avg_payment_cycle': round(float(avg_payment_cycle), 1),
+            'avg_invoice_receive': round(float(avg_invoice_receive), 1),
             'payment_rate': round(payment_rate, 1),
             'last_update': datetime.utcnow().strftime('%Y-%m-%d')
         },
@@ -323,9 +334,9 @@ def prepare_transportation_full_data(orders):
             'supplier': o.get('supplier', 'Unknown'),
             'equipment_1': o.get('equipment_type', 'Unknown'),
             'requester': o.get('requester', ''),
-            'total_amount': parse_cost(o.get('cost')),
+            'total_amount': parse_number(o.get('cost'), 0),
             'status': status,
-            'duration': parse_days(o.get('completion_days')),
+            'duration': parse_number(o.get('completion_days'), 0),
             'rent_type': 'Daily'
         }
         records.append(record)
@@ -352,11 +363,11 @@ def prepare_payments_full_data(orders):
             'supplier': o.get('supplier', 'Unknown'),
             'equipment_1': o.get('equipment_type', 'Unknown'),
             'requester': o.get('requester', ''),
-            'total_amount': parse_cost(o.get('cost')),
+            'total_amount': parse_number(o.get('cost'), 0),
             'payment_status': o.get('payment_status', 'Unknown'),
             'invoice_received': o.get('invoice_received', 'No'),
-            'invoice_receive_days': parse_days(o.get('invoice_receive_days')),
-            'payment_cycle_days': parse_days(o.get('payment_cycle_days'))
+            'invoice_receive_days': parse_number(o.get('invoice_receive_days'), 0),
+            'payment_cycle_days': parse_number(o.get('payment_cycle_days'), 0)
         }
         records.append(record)
 
@@ -370,65 +381,81 @@ def prepare_payments_full_data(orders):
         'records': records
     }
 
-def write_data_js(sla_data, transportation_data, payments_data, orders):
-    """Write all data to data.js and JSON files"""
-    js_content = f'''// NESMA Supply Chain Management - Dashboard Data
-// Auto-synced from Smartsheet
-// Last updated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
-
-// SLA Dashboard Data
-const SLA_DATA = {json.dumps(sla_data, ensure_ascii=False, indent=2)};
-
-// Transportation Dashboard Data
-const TRANSPORTATION_DATA = {json.dumps(transportation_data, ensure_ascii=False, indent=2)};
-
-// Payments Dashboard Data
-const PAYMENTS_DATA = {json.dumps(payments_data, ensure_ascii=False, indent=2)};
-
-// Raw Orders Data (last 200)
-const ORDERS_DATA = {json.dumps(orders[:200], ensure_ascii=False, indent=2)};
-'''
-
-    with open('data.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
+def write_data_modules(sla_data, transportation_data, payments_data, orders):
+    """Write the dashboard data modules and JSON files"""
+    header = (
+        '// NESMA Supply Chain Management - Dashboard Data\n'
+        '// Auto-synced from Smartsheet\n'
+        f"// Last updated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+    )
+    manifest = write_modules(DATA_MODULES_DIR, {
+        'sla': ('SLA_DATA', sla_data),
+        'transportation': ('TRANSPORTATION_DATA', transportation_data),
+        'payments': ('PAYMENTS_DATA', payments_data),
+        'orders': ('ORDERS_DATA', orders[:200]),  # raw orders, last 200
+    }, header)
 
     transportation_full = prepare_transportation_full_data(orders)
-    with open('transportation_full_data.json', 'w', encoding='utf-8') as f:
-        json.dump(transportation_full, f, ensure_ascii=False, indent=2)
+    write_json('transportation_full_data.json', transportation_full, columns=['records'])
 
     payments_full = prepare_payments_full_data(orders)
-    with open('payments_full_data.json', 'w', encoding='utf-8') as f:
-        json.dump(payments_full, f, ensure_ascii=False, indent=2)
+    write_json('payments_full_data.json', payments_full, columns=['records'])
 
-    print(f"Written {len(orders)} orders to data.js")
+    sizes = ', '.join(f"{name} {m['bytes']:,}" for name, m in manifest['modules'].items())
+    print(f"Written data modules to {DATA_MODULES_DIR} (bytes: {sizes})")
     print(f"Written {len(transportation_full['records'])} records to transportation_full_data.json")
     print(f"Written {len(payments_full['records'])} records to payments_full_data.json")
 
-def main():
-    if not SMARTSHEET_TOKEN:
+def main(argv=None):
+    args = build_arg_parser('Sync job orders data from Smartsheet to the dashboard data modules').parse_args(argv)
+
+    if not SMARTSHEET_TOKEN and not args.replay:
         print("Error: SMARTSHEET_TOKEN environment variable not set")
         return 1
 
     print("Fetching data from Smartsheet...")
-    sheet_data = get_sheet_data(JOB_ORDERS_SHEET_ID)
+    sync = SheetSync.from_args(
+        get_client(SMARTSHEET_TOKEN),
+        JOB_ORDERS_SHEET_ID,
+        'sync_smartsheet',
+        JOB_ORDERS_COLUMNS,
+        [DATA_MODULES_MANIFEST, 'transportation_full_data.json', 'payments_full_data.json'],
+        args
+    )
+    rows = sync.fetch()
+    if rows is None:
+        print("Nothing to do.")
+        return 0
 
     print("Processing orders data...")
-    orders = process_sheet(sheet_data, JOB_ORDERS_COLUMNS)
+    orders = process_sheet(rows)
 
     print(f"Found {len(orders)} orders")
 
+    # Build the columnar view and aggregate it once for every KPI calculation
+    table = build_order_table(orders)
+
+    aggregates = aggregate_orders(table)
+
     print("Calculating SLA KPIs...")
-    sla_data = calculate_sla_kpis(orders)
+    sla_data = calculate_sla_kpis(aggregates)
+    sketches = MonthlySketches.load('sync_smartsheet', JOB_ORDERS_SHEET_ID, persist=not args.replay)
+    sla_data['duration_percentiles'] = completion_percentiles(table, sketches)
+    leaders = MonthlyHeavyHitters.load('sync_smartsheet', JOB_ORDERS_SHEET_ID, persist=not args.replay)
+    sla_data['all_time_leaders'] = order_history_leaders(table, leaders)
 
     print("Calculating Transportation KPIs...")
     # Transportation uses same data as SLA
     transportation_data = sla_data.copy()
 
     print("Calculating Payments KPIs...")
-    payments_data = calculate_payments_kpis(orders)
+    payments_data = calculate_payments_kpis(aggregates)
 
-    print("Writing data.js...")
-    write_data_js(sla_data, transportation_data, payments_data, orders)
+    print("Writing data modules...")
+    write_data_modules(sla_data, transportation_data, payments_data, orders)
+    sync.commit()
+    sketches.save()
+    leaders.save()
 
     print("Sync complete!")
     print(f"  - Total Orders: {sla_data['summary']['total_orders']}")
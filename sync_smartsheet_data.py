@@ -3,10 +3,15 @@
 Sync Smartsheet PR to PO Report data to JSON for Procurement Dashboard
 """
 
-import json
 import os
 from datetime import datetime
 import smartsheet
+import numpy as np
+
+from period_cube import pr_status_cube
+from publish import write_json
+from record_table import GroupBy, RecordTable
+from row_decoder import RowDecoder
 
 # Smartsheet API setup
 SMARTSHEET_ACCESS_TOKEN = os.environ.get('SMARTSHEET_ACCESS_TOKEN')
@@ -20,19 +25,10 @@ def get_pr_data_from_sheet(client, sheet_id):
     """Fetch PR to PO data from Smartsheet"""
     sheet = client.Sheets.get_sheet(sheet_id)
 
-    # Create column name mapping
-    column_map = {col.title: col.id for col in sheet.columns}
-
-    prs = []
-    for row in sheet.rows:
-        pr = {}
-        for cell in row.cells:
-            col_name = next((name for name, id in column_map.items() if id == cell.column_id), None)
-            if col_name:
-                pr[col_name] = cell.value
-        prs.append(pr)
+    # Resolve column id -> slot once, then decode each row in a single pass
+    decoder = RowDecoder.for_sdk_columns(sheet.columns)
 
-    return prs
+    return [decoder.as_dict(decoder.decode_sdk(row)) for row in sheet.rows]
 
 def process_pr_data(raw_prs):
     """Process raw PR data into dashboard format"""
@@ -70,45 +66,44 @@ def process_pr_data(raw_prs):
 
     return all_prs
 
+def pr_date(pr):
+    return pr.get('submission_date') or pr.get('approved_date')
+
+def month_index(pr):
+    """0-indexed month of the PR's date, or None when it cannot be read"""
+    try:
+        month = int(pr_date(pr).split('-')[1]) - 1
+    except:
+        return None
+    return month if 0 <= month < 12 else None
+
 def calculate_statistics(all_prs):
     """Calculate KPIs and statistics from PR data"""
+    table = (
+        RecordTable(all_prs)
+        .add_categorical('status', lambda pr: pr.get('status', 'UNKNOWN'))
+        .add_categorical('month', month_index)
+        .add_flag('in_2025', lambda pr: pr_date(pr) and '2025' in str(pr_date(pr)))
+    )
+    status, month, in_2025 = table['status'], table['month'], table['in_2025']
 
     # Status counts
-    status_breakdown = {}
-    for pr in all_prs:
-        status = pr.get('status', 'UNKNOWN')
-        if status:
-            status_breakdown[status] = status_breakdown.get(status, 0) + 1
+    by_status = GroupBy([status], status.truthy())
+    status_breakdown = by_status.tally(by_status.count())
 
     # Year 2025 data
-    prs_2025 = []
-    for pr in all_prs:
-        date_str = pr.get('submission_date') or pr.get('approved_date')
-        if date_str and '2025' in str(date_str):
-            prs_2025.append(pr)
-
-    approved_2025 = len([p for p in prs_2025 if p.get('status') == 'APPROVED'])
-    returned_2025 = len([p for p in prs_2025 if p.get('status') == 'RETURNED'])
-
-    # Monthly breakdown for 2025
-    monthly_approved = [0] * 12
-    monthly_returned = [0] * 12
-    monthly_rejected = [0] * 12
-
-    for pr in prs_2025:
-        date_str = pr.get('submission_date') or pr.get('approved_date')
-        if date_str:
-            try:
-                month = int(date_str.split('-')[1]) - 1  # 0-indexed
-                if 0 <= month < 12:
-                    if pr.get('status') == 'APPROVED':
-                        monthly_approved[month] += 1
-                    elif pr.get('status') == 'RETURNED':
-                        monthly_returned[month] += 1
-                    elif pr.get('status') == 'REJECTED':
-                        monthly_rejected[month] += 1
-            except:
-                pass
+    approved_2025 = int(np.count_nonzero(in_2025 & status.isin(['APPROVED'])))
+    returned_2025 = int(np.count_nonzero(in_2025 & status.isin(['RETURNED'])))
+
+    # Monthly breakdown for 2025, grouped by (status, month) in one pass
+    monthly = {'APPROVED': [0] * 12, 'RETURNED': [0] * 12, 'REJECTED': [0] * 12}
+    by_month = GroupBy([status, month], in_2025 & month.where(lambda m: m is not None))
+    for (pr_status, month_no), count in zip(by_month.labels(), by_month.count().tolist()):
+        if pr_status in monthly:
+            monthly[pr_status][month_no] = count
+    monthly_approved = monthly['APPROVED']
+    monthly_returned = monthly['RETURNED']
+    monthly_rejected = monthly['REJECTED']
 
     # Calculate return rates
     monthly_return_rate = []
@@ -171,7 +166,8 @@ def calculate_statistics(all_prs):
             'projects': projects,
             'vendors': vendors,
             'years': years
-        }
+        },
+        'status_cube': pr_status_cube(all_prs)
     }
 
 def main():
@@ -204,8 +200,7 @@ def main():
 
         # Save to JSON
         output_path = 'data/pr_data.json'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        write_json(output_path, output_data, columns=['all_prs'])
 
         print(f"Data saved to {output_path}")
         print(f"Summary: {stats['summary']}")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Persistent sync state shared by the Smartsheet sync scripts
+Records the sheet version each consumer last synced successfully
+"""
+
+import os
+import json
+
+SYNC_CACHE_DIR = os.environ.get("SYNC_CACHE_DIR", ".sync_cache")
+STATE_FILE = os.path.join(SYNC_CACHE_DIR, "state.json")
+
+
+def load_state(path=STATE_FILE):
+    """Load the state file, returning an empty state if missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state, path=STATE_FILE):
+    """Write the state file atomically"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def get_sheet_state(state, consumer, sheet_id):
+    """Return what a consumer recorded for a sheet on its last successful run"""
+    return state.get(consumer, {}).get(str(sheet_id), {})
+
+
+def set_sheet_state(state, consumer, sheet_id, **values):
+    """Update what a consumer recorded for a sheet"""
+    entry = state.setdefault(consumer, {}).setdefault(str(sheet_id), {})
+    entry.update(values)
+    return entry
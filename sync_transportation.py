@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Sync SLA, Transportation & Payments data from one Transportation_Tracking fetch
+Downloads and decodes the sheet once, then fans the records out to the
+SLA and logistics builders in a single process
+"""
+
+from datetime import datetime
+
+from percentiles import MonthlySketches
+from publish import write_json
+from ranking import MonthlyHeavyHitters
+from smartsheet_client import get_client
+from sheet_sync import SheetSync, build_arg_parser
+from transportation_sheet import (
+    SMARTSHEET_TOKEN,
+    TRANSPORTATION_SHEET_ID,
+    COLUMN_MAPPINGS,
+    process_sheet,
+)
+from sync_sla import OUTPUT_PATH as SLA_OUTPUT, build_sla_output
+from sync_logistics import (
+    TRANSPORTATION_OUTPUT,
+    PAYMENTS_OUTPUT,
+    prepare_transportation_data,
+    prepare_payments_data,
+)
+
+
+def main(argv=None):
+    args = build_arg_parser(
+        "Sync SLA, transportation and payments data from one sheet fetch"
+    ).parse_args(argv)
+
+    print(f"=== Transportation Pipeline Sync ===")
+    print(f"Started at: {datetime.now()}")
+    print(f"Sheet ID: {TRANSPORTATION_SHEET_ID}")
+
+    try:
+        # Fetch data once
+        print("\nFetching data from Smartsheet...")
+        sync = SheetSync.from_args(
+            get_client(SMARTSHEET_TOKEN),
+            TRANSPORTATION_SHEET_ID,
+            "sync_transportation",
+            COLUMN_MAPPINGS,
+            [SLA_OUTPUT, TRANSPORTATION_OUTPUT, PAYMENTS_OUTPUT],
+            args,
+        )
+        rows = sync.fetch()
+        if rows is None:
+            print("Nothing to do.")
+            return True
+        print(f"Sheet name: {sync.sheet_name}")
+
+        # Decode once
+        print("\nProcessing records...")
+        records = process_sheet(rows)
+        print(f"Total records: {len(records)}")
+
+        # SLA and logistics normalize status differently, so the SLA
+        # builder gets its own shallow copies of the shared records
+        print("\nCalculating SLA metrics...")
+        sketches = MonthlySketches.load(
+            "sync_transportation", TRANSPORTATION_SHEET_ID, persist=not args.replay
+        )
+        leaders = MonthlyHeavyHitters.load(
+            "sync_transportation", TRANSPORTATION_SHEET_ID, persist=not args.replay
+        )
+        sla_data = build_sla_output(
+            [dict(r) for r in records], sync.sheet_name, sketches, leaders
+        )
+        write_json(SLA_OUTPUT, sla_data)
+        print(f"Saved {SLA_OUTPUT}")
+
+        print("\nPreparing transportation data...")
+        transportation_data = prepare_transportation_data(records)
+        write_json(TRANSPORTATION_OUTPUT, transportation_data, columns=["records"])
+        print(
+            f"Saved {TRANSPORTATION_OUTPUT} ({transportation_data['metadata']['total_records']} records)"
+        )
+
+        print("\nPreparing payments data...")
+        payments_data = prepare_payments_data(records)
+        write_json(PAYMENTS_OUTPUT, payments_data, columns=["records"])
+        print(
+            f"Saved {PAYMENTS_OUTPUT} ({payments_data['metadata']['total_records']} records)"
+        )
+
+        sync.commit()
+        sketches.save()
+        leaders.save()
+
+        print(f"\n=== Sync Complete ===")
+        print(f"  - Total Orders: {sla_data['summary']['total_orders']}")
+        print(f"  - On-Time Rate: {sla_data['summary']['on_time_rate']}%")
+        print(f"  - Total Amount: {sla_data['summary']['total_amount']:,.2f} SAR")
+        print(f"  - Transportation Records: {transportation_data['metadata']['total_records']}")
+        print(f"  - Payments Records: {payments_data['metadata']['total_records']}")
+
+        return True
+
+    except Exception as e:
+        print(f"\nError: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Transportation_Tracking sheet definition shared by the SLA and logistics syncs
+Column mappings, record filtering and the total_amount derivation live here
+so the sheet is decoded the same way by every consumer
+"""
+
+import os
+
+from number_parser import parse_number
+
+# Configuration
+SMARTSHEET_TOKEN = os.environ.get(
+    "SMARTSHEET_TOKEN", "r6WG6zpLw2TR84F54tZCCzMtqjkTlTbuWDiws"
+)
+TRANSPORTATION_SHEET_ID = 7876932495429508  # Transportation_Tracking
+
+# Column mappings
+COLUMN_MAPPINGS = {
+    "#": "serial_no",
+    "Job Order NO.": "job_order_no",
+    "Company": "company",
+    "Project Name": "project",
+    "Rqstr Name": "requester",
+    "Rqst Date": "request_date",
+    "supplier": "supplier",
+    "EQUIPMENT 1": "equipment_1",
+    "price1": "price_1",
+    "EQUIPMENT 2": "equipment_2",
+    "Price2": "price_2",
+    "EQUIPMENT 3": "equipment_3",
+    "Price3": "price_3",
+    "EQUIPMENT 4": "equipment_4",
+    "Price4": "price_4",
+    "EQUIPMENT 5": "equipment_5",
+    "price5": "price_5",
+    "Type of Rent": "rent_type",
+    "Total Amount": "total_amount",
+    "Act Date2": "actual_date",
+    "Duration": "duration",
+    "Status": "status",
+    "Pending with": "pending_with",
+    "Remarks": "remarks",
+}
+
+
+def process_sheet(rows):
+    """Process decoded sheet rows into records"""
+    # Only keep rows with a job order number or project
+    records = [r for r in rows if r.get("job_order_no") or r.get("project")]
+
+    # Calculate total amount for each record
+    for r in records:
+        if not r.get("total_amount"):
+            total = sum(
+                [
+                    parse_number(r.get("price_1")),
+                    parse_number(r.get("price_2")),
+                    parse_number(r.get("price_3")),
+                    parse_number(r.get("price_4")),
+                    parse_number(r.get("price_5")),
+                ]
+            )
+            r["total_amount"] = total
+        else:
+            r["total_amount"] = parse_number(r.get("total_amount"))
+
+    return records